@@ -365,7 +365,7 @@ def serialize_graham_analysis(ticker: str, analysis_data: dict[str, Any]) -> str
         "margin_of_safety": f"{margin_of_safety:.1%}" if margin_of_safety is not None else "N/A",
     }
 
-    return json.dumps(json_ready_data, indent=2)
+    return json.dumps(json_ready_data, separators=(",", ":"))
 
 
 def generate_graham_output(
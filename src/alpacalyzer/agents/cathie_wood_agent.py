@@ -419,7 +419,7 @@ def serialize_cathie_wood_analysis(ticker: str, analysis_data: dict[str, Any]) -
         "margin_of_safety": f"{margin_of_safety:.1%}" if margin_of_safety is not None else "N/A",
     }
 
-    return json.dumps(json_ready_data, indent=2)
+    return json.dumps(json_ready_data, separators=(",", ":"))
 
 
 def generate_cathie_wood_output(
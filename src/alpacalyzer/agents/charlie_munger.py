@@ -645,7 +645,7 @@ def serialize_munger_analysis(ticker: str, analysis_data: dict[str, Any]) -> str
         "intrinsic_value_optimistic": f"${intrinsic_value_range.get('optimistic', 0):,.2f}" if intrinsic_value_range.get("optimistic") else "N/A",
     }
 
-    return json.dumps(json_ready_data, indent=2)
+    return json.dumps(json_ready_data, separators=(",", ":"))
 
 
 def generate_munger_output(
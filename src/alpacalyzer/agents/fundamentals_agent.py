@@ -37,7 +37,7 @@ def fundamentals_agent(state: AgentState):
 
         # Pull the most recent financial metrics
         metrics = financial_metrics[0]
-        logger.debug(f"Metrics for {ticker}: {metrics}")
+        logger.debug("Metrics for %s: %s", ticker, metrics)
 
         # Initialize signals list for different fundamental aspects
         signals = []
@@ -92,7 +92,7 @@ def serialize_trading_signals(signals: TradingSignals) -> str:
         "momentum": f"{signals['momentum']:.2f}%",
     }
 
-    return json.dumps(json_ready_signals, indent=2)
+    return json.dumps(json_ready_signals, separators=(",", ":"))
 
 
 def get_quant_analysis(
@@ -80,7 +80,7 @@ def sentiment_agent(state: AgentState):
             }
             continue
 
-        logger.debug(f"Sentiment signals for {ticker}: {sentiment_signals}")
+        logger.debug("Sentiment signals for %s: %s", ticker, sentiment_signals)
 
         # Calculate weighted signal counts
         insider_weight = 0.3
@@ -146,7 +146,7 @@ def calculate_sentiment_signals(news_items: list[dict[str, Any]]) -> SentimentAn
     human_template = "Here are the news items:\n{news_items}\n\n"
 
     # Prepare dynamic input values (assumes these variables are defined)
-    news_items_str = json.dumps(news_items, indent=2)
+    news_items_str = json.dumps(news_items, separators=(",", ":"))
 
     # Format the human message using the template
     human_message = {
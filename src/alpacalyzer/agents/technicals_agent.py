@@ -8,9 +8,12 @@ import pandas as pd
 from langchain_core.messages import HumanMessage
 
 from alpacalyzer.graph.state import AgentState, show_agent_reasoning
-from alpacalyzer.trading.alpaca_client import get_stock_bars
+from alpacalyzer.trading.alpaca_client import get_market_status, get_stock_bars, prefetch_stock_bars
+from alpacalyzer.utils.logger import get_logger
 from alpacalyzer.utils.progress import progress
 
+logger = get_logger(__name__)
+
 
 ##### Technical Analyst #####
 def technical_analyst_agent(state: AgentState):
@@ -28,12 +31,21 @@ def technical_analyst_agent(state: AgentState):
 
     # Initialize analysis for each ticker
     technical_analysis = {}
+    # Look the market session up once for all tickers; on failure get_stock_bars retries per ticker
+    try:
+        market_status: str | None = get_market_status()
+    except Exception as e:
+        logger.warning(f"market status lookup failed, skipping bar prefetch | error={e}", exc_info=True)
+        market_status = None
+    else:
+        # Seed the bar cache with one batched request instead of one request per ticker
+        prefetch_stock_bars(tickers, "day", market_status)
 
     for ticker in tickers:
         progress.update_status("technical_analyst_agent", ticker, "Analyzing price data")
 
         # Convert prices to a DataFrame
-        prices_df = get_stock_bars(symbol=ticker, request_type="day")
+        prices_df = get_stock_bars(symbol=ticker, request_type="day", market_status=market_status)
 
         if prices_df is None:
             progress.update_status("technical_analyst_agent", ticker, "Failed: No price data found")
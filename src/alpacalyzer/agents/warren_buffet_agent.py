@@ -317,7 +317,7 @@ def serialize_buffett_analysis(ticker: str, analysis_data: dict[str, Any]) -> st
         "owner_earnings": f"${owner_earnings:,.2f}" if owner_earnings else "N/A",
     }
 
-    return json.dumps(json_ready_data, indent=2)
+    return json.dumps(json_ready_data, separators=(",", ":"))
 
 
 def generate_buffett_output(
@@ -111,6 +111,8 @@ class EODPerformanceAnalyzer:
         self.threshold = threshold_pct / 100.0
         self.timeframe_str = timeframe
         os.makedirs(self.output_dir, exist_ok=True)
+        # Session close (UTC) per ET date; None marks a non-trading day
+        self._session_close_cache: dict[date, datetime | None] = {}
 
         # Regex patterns (multiline entries compacted before matching)
         self._action_pat = re.compile(
@@ -527,18 +529,22 @@ class EODPerformanceAnalyzer:
 
     def _get_session_close_utc_for_et_date(self, et_dt: datetime) -> datetime | None:
         # Use Alpaca calendar for the ET date
+        # Decisions share a handful of dates, so each date is looked up once
         et_day = et_dt.date()
+        if et_day in self._session_close_cache:
+            return self._session_close_cache[et_day]
         req = GetCalendarRequest(start=et_day, end=et_day)
         try:
             calendars = trading_client.get_calendar(req)
-            if not calendars or not isinstance(calendars, list):
-                return None
-            # Alpaca returns naive ET times; attach ET tz then convert to UTC
-            close_naive = calendars[0].close
-            close_et = close_naive.replace(tzinfo=ET)
-            return close_et.astimezone(UTC)
         except Exception:
+            # Not cached, so a transient API error is retried for the next decision
             return None
+        close_utc = None
+        if calendars and isinstance(calendars, list):
+            # Alpaca returns naive ET times; attach ET tz then convert to UTC
+            close_utc = calendars[0].close.replace(tzinfo=ET).astimezone(UTC)
+        self._session_close_cache[et_day] = close_utc
+        return close_utc
 
     def _fetch_bars_range(self, symbol: str, start_utc: datetime, end_utc: datetime) -> pd.DataFrame | None:
         try:
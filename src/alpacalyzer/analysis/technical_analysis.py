@@ -1,22 +1,129 @@
 """Technical analysis using pandas-ta (pure Python alternative to TA-Lib)."""
 
-from datetime import UTC, datetime, timedelta
-from typing import TypedDict, cast
+import logging
+import re
+from enum import IntFlag
+from typing import NotRequired, TypedDict
 
+import numpy as np
 import pandas as pd
 import pandas_ta  # noqa: F401  # registers .ta accessor on DataFrames
-from alpaca.data.enums import Adjustment
-from alpaca.data.models import Bar, BarSet
-from alpaca.data.requests import StockBarsRequest, StockLatestBarRequest
-from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
 from alpaca.trading.enums import OrderSide
 
-from alpacalyzer.trading.alpaca_client import get_market_status, history_client
+from alpacalyzer.trading.alpaca_client import get_market_status, get_stock_bars, prefetch_stock_bars
 from alpacalyzer.utils.cache_utils import timed_lru_cache
 from alpacalyzer.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Score thresholds for calculate_ta_threshold, in the order of its VIX/volume/ATR conditions
+_TA_THRESHOLDS = [0.65, 0.75, 0.55, 0.6, 0.45, 0.5]
+
+
+class IndicatorBit(IntFlag):
+    """One bit per technical signal category emitted by calculate_technical_analysis_score."""
+
+    NONE = 0
+    PRICE_ABOVE_MAS = 1 << 0
+    PRICE_BELOW_MAS = 1 << 1
+    OVERSOLD_RSI = 1 << 2
+    OVERBOUGHT_RSI = 1 << 3
+    BULLISH_ENGULFING_DAILY = 1 << 4
+    BEARISH_ENGULFING_DAILY = 1 << 5
+    HAMMER_DAILY = 1 << 6
+    SHOOTING_STAR_DAILY = 1 << 7
+    BULLISH_ENGULFING_INTRADAY = 1 << 8
+    BEARISH_ENGULFING_INTRADAY = 1 << 9
+    HAMMER_INTRADAY = 1 << 10
+    SHOOTING_STAR_INTRADAY = 1 << 11
+    PRICE_ABOVE_VWAP = 1 << 12
+    PRICE_BELOW_VWAP = 1 << 13
+    STRONG_BULLISH_MACD = 1 << 14
+    STRONG_BEARISH_MACD = 1 << 15
+    PRICE_BELOW_LOWER_BB = 1 << 16
+    PRICE_ABOVE_UPPER_BB = 1 << 17
+    BREAKOUT = 1 << 18
+    BREAKDOWN = 1 << 19
+    HIGH_RVOL_MISSING = 1 << 20
+    HIGH_TRADE_COUNT = 1 << 21
+
+
+# Substring identifying each signal description -> its bit
+_SIGNAL_BITS: tuple[tuple[str, IndicatorBit], ...] = (
+    ("Price above both MAs", IndicatorBit.PRICE_ABOVE_MAS),
+    ("Price below both MAs", IndicatorBit.PRICE_BELOW_MAS),
+    ("Oversold RSI", IndicatorBit.OVERSOLD_RSI),
+    ("Overbought RSI", IndicatorBit.OVERBOUGHT_RSI),
+    ("Bullish Engulfing (Daily)", IndicatorBit.BULLISH_ENGULFING_DAILY),
+    ("Bearish Engulfing (Daily)", IndicatorBit.BEARISH_ENGULFING_DAILY),
+    ("Hammer (Daily)", IndicatorBit.HAMMER_DAILY),
+    ("Shooting Star (Daily)", IndicatorBit.SHOOTING_STAR_DAILY),
+    ("Bullish Engulfing (Intraday)", IndicatorBit.BULLISH_ENGULFING_INTRADAY),
+    ("Bearish Engulfing (Intraday)", IndicatorBit.BEARISH_ENGULFING_INTRADAY),
+    ("Hammer (Intraday)", IndicatorBit.HAMMER_INTRADAY),
+    ("Shooting Star (Intraday)", IndicatorBit.SHOOTING_STAR_INTRADAY),
+    ("Price above VWAP", IndicatorBit.PRICE_ABOVE_VWAP),
+    ("Price below VWAP", IndicatorBit.PRICE_BELOW_VWAP),
+    ("Strong bullish MACD", IndicatorBit.STRONG_BULLISH_MACD),
+    ("Strong bearish MACD", IndicatorBit.STRONG_BEARISH_MACD),
+    ("Price below Lower BB", IndicatorBit.PRICE_BELOW_LOWER_BB),
+    ("Price above Upper BB", IndicatorBit.PRICE_ABOVE_UPPER_BB),
+    ("Breakout (Volume spike", IndicatorBit.BREAKOUT),
+    ("Breakdown (Volume spike", IndicatorBit.BREAKDOWN),
+    ("High RVOL missing", IndicatorBit.HIGH_RVOL_MISSING),
+    ("High trade count confirmation", IndicatorBit.HIGH_TRADE_COUNT),
+)
+
+# Signals that argue against holding a position on the given side
+_WEAK_SIGNALS: dict[OrderSide, IndicatorBit] = {
+    OrderSide.BUY: (
+        IndicatorBit.PRICE_BELOW_MAS
+        | IndicatorBit.STRONG_BEARISH_MACD
+        | IndicatorBit.SHOOTING_STAR_DAILY
+        | IndicatorBit.BEARISH_ENGULFING_DAILY
+        | IndicatorBit.SHOOTING_STAR_INTRADAY
+        | IndicatorBit.BEARISH_ENGULFING_INTRADAY
+        | IndicatorBit.OVERBOUGHT_RSI
+        | IndicatorBit.HIGH_RVOL_MISSING
+    ),
+    OrderSide.SELL: (
+        IndicatorBit.PRICE_ABOVE_MAS
+        | IndicatorBit.OVERSOLD_RSI
+        | IndicatorBit.BULLISH_ENGULFING_DAILY
+        | IndicatorBit.HAMMER_DAILY
+        | IndicatorBit.PRICE_ABOVE_VWAP
+        | IndicatorBit.BULLISH_ENGULFING_INTRADAY
+        | IndicatorBit.HAMMER_INTRADAY
+        | IndicatorBit.STRONG_BULLISH_MACD
+        | IndicatorBit.PRICE_BELOW_LOWER_BB
+    ),
+}
+
+# All description keys compiled into one alternation, so a description (or a whole
+# newline-joined signal list) is matched against every key in a single scan
+_SIGNAL_BIT_BY_KEY: dict[str, int] = {key: int(bit) for key, bit in _SIGNAL_BITS}
+_SIGNAL_PATTERN = re.compile("|".join(re.escape(key) for key, _ in _SIGNAL_BITS))
+
+# Pattern matching each side's weak signals, so building the message only tests those
+_WEAK_SIGNAL_PATTERNS: dict[OrderSide, re.Pattern[str]] = {side: re.compile("|".join(re.escape(key) for key, bit in _SIGNAL_BITS if bit & mask)) for side, mask in _WEAK_SIGNALS.items()}
+
+
+def _text_bits(text: str) -> IndicatorBit:
+    bits = 0
+    for key in _SIGNAL_PATTERN.findall(text):
+        bits |= _SIGNAL_BIT_BY_KEY[key]
+    return IndicatorBit(bits)
+
+
+def signal_bits(signal: str) -> IndicatorBit:
+    """Return the IndicatorBit flags matching a signal description."""
+    return _text_bits(signal)
+
+
+def signals_to_mask(signals: list[str]) -> IndicatorBit:
+    """OR together the IndicatorBit flags of every signal description."""
+    return _text_bits("\n".join(signals))
+
 
 class TradingSignals(TypedDict):
     symbol: str
@@ -24,6 +131,7 @@ class TradingSignals(TypedDict):
     atr: float
     rvol: float
     signals: list[str]  # List of trading signal descriptions
+    signals_mask: NotRequired[int]  # IndicatorBit flags of the signals, set by calculate_technical_analysis_score
     raw_score: int
     score: float  # Normalized score (0-1)
     momentum: float  # 24h momentum
@@ -38,67 +146,32 @@ class TechnicalAnalyzer:
             df = df.reset_index(level=1, drop=True)
         return df
 
-    @timed_lru_cache(seconds=60, maxsize=128)
     def get_historical_data(self, symbol, request_type="minute") -> pd.DataFrame | None:
-        """Get historical data from Alpaca."""
-        try:
-            now_utc = datetime.now(UTC)
-            end = now_utc - timedelta(seconds=930)
-
-            if request_type == "minute":
-                start = end - timedelta(minutes=1440)
-                request = StockBarsRequest(
-                    symbol_or_symbols=symbol,
-                    timeframe=TimeFrame(5, TimeFrameUnit.Minute),  # type: ignore[arg-type]
-                    start=start,
-                    end=end,
-                    adjustment=Adjustment.ALL,
-                )
-            else:
-                start = end - timedelta(days=100)
-                request = StockBarsRequest(
-                    symbol_or_symbols=symbol,
-                    timeframe=TimeFrame.Day,
-                    start=start,
-                    end=end,
-                    adjustment=Adjustment.ALL,
-                )
-            try:
-                bars_response = history_client.get_stock_bars(request)
-                candles = cast(BarSet, bars_response).data.get(symbol)
-                if not candles or candles is None:
-                    return None
-
-                if get_market_status() == "open":
-                    latest_bar_response = history_client.get_stock_latest_bar(StockLatestBarRequest(symbol_or_symbols=symbol))
-                    latest_bar = cast(dict[str, Bar], latest_bar_response).get(symbol)
-                    candles.append(latest_bar if latest_bar else candles[-1])
-                else:
-                    candles.append(candles[-1])
-
-                return pd.DataFrame(
-                    [
-                        {
-                            "symbol": bar.symbol,
-                            "timestamp": bar.timestamp,
-                            "open": bar.open,
-                            "high": bar.high,
-                            "low": bar.low,
-                            "close": bar.close,
-                            "volume": bar.volume,
-                            "trade_count": bar.trade_count,
-                            "vwap": bar.vwap,
-                        }
-                        for bar in candles
-                    ]
-                )
-            except Exception as e:
-                logger.error(f"Error fetching stock bars for {symbol}: {str(e)}", exc_info=True)
-                return None
+        """
+        Get historical data from Alpaca.
 
-        except Exception as e:
-            logger.error(f"Error fetching historical data for {symbol}: {str(e)}", exc_info=True)
+        Delegates to alpaca_client.get_stock_bars so bars are fetched and cached
+        in one place; the timestamp index is moved back into a column.
+        """
+        df = get_stock_bars(symbol, request_type)
+        if df is None:
             return None
+        return df.reset_index()
+
+    def prefetch_bars(self, symbols: list[str]) -> None:
+        """
+        Warm the bar cache for several symbols before analyzing them.
+
+        One batched request per timeframe replaces the intraday and daily
+        requests analyze_stock would otherwise make for each symbol.
+        """
+        try:
+            market_status = get_market_status()
+        except Exception as e:
+            logger.warning(f"bar prefetch skipped, market status unavailable | error={e}", exc_info=True)
+            return
+        for request_type in ("minute", "day"):
+            prefetch_stock_bars(symbols, request_type, market_status)
 
     @staticmethod
     def _detect_engulfing(df: pd.DataFrame, bullish: bool = True) -> pd.Series:
@@ -518,6 +591,8 @@ class TechnicalAnalyzer:
                         signals["raw_score"] += 15
                         signals["signals"].append(f"TA: High trade count confirmation ({trade_count:.0f} > 1.5x avg {avg_trade_count:.0f})")
 
+        signals["signals_mask"] = int(signals_to_mask(signals["signals"]))
+
         ### --- NORMALIZATION --- ###
         min_raw_score, max_raw_score = -130, 180
         signals["score"] = (signals["raw_score"] - min_raw_score) / (max_raw_score - min_raw_score)
@@ -529,6 +604,22 @@ class TechnicalAnalyzer:
         return signals
 
     def analyze_stock(self, symbol: str) -> TradingSignals | None:
+        """
+        Score a symbol from its daily and intraday bars.
+
+        Results are shared by every analyzer of the same class for 60 seconds,
+        the same window as the bar cache underneath, so the agents, scanners
+        and execution engine that each build their own analyzer compute a
+        symbol's indicators once per cycle instead of once per caller.
+        """
+        return type(self)._analyze_stock_cached(symbol)
+
+    @classmethod
+    @timed_lru_cache(seconds=60, maxsize=256)
+    def _analyze_stock_cached(cls, symbol: str) -> TradingSignals | None:
+        return cls()._analyze_stock(symbol)
+
+    def _analyze_stock(self, symbol: str) -> TradingSignals | None:
         try:
             intraday = self.analyze_stock_intraday(symbol)
             daily = self.analyze_stock_daily(symbol)
@@ -545,32 +636,20 @@ class TechnicalAnalyzer:
             logger.error(f"Error analyzing stock {symbol}: {str(e)}", exc_info=True)
             return None
 
-    def weak_technicals(self, signals: list[str], side: OrderSide) -> str | None:
-        if side == OrderSide.BUY:
-            weak_signal_checks = {
-                "Price below both MAs",
-                "Strong bearish MACD",
-                "Shooting Star (Daily)",
-                "Bearish Engulfing (Daily)",
-                "Shooting Star (Intraday)",
-                "Bearish Engulfing (Intraday)",
-                "Overbought RSI",
-                "High RVOL missing",
-            }
-        else:  # OrderSide.SELL
-            weak_signal_checks = {
-                "Price above both MAs",
-                "Oversold RSI",
-                "Bullish Engulfing (Daily)",
-                "Hammer (Daily)",
-                "Price above VWAP",
-                "Bullish Engulfing (Intraday)",
-                "Hammer (Intraday)",
-                "Strong bullish MACD",
-                "Price below Lower BB",
-            }
+    def weak_technicals(self, signals: list[str], side: OrderSide, signals_mask: int | None = None) -> str | None:
+        """
+        Describe signals that argue against a position on the given side.
+
+        When signals_mask (see IndicatorBit) is given, the common no-weakness case
+        is settled with a single AND and the descriptions are only scanned to
+        build the message.
+        """
+        weak_mask = _WEAK_SIGNALS[side]
+        if signals_mask is not None and not signals_mask & weak_mask:
+            return None
 
-        weak_tech_signals = [signal for signal in signals if any(key in signal for key in weak_signal_checks)]
+        weak_pattern = _WEAK_SIGNAL_PATTERNS[side]
+        weak_tech_signals = [signal for signal in signals if weak_pattern.search(signal)]
 
         if weak_tech_signals:
             return f"Unfavorable technicals: {', '.join(weak_tech_signals)}"
@@ -581,25 +660,28 @@ class TechnicalAnalyzer:
         Dynamically adjust technical score threshold based on VIX, volume, and volatility.
 
         Updated thresholds (reduced by 0.1-0.15 points) to increase entry conversion rate.
+        Any of vix_close, rel_vol and atr_pct may be arrays; they broadcast against
+        each other and one threshold per element is returned, so a whole candidate
+        list (or a DataFrame's columns) is scored in a single call.
         """
-        logger.debug(f"VIX: {vix_close:.1f}, Rel Vol: {rel_vol:.1f}, ATR %: {atr_pct:.2f}")
-        if vix_close > 35:
-            if rel_vol >= 3 and atr_pct < 0.08:
-                return 0.65
-            return 0.75
-
-        if vix_close >= 30:
-            if rel_vol >= 2 and atr_pct < 0.10:
-                return 0.55
-            return 0.6
-
-        if vix_close >= 20:
-            if rel_vol >= 1.5 and atr_pct < 0.12:
-                return 0.45
-            return 0.5
-
-        # VIX < 20 (Calm market)
-        return 0.35
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"VIX: {np.round(vix_close, 1)}, Rel Vol: {rel_vol}, ATR %: {atr_pct}")
+        vix_close = np.asarray(vix_close, dtype=float)
+        rel_vol = np.asarray(rel_vol, dtype=float)
+        atr_pct = np.asarray(atr_pct, dtype=float)
+
+        # First matching condition wins: each VIX band checks its high-volume, low-ATR case first
+        conditions = [
+            (vix_close > 35) & (rel_vol >= 3) & (atr_pct < 0.08),
+            vix_close > 35,
+            (vix_close >= 30) & (rel_vol >= 2) & (atr_pct < 0.10),
+            vix_close >= 30,
+            (vix_close >= 20) & (rel_vol >= 1.5) & (atr_pct < 0.12),
+            vix_close >= 20,
+        ]
+        # VIX < 20 (Calm market) falls through to the default
+        thresholds = np.select(conditions, _TA_THRESHOLDS, default=0.35)
+        return float(thresholds) if thresholds.ndim == 0 else thresholds
 
     def calculate_short_candidate_score(self, symbol: str, daily_df: pd.DataFrame, intraday_df: pd.DataFrame) -> TradingSignals | None:
         """
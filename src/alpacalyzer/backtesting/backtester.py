@@ -268,11 +268,9 @@ class Backtester:
 
         position: BacktestTrade | None = None
 
-        for i, row in df.iterrows():
-            index_val = row.name
-            assert index_val is not None, "DataFrame index should not be None"
+        for index_val, close in zip(df.index, df["close"], strict=True):
             timestamp: datetime = index_val if isinstance(index_val, datetime) else pd.Timestamp(index_val).to_pydatetime()  # type: ignore[arg-type]
-            price = float(row["close"])
+            price = float(close)
 
             if position and not position.closed:
                 exit_decision = self._evaluate_exit(position, df.loc[:timestamp], price)
@@ -113,7 +113,7 @@ def main():  # pragma: no cover
             direct_tickers = [ticker.strip().upper() for ticker in args.tickers.split(",")]
             logger.info(f"analyzing provided tickers | tickers={', '.join(direct_tickers)}")
 
-        strategy = StrategyRegistry.get(args.strategy)
+        strategy = StrategyRegistry.get_default(args.strategy)
 
         registry = get_scanner_registry()
         registry.register(RedditScannerAdapter())
@@ -179,7 +179,7 @@ def _run_dry_run(args):
         if args.tickers:
             direct_tickers = [t.strip().upper() for t in args.tickers.split(",")]
 
-        strategy = StrategyRegistry.get(args.strategy)
+        strategy = StrategyRegistry.get_default(args.strategy)
         registry = get_scanner_registry()
         registry.register(RedditScannerAdapter())
         registry.register(SocialScannerAdapter())
@@ -38,18 +38,17 @@ def get_prices(ticker: str, start_date: str, end_date: str) -> list[Price]:
         df = yf_ticker.history(start=start_date, end=end_date)
 
         if not df.empty:
-            prices = []
-            for index, row in df.iterrows():
-                date_str = index.strftime("%Y-%m-%d")
-                price = Price(
-                    open=float(row["Open"]),
-                    close=float(row["Close"]),
-                    high=float(row["High"]),
-                    low=float(row["Low"]),
-                    volume=int(row["Volume"]),
-                    time=date_str,
-                )
-                prices.append(price)
+            # Pull each column out once as plain Python values instead of boxing a Series per row
+            columns = zip(
+                df["Open"].astype(float).tolist(),
+                df["Close"].astype(float).tolist(),
+                df["High"].astype(float).tolist(),
+                df["Low"].astype(float).tolist(),
+                df["Volume"].tolist(),
+                df.index.strftime("%Y-%m-%d").tolist(),
+                strict=True,
+            )
+            prices = [Price(open=open_, close=close, high=high, low=low, volume=int(volume), time=date_str) for open_, close, high, low, volume, date_str in columns]
 
             # Cache the results
             _cache.set_prices(cache_key, [p.model_dump() for p in prices])
@@ -639,6 +638,9 @@ def get_vix(use_cache: bool = True) -> float | None:
             return cached_value
 
     try:
+        if not use_cache:
+            # The client keeps its own shared VIX cache; drop it so this really refetches
+            YFinanceClient.get_vix.cache_clear()  # type: ignore[attr-defined]
         client = YFinanceClient()
         vix_value = client.get_vix()
 
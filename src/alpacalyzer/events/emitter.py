@@ -3,6 +3,7 @@
 import threading
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from typing import BinaryIO
 
 from alpacalyzer.events.models import TradingEvent
 from alpacalyzer.utils.logger import get_logger
@@ -88,6 +89,10 @@ class FileEventHandler(EventHandler):
 
     Rotates when the file exceeds max_bytes. Keeps up to backup_count
     rotated files (events.jsonl.1, events.jsonl.2, etc.).
+
+    The file is opened once and kept open between events; its size is
+    tracked in memory, so each event costs a single write and flush rather
+    than an open, stat and close.
     """
 
     def __init__(
@@ -102,16 +107,38 @@ class FileEventHandler(EventHandler):
         self.max_bytes = max_bytes
         self.backup_count = backup_count
         self._lock = threading.Lock()
+        self._file: BinaryIO | None = None
+        self._size = 0
         # Ensure directory exists
         Path(self.file_path).parent.mkdir(parents=True, exist_ok=True)
 
     def handle(self, event: TradingEvent) -> None:
-        json_line = event.model_dump_json()
+        data = event.model_dump_json().encode() + b"\n"
 
         with self._lock:
-            self._rotate_if_needed()
-            with open(self.file_path, "a") as f:
-                f.write(json_line + "\n")
+            if self._file is None:
+                self._open()
+            elif self._size >= self.max_bytes:
+                self._file.close()
+                self._rotate_if_needed()
+                self._open()
+            assert self._file is not None
+            self._file.write(data)
+            self._file.flush()
+            self._size += len(data)
+
+    def close(self) -> None:
+        """Close the underlying file; the next event reopens it."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def _open(self) -> None:
+        """Open the file for appending, rotating first if it is already full."""
+        self._rotate_if_needed()
+        self._file = open(self.file_path, "ab")  # noqa: SIM115 - kept open across events, closed in close()
+        self._size = self._file.tell()
 
     def _rotate_if_needed(self) -> None:
         """Rotate the log file if it exceeds max_bytes."""
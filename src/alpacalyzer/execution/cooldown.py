@@ -22,9 +22,9 @@ class CooldownEntry:
         """When this cooldown expires."""
         return self.exit_time + timedelta(hours=self.cooldown_hours)
 
-    def is_expired(self) -> bool:
-        """Check if cooldown has expired."""
-        return datetime.now(UTC) > self.expires_at
+    def is_expired(self, now: datetime | None = None) -> bool:
+        """Check if cooldown has expired as of now (defaults to the current time)."""
+        return (now or datetime.now(UTC)) > self.expires_at
 
     def remaining_time(self) -> timedelta:
         """Time remaining in cooldown."""
@@ -152,12 +152,13 @@ class CooldownManager:
 
         Returns number of entries removed.
         """
-        expired = [ticker for ticker, entry in self._cooldowns.items() if entry.is_expired()]
+        now = datetime.now(UTC)
+        expired = [ticker for ticker, entry in self._cooldowns.items() if entry.is_expired(now)]
         for ticker in expired:
             del self._cooldowns[ticker]
             emit_event(
                 CooldownEndedEvent(
-                    timestamp=datetime.now(UTC),
+                    timestamp=now,
                     ticker=ticker,
                 )
             )
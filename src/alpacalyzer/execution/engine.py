@@ -55,6 +55,7 @@ See also:
 - TrackedPosition.has_bracket_order for bracket order tracking
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
@@ -74,6 +75,7 @@ from alpacalyzer.utils.logger import get_logger
 logger = get_logger(__name__)
 
 STATE_FILE = Path(".alpacalyzer-state.json")
+PREFETCH_MAX_WORKERS = 8
 
 if TYPE_CHECKING:
     from alpacalyzer.strategies.base import Strategy
@@ -179,6 +181,28 @@ class ExecutionEngine:
         for ticker in expired:
             del self._signal_cache[ticker]
 
+    def _prefetch_signals(self, tickers: list[str]) -> None:
+        """
+        Warm the signal cache for tickers that will need technical analysis.
+
+        Each analyze_stock call is dominated by network I/O, so the misses' bars
+        are fetched in one batch and the analyses run concurrently, keeping the
+        exit pass from scaling linearly with the number of open positions.
+        Failures are left uncached so the regular path logs and skips them.
+        """
+        missing = [ticker for ticker in dict.fromkeys(tickers) if self._get_cached_signal(ticker) is None]
+        if len(missing) < 2:
+            return
+
+        self._ta.prefetch_bars(missing)
+        with ThreadPoolExecutor(max_workers=min(PREFETCH_MAX_WORKERS, len(missing))) as executor:
+            results = list(executor.map(self._ta.analyze_stock, missing))
+
+        for ticker, signals in zip(missing, results, strict=True):
+            if signals is not None:
+                self._cache_signal(ticker, signals)
+        logger.debug(f"signals prefetched | requested={len(missing)} ok={sum(r is not None for r in results)}")
+
     def run_cycle(self) -> None:
         """
         Execute one cycle of the trading loop.
@@ -203,19 +227,22 @@ class ExecutionEngine:
         self._sync_and_emit_bracket_exits()
 
         # 2. Process exits FIRST (protect capital)
-        for position in self.positions.get_all():
+        positions = self.positions.get_all()
+        self._prefetch_signals([p.ticker for p in positions if not p.has_bracket_order])
+        for position in positions:
             self._process_exit(position)
 
         # 3. Process entries
         context = self._build_market_context()
-        while not self.signal_queue.is_empty():
-            signal = self.signal_queue.peek()
+        queue = self.signal_queue
+        while not queue.is_empty():
+            signal = queue.peek()
             if signal is None:
                 break
 
             if self._can_take_position(signal, context):
                 self._process_entry(signal, context)
-                self.signal_queue.pop()
+                queue.pop()
             else:
                 break  # Stop if we can't take more positions
 
@@ -441,6 +468,7 @@ class ExecutionEngine:
             buying_power=account_info["buying_power"],
             existing_positions=list(self.positions._positions.keys()),
             cooldown_tickers=self.cooldowns.get_all_tickers(),
+            timestamp=datetime.now(UTC),
         )
 
     def _run_analyze_cycle(self) -> None:
@@ -455,14 +483,15 @@ class ExecutionEngine:
             self._process_exit(position)
 
         context = self._build_market_context()
-        while not self.signal_queue.is_empty():
-            signal = self.signal_queue.peek()
+        queue = self.signal_queue
+        while not queue.is_empty():
+            signal = queue.peek()
             if signal is None:
                 break
 
             if self._can_take_position(signal, context):
                 self._process_entry(signal, context)
-                self.signal_queue.pop()
+                queue.pop()
             else:
                 break
 
@@ -494,6 +523,15 @@ class ExecutionEngine:
             )
         )
 
+    def blocked_tickers(self) -> set[str]:
+        """
+        Tickers a new entry signal would currently be rejected for.
+
+        Covers tracked positions, active cooldowns and tickers that already
+        have a queued signal, so callers can skip analyzing them.
+        """
+        return set(self.positions._positions) | set(self.cooldowns.get_all_tickers()) | {signal.ticker for signal in self.signal_queue}
+
     def add_signal(self, signal: PendingSignal) -> None:
         """Add a signal to the queue for processing."""
         self.signal_queue.add(signal)
@@ -138,7 +138,7 @@ class OrderManager:
                 client_order_id=params.client_order_id,
             )
 
-            logger.debug(f"Submitting bracket order: {bracket_order}")
+            logger.debug("Submitting bracket order: %s", bracket_order)
             order_response = trading_client.submit_order(bracket_order)
             order = cast(Order, order_response)
 
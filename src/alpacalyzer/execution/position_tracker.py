@@ -217,31 +217,32 @@ class PositionTracker:
         from alpacalyzer.trading.alpaca_client import get_positions
 
         broker_positions = get_positions()
-        broker_tickers = {p.symbol for p in broker_positions}
-        local_tickers = set(self._positions.keys())
-
+        remaining = dict(self._positions)
+        synced: dict[str, TrackedPosition] = {}
         changes = []
 
-        # Update existing / add new positions
+        # Single pass: upsert every broker position; whatever is left locally has closed
         for pos in broker_positions:
             ticker = pos.symbol
+            tracked = remaining.pop(ticker, None)
 
-            if ticker in self._positions:
-                # Update existing position
-                tracked = self._positions[ticker]
-                new_price = float(pos.current_price) if pos.current_price else tracked.current_price
-                tracked.update_price(new_price)
-            else:
+            if tracked is None:
                 # New position (opened outside our system or missed)
-                self._positions[ticker] = TrackedPosition.from_alpaca_position(pos)
+                tracked = TrackedPosition.from_alpaca_position(pos)
                 changes.append(ticker)
+            else:
+                # The broker already merges fills into qty and average entry price
+                tracked.quantity = int(float(pos.qty))
+                tracked.avg_entry_price = float(pos.avg_entry_price)
+                tracked.update_price(float(pos.current_price) if pos.current_price else tracked.current_price)
+            synced[ticker] = tracked
 
         # Handle closed positions
-        for ticker in local_tickers - broker_tickers:
-            closed = self._positions.pop(ticker)
+        for ticker, closed in remaining.items():
             self._closed_positions.append(closed)
             changes.append(ticker)
 
+        self._positions = synced
         self._last_sync = datetime.now(UTC)
         return changes
 
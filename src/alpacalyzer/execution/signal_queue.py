@@ -139,6 +139,8 @@ class SignalQueue:
         """Remove expired signals."""
         now = datetime.now(UTC)
         expired = [s for s in self._heap if s.expires_at and s.expires_at < now]
+        if not expired:
+            return  # peek/pop/is_empty call this every time; keep the common case to one scan
 
         for signal in expired:
             self._tickers.discard(signal.ticker)
@@ -151,7 +153,9 @@ class SignalQueue:
                 )
             )
 
-        self._heap = [s for s in self._heap if s not in expired]
+        # Drop by identity: signal equality only compares priority
+        expired_ids = {id(s) for s in expired}
+        self._heap = [s for s in self._heap if id(s) not in expired_ids]
         heapify(self._heap)
 
     def __iter__(self) -> Iterator[PendingSignal]:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import hashlib
 import os
+import time
 from typing import cast
 
 from pydantic import BaseModel
@@ -14,6 +16,9 @@ logger = get_logger(__name__)
 
 _client: LLMClient | None = None
 
+# Responses of complete_structured_cached: prompt hash -> (monotonic stored at, response)
+_response_cache: dict[str, tuple[float, BaseModel]] = {}
+
 
 def get_llm_client() -> LLMClient:
     global _client
@@ -53,11 +58,49 @@ def complete_structured[T: BaseModel](
     return cast(T, result)
 
 
+def complete_structured_cached[T: BaseModel](
+    messages: list[dict],
+    response_model: type[T],
+    tier: LLMTier,
+    caller: str,
+    ttl: float,
+) -> T | None:
+    """
+    Run a structured completion at temperature 0, memoized by a hash of the prompt.
+
+    Callers whose prompt fully determines the answer use this to skip the model
+    when the same prompt comes back within ttl seconds. The request is pinned to
+    temperature 0 so a cached answer is the one the model would give again.
+    Failed calls are not cached, and hits return a deep copy so callers can't
+    mutate the stored response.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{caller}\0{response_model.__name__}\0{tier.value}".encode())
+    for message in messages:
+        digest.update(b"\0" + message["content"].encode())
+    key = digest.hexdigest()
+
+    now = time.monotonic()
+    cached = _response_cache.get(key)
+    if cached is not None and now - cached[0] < ttl:
+        logger.debug(f"llm response cache hit | caller={caller}")
+        return cast(T, cached[1].model_copy(deep=True))
+
+    client = get_llm_client()
+    response = client.complete_structured(messages, response_model, tier=tier, caller=caller, temperature=0)
+    for stale in [k for k, (ts, _) in _response_cache.items() if now - ts >= ttl]:
+        del _response_cache[stale]
+    if response is not None:
+        _response_cache[key] = (now, response.model_copy(deep=True))
+    return response
+
+
 __all__ = [
     "LLMClient",
     "get_llm_client",
     "LLMTier",
     "use_new_llm",
     "complete_structured",
+    "complete_structured_cached",
     "legacy_complete_structured",
 ]
@@ -15,6 +15,20 @@ from alpacalyzer.llm.structured import complete_structured
 
 T = TypeVar("T", bound="BaseModel")
 
+# Anthropic only caches prompt prefixes that end in an explicit cache_control
+# marker (OpenRouter passes it through); other providers cache prefixes automatically
+_EPHEMERAL_CACHE = {"type": "ephemeral"}
+
+
+def _mark_system_prompt_cacheable(messages: list[dict], model: str) -> list[dict]:
+    """Turn a leading string system prompt into a cache_control text block for Anthropic models."""
+    if not model.startswith("anthropic/") or not messages:
+        return messages
+    system = messages[0]
+    if system.get("role") != "system" or not isinstance(system.get("content"), str):
+        return messages
+    return [{**system, "content": [{"type": "text", "text": system["content"], "cache_control": _EPHEMERAL_CACHE}]}, *messages[1:]]
+
 
 class LLMClient:
     def __init__(
@@ -47,10 +61,12 @@ class LLMClient:
         tier: LLMTier = LLMTier.STANDARD,
         use_response_healing: bool = True,
         caller: str = "unknown",
+        temperature: float | None = None,
     ) -> T:
         model = get_model_for_tier(tier)
+        messages = _mark_system_prompt_cacheable(messages, model)
         start = time.monotonic()
-        result, response = complete_structured(self.client, messages, response_model, model, use_response_healing)
+        result, response = complete_structured(self.client, messages, response_model, model, use_response_healing, temperature)
         elapsed_ms = (time.monotonic() - start) * 1000
 
         usage = getattr(response, "usage", None)
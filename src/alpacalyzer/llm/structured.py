@@ -22,13 +22,18 @@ def complete_structured[T: BaseModel](
     response_model: type[T],
     model: str,
     use_response_healing: bool = True,
+    temperature: float | None = None,
 ) -> tuple[T, object]:
     """
     Complete a structured LLM call using instructor for retry-with-feedback.
 
+    temperature is only sent when given; otherwise the provider default applies.
+
     Returns:
         Tuple of (parsed_result, raw_response).
     """
+    sampling = {} if temperature is None else {"temperature": temperature}
+
     # Wrap the raw OpenAI client with instructor in JSON mode
     # (most compatible with OpenRouter — doesn't require tool-calling support)
     instructor_client = instructor.from_openai(client, mode=instructor.Mode.JSON)
@@ -39,12 +44,13 @@ def complete_structured[T: BaseModel](
             messages=messages,
             response_model=response_model,
             max_retries=MAX_RETRIES,
+            **sampling,
         )
         return result, raw_response
     except (ValidationError, Exception) as e:
         # If instructor exhausts retries, fall back to manual JSON mode parse
         logger.warning(f"instructor retries exhausted for {response_model.__name__}: {e}")
-        return _fallback_manual_parse(client, messages, response_model, model)
+        return _fallback_manual_parse(client, messages, response_model, model, **sampling)
 
 
 def _fallback_manual_parse[T: BaseModel](
@@ -52,10 +58,11 @@ def _fallback_manual_parse[T: BaseModel](
     messages: list[dict],
     response_model: type[T],
     model: str,
+    **sampling,
 ) -> tuple[T, object]:
     """Last-resort fallback: raw JSON mode + coercion helpers."""
     schema = response_model.model_json_schema()
-    schema_instruction = f"Respond with valid JSON matching this schema:\n```json\n{json.dumps(schema, indent=2)}\n```"
+    schema_instruction = f"Respond with valid JSON matching this schema:\n```json\n{json.dumps(schema, separators=(',', ':'))}\n```"
 
     augmented_messages = [
         {"role": "system", "content": schema_instruction},
@@ -66,6 +73,7 @@ def _fallback_manual_parse[T: BaseModel](
         model=model,
         messages=augmented_messages,
         response_format={"type": "json_object"},
+        **sampling,
     )
     content = response.choices[0].message.content
     content = _strip_code_fences(content)
@@ -154,14 +154,16 @@ class TradingOrchestrator:
         # Get active positions to filter out
         try:
             positions = get_positions()
-            active_tickers = [p.symbol for p in positions]
+            active_tickers = {p.symbol for p in positions}
         except Exception as e:
             logger.error(f"fetch positions failed | error={e}")
-            active_tickers = []
-        cooldown_tickers = list(self.recently_exited_tickers.keys())
+            active_tickers = set()
 
-        # Filter out already active or in-cooldown tickers
-        filtered_opportunities = [opp for opp in opportunities if opp.ticker not in active_tickers and opp.ticker not in cooldown_tickers]
+        # Filter out tickers the engine would reject anyway (active, in cooldown or
+        # already queued) before running the agents on them
+        blocked_tickers = active_tickers | self.recently_exited_tickers.keys()
+        blocked_tickers.update(self.execution_engine.blocked_tickers())
+        filtered_opportunities = [opp for opp in opportunities if opp.ticker not in blocked_tickers]
 
         if not filtered_opportunities:
             logger.info("no new opportunities | reason=all tickers active or in cooldown")
@@ -240,18 +242,18 @@ class TradingOrchestrator:
         """
         from alpacalyzer.events import CooldownEndedEvent, emit_event
 
+        if not self.recently_exited_tickers:
+            return
+
         now = datetime.now(UTC)
-        expired_tickers = []
+        # A single cutoff turns the per-ticker expiry check into one comparison
+        cutoff = now - self.cooldown_period
 
         for ticker, exit_time in list(self.recently_exited_tickers.items()):
-            if now > exit_time + self.cooldown_period:
+            if exit_time < cutoff:
                 emit_event(CooldownEndedEvent(timestamp=now, ticker=ticker))
                 logger.info(f"cooldown finished | ticker={ticker}")
-                expired_tickers.append(ticker)
-
-        # Remove expired entries
-        for ticker in expired_tickers:
-            del self.recently_exited_tickers[ticker]
+                del self.recently_exited_tickers[ticker]
 
     def execute_cycles(self) -> None:
         """Run execution cycles for the execution engine."""
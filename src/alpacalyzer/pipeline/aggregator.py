@@ -77,11 +77,13 @@ class OpportunityAggregator:
         if scan_results is None:
             scan_results = list(get_scanner_registry().run_all())
 
+        # One timestamp for the whole pass so every ticker is aged against the same instant
+        now = datetime.now(UTC)
         for result in scan_results:
             if result.success:
                 emit_event(
                     ScanCompleteEvent(
-                        timestamp=datetime.now(UTC),
+                        timestamp=now,
                         source=result.source,
                         tickers_found=result.symbols(),
                         duration_seconds=result.duration_seconds,
@@ -99,17 +101,16 @@ class OpportunityAggregator:
                 continue
 
             for ticker in result.tickers:
-                self._update_opportunity(ticker, result.source)
+                self._update_opportunity(ticker, result.source, now)
 
-        self._prune_stale()
-        self._calculate_scores()
+        self._prune_stale(now)
+        self._calculate_scores(now)
 
-        self._last_aggregation = datetime.now(UTC)
+        self._last_aggregation = now
 
-    def _update_opportunity(self, ticker: TopTicker, source: str) -> None:
-        """Update or create an opportunity for a ticker."""
+    def _update_opportunity(self, ticker: TopTicker, source: str, now: datetime) -> None:
+        """Update or create an opportunity for a ticker seen at now."""
         symbol = ticker.ticker
-        now = datetime.now(UTC)
 
         if symbol in self._opportunities:
             opp = self._opportunities[symbol]
@@ -142,16 +143,16 @@ class OpportunityAggregator:
                 reasoning=[f"[{source}] {ticker.reasoning}"] if ticker.reasoning else [],
             )
 
-    def _prune_stale(self) -> None:
+    def _prune_stale(self, now: datetime | None = None) -> None:
         """Remove opportunities older than max_age_hours."""
-        cutoff = datetime.now(UTC) - timedelta(hours=self.max_age_hours)
+        cutoff = (now or datetime.now(UTC)) - timedelta(hours=self.max_age_hours)
 
         stale = [symbol for symbol, opp in self._opportunities.items() if opp.last_seen < cutoff]
 
         for symbol in stale:
             del self._opportunities[symbol]
 
-    def _calculate_scores(self) -> None:
+    def _calculate_scores(self, now: datetime | None = None) -> None:
         """
         Calculate opportunity scores.
 
@@ -162,12 +163,13 @@ class OpportunityAggregator:
         - Ranking: +25 for top 10, +15 for top 25, +5 for top 50
         - Technical: +30 if has technical pattern match
         """
+        now = now or datetime.now(UTC)
         for opp in self._opportunities.values():
             score = 0.0
 
             score += len(opp.sources) * 20
 
-            age_hours = opp.age_hours
+            age_hours = (now - opp.first_seen).total_seconds() / 3600
             if age_hours < 1:
                 score += 30
             elif age_hours < 2:
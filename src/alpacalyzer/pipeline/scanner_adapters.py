@@ -22,7 +22,7 @@ class WSBScannerAdapter(BaseScanner):
 
     def _df_to_tickers(self, df: pd.DataFrame) -> list[TopTicker]:
         tickers = []
-        for _, row in df.iterrows():
+        for row in df.to_dict("records"):
             ticker = row.get("ticker")
             if not ticker:
                 continue
@@ -59,7 +59,7 @@ class StocktwitsScannerAdapter(BaseScanner):
 
     def _df_to_tickers(self, df: pd.DataFrame) -> list[TopTicker]:
         tickers = []
-        for _, row in df.iterrows():
+        for row in df.to_dict("records"):
             ticker = row.get("ticker")
             if not ticker:
                 continue
@@ -95,7 +95,7 @@ class FinvizScannerAdapter(BaseScanner):
 
     def _df_to_tickers(self, df: pd.DataFrame) -> list[TopTicker]:
         tickers = []
-        for idx, row in df.iterrows():
+        for row in df.to_dict("records"):
             ticker = row.get("Ticker") or row.get("ticker")
             if not ticker:
                 continue
@@ -145,7 +145,7 @@ class SocialScannerAdapter(BaseScanner):
 
     def _df_to_tickers(self, df: pd.DataFrame) -> list[TopTicker]:
         tickers = []
-        for _, row in df.iterrows():
+        for row in df.to_dict("records"):
             ticker = row.get("ticker")
             if not ticker:
                 continue
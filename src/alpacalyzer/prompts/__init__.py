@@ -1,14 +1,19 @@
 """Prompt loading utilities for externalized agent prompts."""
 
+from functools import cache
 from importlib.resources import files
 
 _PROMPTS_PACKAGE = "alpacalyzer.prompts"
 
 
+@cache
 def load_prompt(prompt_name: str) -> str:
     """
     Load a prompt from the prompts package.
 
+    Prompt files don't change at runtime, so each one is read once and every
+    later call returns the same string.
+
     Args:
         prompt_name: Name of the prompt file (without .md extension)
 
@@ -1,9 +1,10 @@
 """Scanner adapters implementing BaseScanner protocol."""
 
+import numpy as np
 import pandas as pd
 from alpaca.trading.enums import OrderSide
 
-from alpacalyzer.analysis.technical_analysis import TechnicalAnalyzer
+from alpacalyzer.analysis.technical_analysis import IndicatorBit, TechnicalAnalyzer
 from alpacalyzer.data.models import TopTicker
 from alpacalyzer.pipeline.scanner_protocol import BaseScanner
 from alpacalyzer.scanners.finviz_scanner import FinvizScanner
@@ -15,6 +16,14 @@ from alpacalyzer.utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _has_breakout(signals: dict) -> bool:
+    """Check the breakout bit of signals_mask, scanning the descriptions only when no mask was set."""
+    mask = signals.get("signals_mask")
+    if mask is not None:
+        return bool(mask & IndicatorBit.BREAKOUT)
+    return any("Breakout" in sig for sig in signals["signals"])
+
+
 class RedditScannerAdapter(BaseScanner):
     """Adapter for Reddit/insight scanning."""
 
@@ -60,20 +69,21 @@ class SocialScannerAdapter(BaseScanner):
             return []
 
         vix = self._yfinance.get_vix()
-        opportunities = []
+        df = self._prefilter(df, vix)
+        if df.empty:
+            return []
 
-        for _, stock in df.iterrows():
-            signals = stock.get("trading_signals")
-            if not isinstance(signals, dict):
-                continue
+        candidates = df["trading_signals"].tolist()
+        opportunities = []
 
-            if not self._passes_filters(signals, stock, vix):
+        for ticker, signals, above_threshold in zip(df["ticker"], candidates, self._above_threshold(candidates, vix), strict=True):
+            if not above_threshold or self._ta.weak_technicals(signals["signals"], OrderSide.BUY, signals.get("signals_mask")):
                 continue
 
             signal = "bullish" if signals["score"] > 0.8 else "neutral"
             opportunities.append(
                 TopTicker(
-                    ticker=stock["ticker"],
+                    ticker=ticker,
                     confidence=75,
                     signal=signal,
                     reasoning=f"Technical Score: {signals['score']:.2f}",
@@ -82,23 +92,32 @@ class SocialScannerAdapter(BaseScanner):
 
         return opportunities
 
-    def _passes_filters(self, signals: dict, stock: pd.Series, vix: float) -> bool:
-        momentum = signals["momentum"]
-        score = signals["score"]
-        signal_list = signals["signals"]
-
-        atr_pct = signals["atr"] / signals["price"]
-        threshold = self._ta.calculate_ta_threshold(vix, signals["rvol"], atr_pct)
-
-        if score < threshold:
-            return False
-        if momentum < 0 and stock.get("sentiment_rank", 0) > 20:
-            return False
-        if momentum < -3:
-            return False
-        if 15 < vix < 30 and score < 0.8 and not any("Breakout" in s for s in signal_list):
-            return False
-        if self._ta.weak_technicals(signal_list, OrderSide.BUY):
-            return False
-
-        return True
+    @staticmethod
+    def _prefilter(df: pd.DataFrame, vix: float) -> pd.DataFrame:
+        """
+        Drop rows failing the momentum, sentiment and VIX-band rules using column masks.
+
+        Rows without a trading_signals dict are dropped too, so only the few
+        survivors reach the per-row threshold and weakness checks.
+        """
+        df = df[df["trading_signals"].map(lambda s: isinstance(s, dict))]
+        if df.empty:
+            return df
+
+        signals = df["trading_signals"]
+        momentum = pd.Series([s["momentum"] for s in signals], index=df.index, dtype="float64")
+        sentiment_rank = df["sentiment_rank"] if "sentiment_rank" in df else pd.Series(0, index=df.index)
+
+        keep = (momentum >= -3) & ~((momentum < 0) & (sentiment_rank > 20))
+        if 15 < vix < 30:
+            score = pd.Series([s["score"] for s in signals], index=df.index, dtype="float64")
+            breakout = pd.Series([_has_breakout(s) for s in signals], index=df.index, dtype=bool)
+            keep &= (score >= 0.8) | breakout
+        return df[keep]
+
+    def _above_threshold(self, candidates: list[dict], vix: float) -> np.ndarray:
+        """Compare every candidate's score with its VIX/volume/ATR threshold in one call."""
+        score = np.array([s["score"] for s in candidates], dtype=float)
+        rvol = np.array([s["rvol"] for s in candidates], dtype=float)
+        atr_pct = np.array([s["atr"] for s in candidates], dtype=float) / np.array([s["price"] for s in candidates], dtype=float)
+        return score >= self._ta.calculate_ta_threshold(vix, rvol, atr_pct)
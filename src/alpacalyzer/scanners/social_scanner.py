@@ -1,4 +1,5 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
 import pandas as pd
@@ -12,6 +13,9 @@ from alpacalyzer.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# analyze_stock is network-bound, so candidates are analyzed concurrently
+TA_MAX_WORKERS = 16
+
 
 class SocialScanner:
     def __init__(self):
@@ -24,12 +28,13 @@ class SocialScanner:
         """Display the top N ranked stocks."""
         if not df.empty:
             logger.debug(f"top {top_n} ranked stocks")
-            for index, row in df.head(top_n).iterrows():
+            columns = ["ticker", "sentiment_score", "sentiment_rank", "technical_score", "ta_rank", "final_score", "final_rank"]
+            for index, ticker, sentiment_score, sentiment_rank, technical_score, ta_rank, final_score, final_rank in df.head(top_n)[columns].itertuples(name=None):
                 logger.debug(
-                    f"#{index + 1}: {row['ticker']} |"
-                    f" sentiment_score={row['sentiment_score']:.2f} sentiment_rank={row['sentiment_rank']:.2f}"
-                    f" technical_score={row['technical_score']:.2f} ta_rank={row['ta_rank']:.2f}"
-                    f" final_score={row['final_score']:.2f} final_rank={row['final_rank']:.2f}"
+                    f"#{index + 1}: {ticker} |"
+                    f" sentiment_score={sentiment_score:.2f} sentiment_rank={sentiment_rank:.2f}"
+                    f" technical_score={technical_score:.2f} ta_rank={ta_rank:.2f}"
+                    f" final_score={final_score:.2f} final_rank={final_rank:.2f}"
                 )
         else:
             logger.info("no stocks found")
@@ -95,9 +100,15 @@ class SocialScanner:
     def rank_stocks(self, tickers_list: list[str], limit: int, start_time: float | None = None) -> pd.DataFrame:
         """Rank stocks based on the combined data."""
 
+        # Stocktwits and Finviz rank the same tickers independently, so fetch both at once.
+        # Each gets its own frame because get_stock_ranks adds columns in place.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            st_future = executor.submit(self.stocktwits_scanner.get_stock_ranks, pd.DataFrame({"ticker": tickers_list}))
+            finviz_future = executor.submit(self.finviz_scanner.get_stock_ranks, pd.DataFrame({"ticker": tickers_list}))
+
         # Fetch ranks for tickers from Stocktwits
         try:
-            st_ranked = self.stocktwits_scanner.get_stock_ranks(pd.DataFrame({"ticker": tickers_list}))
+            st_ranked = st_future.result()
 
         except Exception as e:
             logger.error(f"stocktwits ranks fetch failed | error={e}", exc_info=True)
@@ -105,7 +116,7 @@ class SocialScanner:
 
         # Fetch ranks for tickers from Finviz
         try:
-            finviz_ranked = self.finviz_scanner.get_stock_ranks(pd.DataFrame({"ticker": tickers_list}))
+            finviz_ranked = finviz_future.result()
 
         except Exception as e:
             logger.error(f"finviz ranks fetch failed | error={e}", exc_info=True)
@@ -164,11 +175,12 @@ class SocialScanner:
 
         # Run technical analysis silently
         logger.info("running technical analysis")
-        ta_results = []
-        for _, row in combined_df.iterrows():
-            ta_data = self.technical_analyzer.analyze_stock(row["ticker"])
-            if ta_data:
-                ta_results.append({"ticker": ta_data["symbol"], "technical_score": ta_data["score"], "trading_signals": ta_data})
+        tickers = combined_df["ticker"].tolist()
+        self.technical_analyzer.prefetch_bars(tickers)
+        with ThreadPoolExecutor(max_workers=min(TA_MAX_WORKERS, len(tickers))) as executor:
+            ta_results = [
+                {"ticker": ta_data["symbol"], "technical_score": ta_data["score"], "trading_signals": ta_data} for ta_data in executor.map(self.technical_analyzer.analyze_stock, tickers) if ta_data
+            ]
 
         # Add technical ranks
         ta_df = pd.DataFrame(ta_results)
@@ -11,12 +11,15 @@ logger = get_logger(__name__)
 class StocktwitsScanner:
     def __init__(self):
         self.headers = {"User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")}
+        # One session per scanner so repeated calls reuse the same TLS connection
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
 
     def get_trending_stocks(self):
         """Get trending stocks from Stocktwits."""
         try:
             url = "https://api.stocktwits.com/api/2/trending/symbols.json"
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self._session.get(url, timeout=15)
 
             if response.status_code != 200:
                 logger.debug(f"stocktwits API unavailable | status={response.status_code}")
@@ -50,7 +53,7 @@ class StocktwitsScanner:
         """Fetch sentiment and mentions from Stocktwits API for a given ticker."""
         try:
             messages_url = f"https://api.stocktwits.com/api/2/streams/symbol/{ticker}.json"
-            response = requests.get(messages_url, headers=self.headers, timeout=15)
+            response = self._session.get(messages_url, timeout=15)
             if response.status_code == 200:
                 data = response.json()
 
@@ -9,6 +9,9 @@ logger = get_logger(__name__)
 class WSBScanner:
     def __init__(self):
         self.headers = {"User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")}
+        # One session per scanner so repeated calls reuse the same TLS connection
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
 
     def get_trending_stocks(self, limit=50):
         """
@@ -18,7 +21,7 @@ class WSBScanner:
         """
         try:
             url = "https://apewisdom.io/api/v1.0/filter/all-stocks/page/1"
-            response = requests.get(url, headers=self.headers, timeout=15)
+            response = self._session.get(url, timeout=15)
 
             if response.status_code != 200:
                 logger.error(f"apewisdom api error | status={response.status_code}")
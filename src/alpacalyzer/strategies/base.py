@@ -6,7 +6,8 @@ and supporting dataclasses for entry/exit decisions and market context.
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
@@ -33,6 +34,8 @@ class EntryDecision:
         stop_loss: Stop loss price level (0 if not entering)
         target: Target/profit-taking price level (0 if not entering)
         side: Position side ("long" or "short")
+        metrics: Structured values behind a rejection (e.g. volume_ratio), so
+            callers can format details only when they actually display them
     """
 
     should_enter: bool
@@ -42,6 +45,7 @@ class EntryDecision:
     stop_loss: float = 0.0
     target: float = 0.0
     side: str = "long"
+    metrics: dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -86,6 +90,8 @@ class MarketContext:
         buying_power: Available buying power in USD
         existing_positions: List of tickers currently held
         cooldown_tickers: List of tickers in cooldown period
+        timestamp: When the context was built; identifies the market tick so
+            per-tick results (e.g. basic filters) can be reused
     """
 
     vix: float
@@ -94,6 +100,7 @@ class MarketContext:
     buying_power: float
     existing_positions: list[str]
     cooldown_tickers: list[str]
+    timestamp: datetime | None = None
 
 
 @runtime_checkable
@@ -391,6 +398,31 @@ class BaseStrategy(ABC):
 
         return True, "Basic filters passed"
 
+    def _check_basic_filters_cached(
+        self,
+        signal: "TradingSignals",
+        context: MarketContext,
+    ) -> tuple[bool, str]:
+        """
+        Memoized _check_basic_filters for repeated lookups within one market tick.
+
+        Results are cached per (context.timestamp, symbol) and the cache is reset
+        whenever a different context is passed in. Contexts without a timestamp
+        are never cached.
+        """
+        if context.timestamp is None:
+            return self._check_basic_filters(signal, context)
+
+        if getattr(self, "_basic_filter_context", None) is not context:
+            self._basic_filter_context = context
+            self._basic_filter_cache: dict[tuple[datetime, str], tuple[bool, str]] = {}
+
+        key = (context.timestamp, signal.get("symbol", ""))
+        result = self._basic_filter_cache.get(key)
+        if result is None:
+            result = self._basic_filter_cache[key] = self._check_basic_filters(signal, context)
+        return result
+
     def to_dict(self) -> dict[str, Any]:
         """
         Serialize strategy-specific state for persistence.
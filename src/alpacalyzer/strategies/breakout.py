@@ -22,6 +22,13 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Constant rejection reasons; the numbers behind a rejection travel in
+# EntryDecision.metrics so nothing is formatted on the (common) reject path.
+_REASON_NO_CONSOLIDATION = "Price not in consolidation range"
+_REASON_LOW_VOLUME = "Volume too low"
+_REASON_LOW_ATR = "ATR too low"
+_REASON_FALSE_BREAKOUTS = "Too many recent false breakouts"
+
 
 @dataclass
 class BreakoutConfig(StrategyConfig):
@@ -154,7 +161,7 @@ class BreakoutStrategy(BaseStrategy):
         Returns:
             EntryDecision with entry details or rejection reason
         """
-        passed, reason = self._check_basic_filters(signal, context)
+        passed, reason = self._check_basic_filters_cached(signal, context)
         if not passed:
             return EntryDecision(should_enter=False, reason=reason)
 
@@ -182,7 +189,8 @@ class BreakoutStrategy(BaseStrategy):
         if range_pct > self.config.consolidation_range_pct:
             return EntryDecision(
                 should_enter=False,
-                reason=f"Price not in consolidation (range: {range_pct:.1%}, max: {self.config.consolidation_range_pct:.1%})",
+                reason=_REASON_NO_CONSOLIDATION,
+                metrics={"range_pct": range_pct, "max_range_pct": self.config.consolidation_range_pct},
             )
 
         avg_volume = raw_data["volume"].tail(50).mean()
@@ -192,20 +200,23 @@ class BreakoutStrategy(BaseStrategy):
         if volume_ratio < self.config.min_volume_ratio:
             return EntryDecision(
                 should_enter=False,
-                reason=f"Volume too low ({volume_ratio:.1f}x vs {self.config.min_volume_ratio:.1f}x required)",
+                reason=_REASON_LOW_VOLUME,
+                metrics={"volume_ratio": volume_ratio, "min_volume_ratio": self.config.min_volume_ratio},
             )
 
         atr = self._calculate_atr(raw_data)
         if atr < self.config.min_atr:
             return EntryDecision(
                 should_enter=False,
-                reason=f"ATR too low ({atr:.2f} vs {self.config.min_atr:.2f} minimum)",
+                reason=_REASON_LOW_ATR,
+                metrics={"atr": atr, "min_atr": self.config.min_atr},
             )
 
         if self._false_breakout_count.get(symbol, 0) >= self.config.max_false_breakouts:
             return EntryDecision(
                 should_enter=False,
-                reason=f"Too many recent false breakouts ({self._false_breakout_count[symbol]})",
+                reason=_REASON_FALSE_BREAKOUTS,
+                metrics={"false_breakouts": self._false_breakout_count[symbol]},
             )
 
         buffer = price * self.config.breakout_buffer_pct
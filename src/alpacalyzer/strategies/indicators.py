@@ -0,0 +1,318 @@
+"""
+Compiled indicator kernels shared by the strategies.
+
+The kernels operate on plain numpy arrays and reproduce the pandas rolling
+semantics the strategies were written against (simple-average RSI, sample
+standard deviation for Bollinger Bands), without building intermediate Series.
+Wilder's smoothed RSI is provided alongside the simple-average variant.
+The last-bar kernels accept float32 or float64 closes and always accumulate in
+float64. They are compiled with numba, a declared dependency; if it cannot be
+imported the kernels still run as ordinary Python functions.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - keeps the kernels importable without numba
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+@njit(cache=True)
+def rsi_bb(close: np.ndarray, rsi_n: int, bb_n: int, bb_std: float) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute RSI and Bollinger Bands over close prices in a single pass.
+
+    RSI uses simple rolling means of gains and losses, with the first price
+    change treated as zero (matching ``close.diff()`` followed by ``where``).
+    Bollinger Bands use a rolling mean and sample (ddof=1) standard deviation,
+    maintained with a sliding-window Welford update.
+
+    Args:
+        close: Close prices as a float64 array
+        rsi_n: RSI window length
+        bb_n: Bollinger Band window length
+        bb_std: Standard deviation multiplier for the bands
+
+    Returns:
+        Tuple of (rsi, upper, middle, lower) arrays, NaN during warm-up
+    """
+    size = close.shape[0]
+    rsi = np.full(size, np.nan)
+    upper = np.full(size, np.nan)
+    middle = np.full(size, np.nan)
+    lower = np.full(size, np.nan)
+
+    gains = np.zeros(size)
+    losses = np.zeros(size)
+    for i in range(1, size):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            gains[i] = delta
+        elif delta < 0:
+            losses[i] = -delta
+
+    # Running sums; the non-zero counters reset a sum to exactly zero once every
+    # contributing value has left the window, so drift cannot fake a tiny loss.
+    sum_gain = 0.0
+    sum_loss = 0.0
+    gain_count = 0
+    loss_count = 0
+
+    mean = 0.0
+    m2 = 0.0
+
+    for i in range(size):
+        sum_gain += gains[i]
+        sum_loss += losses[i]
+        if gains[i] > 0:
+            gain_count += 1
+        if losses[i] > 0:
+            loss_count += 1
+        if i >= rsi_n:
+            old = i - rsi_n
+            sum_gain -= gains[old]
+            sum_loss -= losses[old]
+            if gains[old] > 0:
+                gain_count -= 1
+            if losses[old] > 0:
+                loss_count -= 1
+            if gain_count == 0:
+                sum_gain = 0.0
+            if loss_count == 0:
+                sum_loss = 0.0
+        if i >= rsi_n - 1:
+            if sum_loss > 0:
+                rsi[i] = 100.0 - 100.0 / (1.0 + sum_gain / sum_loss)
+            elif sum_gain > 0:
+                rsi[i] = 100.0
+
+        x = close[i]
+        if i < bb_n:
+            delta = x - mean
+            mean += delta / (i + 1)
+            m2 += delta * (x - mean)
+        else:
+            x_old = close[i - bb_n]
+            old_mean = mean
+            mean += (x - x_old) / bb_n
+            m2 += (x - x_old) * (x - mean + x_old - old_mean)
+        if i >= bb_n - 1 and bb_n > 1:
+            std = math.sqrt(max(m2, 0.0) / (bb_n - 1))
+            middle[i] = mean
+            upper[i] = mean + std * bb_std
+            lower[i] = mean - std * bb_std
+
+    return rsi, upper, middle, lower
+
+
+@njit(cache=True)
+def rsi_last(close: np.ndarray, n: int) -> float:
+    """
+    Return the simple-average RSI of the last bar only.
+
+    Equivalent to ``rsi_bb(close, n, ...)[0][-1]`` but touches just the final
+    window and allocates nothing. close may be float32; sums are float64.
+    """
+    size = close.shape[0]
+    if size < n:
+        return np.nan
+    sum_gain = 0.0
+    sum_loss = 0.0
+    for i in range(max(1, size - n), size):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            sum_gain += delta
+        elif delta < 0:
+            sum_loss -= delta
+    if sum_loss > 0:
+        return 100.0 - 100.0 / (1.0 + sum_gain / sum_loss)
+    if sum_gain > 0:
+        return 100.0
+    return np.nan
+
+
+@njit(cache=True)
+def wilder_rsi(close: np.ndarray, n: int) -> np.ndarray:
+    """
+    Compute Wilder's smoothed RSI over close prices.
+
+    The average gain and loss are seeded with the simple mean of the first n
+    price changes and then updated recursively as
+    ``avg = (prev_avg * (n - 1) + value) / n``, so each bar costs O(1). The
+    first value is available at index n.
+
+    Args:
+        close: Close prices as a float64 array
+        n: RSI period
+
+    Returns:
+        RSI array, NaN during warm-up
+    """
+    size = close.shape[0]
+    rsi = np.full(size, np.nan)
+    if size <= n:
+        return rsi
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, size):
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i <= n:
+            avg_gain += gain / n
+            avg_loss += loss / n
+            if i < n:
+                continue
+        else:
+            avg_gain = (avg_gain * (n - 1) + gain) / n
+            avg_loss = (avg_loss * (n - 1) + loss) / n
+        if avg_loss > 0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0:
+            rsi[i] = 100.0
+    return rsi
+
+
+@njit(cache=True)
+def wilder_rsi_last(close: np.ndarray, n: int) -> float:
+    """
+    Return Wilder's smoothed RSI of the last bar only.
+
+    Equivalent to ``wilder_rsi(close, n)[-1]`` without allocating. The seed is
+    taken from the start of close, so the value converges to the full-history
+    RSI as more warm-up bars are supplied. close may be float32; sums are float64.
+    """
+    size = close.shape[0]
+    if size <= n:
+        return np.nan
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, size):
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i <= n:
+            avg_gain += gain / n
+            avg_loss += loss / n
+        else:
+            avg_gain = (avg_gain * (n - 1) + gain) / n
+            avg_loss = (avg_loss * (n - 1) + loss) / n
+    if avg_loss > 0:
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    if avg_gain > 0:
+        return 100.0
+    return np.nan
+
+
+@njit(cache=True)
+def bb_last(close: np.ndarray, n: int, num_std: float) -> tuple[float, float, float]:
+    """
+    Return the (upper, middle, lower) Bollinger Bands of the last bar only.
+
+    Uses a two-pass mean and sample (ddof=1) variance over the final window.
+    close may be float32; sums are float64.
+    """
+    size = close.shape[0]
+    if size < n or n < 2:
+        return np.nan, np.nan, np.nan
+    total = 0.0
+    for i in range(size - n, size):
+        total += close[i]
+    mean = total / n
+    m2 = 0.0
+    for i in range(size - n, size):
+        diff = close[i] - mean
+        m2 += diff * diff
+    std = math.sqrt(m2 / (n - 1))
+    return mean + std * num_std, mean, mean - std * num_std
+
+
+@njit(cache=True, parallel=True)
+def last_values_batch(closes: np.ndarray, lengths: np.ndarray, rsi_n: int, bb_n: int, bb_std: float, mean_n: int, wilder: bool = False) -> np.ndarray:
+    """
+    Compute last-bar RSI, Bollinger Bands and Z-score for many symbols at once.
+
+    Args:
+        closes: 2-D float32 or float64 array, one symbol per row, histories
+            right-aligned (front-padded when shorter than the row width)
+        lengths: Number of valid closes at the end of each row
+        rsi_n: RSI window length
+        bb_n: Bollinger Band window length
+        bb_std: Standard deviation multiplier for the bands
+        mean_n: Z-score window length
+        wilder: Use Wilder's smoothed RSI over each row's full history instead
+            of the simple-average RSI
+
+    Returns:
+        Array of shape (n_symbols, 5) holding rsi, upper, middle, lower, z_score
+    """
+    n_rows, width = closes.shape
+    out = np.full((n_rows, 5), np.nan)
+    for row in prange(n_rows):
+        close = closes[row, width - lengths[row] :]
+        out[row, 0] = wilder_rsi_last(close, rsi_n) if wilder else rsi_last(close, rsi_n)
+        upper, middle, lower = bb_last(close, bb_n, bb_std)
+        out[row, 1] = upper
+        out[row, 2] = middle
+        out[row, 3] = lower
+        size = close.shape[0]
+        if size >= mean_n > 1:
+            total = 0.0
+            for i in range(size - mean_n, size):
+                total += close[i]
+            mean = total / mean_n
+            m2 = 0.0
+            for i in range(size - mean_n, size):
+                diff = close[i] - mean
+                m2 += diff * diff
+            std = math.sqrt(m2 / (mean_n - 1))
+            out[row, 4] = 0.0 if std == 0 else (close[size - 1] - mean) / std
+    return out
+
+
+def rolling_mean_std(values: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean and sample standard deviation via running sums.
+
+    Window sums of values and squared values are taken as differences of two
+    cumulative sums, so the cost is O(N) regardless of the window length. The
+    values are centred first to keep the sum-of-squares cancellation small.
+
+    Args:
+        values: Input values as a float64 array
+        n: Window length (must be greater than 1)
+
+    Returns:
+        Tuple of (mean, std) arrays, NaN for the first n - 1 elements
+    """
+    size = values.shape[0]
+    mean = np.full(size, np.nan)
+    std = np.full(size, np.nan)
+    if size < n:
+        return mean, std
+
+    offset = values.mean()
+    centred = values - offset
+    csum = np.concatenate(([0.0], np.cumsum(centred)))
+    csum2 = np.concatenate(([0.0], np.cumsum(centred * centred)))
+    window_sum = csum[n:] - csum[:-n]
+    window_sum2 = csum2[n:] - csum2[:-n]
+
+    var = (window_sum2 - window_sum * window_sum / n) / (n - 1)
+    mean[n - 1 :] = window_sum / n + offset
+    std[n - 1 :] = np.sqrt(np.maximum(var, 0.0))
+    return mean, std
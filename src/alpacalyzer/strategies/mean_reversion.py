@@ -5,15 +5,19 @@ Identifies overbought/oversold conditions and trades the expected
 reversion to the mean using RSI, Bollinger Bands, and Z-score.
 """
 
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
+import numpy as np
 import pandas as pd
 
 from alpacalyzer.analysis.technical_analysis import TradingSignals
 from alpacalyzer.strategies.base import BaseStrategy, EntryDecision, ExitDecision, MarketContext
 from alpacalyzer.strategies.config import StrategyConfig
+from alpacalyzer.strategies.indicators import bb_last, last_values_batch, rolling_mean_std, rsi_bb, rsi_last, wilder_rsi, wilder_rsi_last
 from alpacalyzer.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -23,6 +27,20 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Number of DataFrames whose indicator values are kept for reuse between
+# evaluate_entry and evaluate_exit.
+_INDICATOR_CACHE_SIZE = 128
+
+# Close prices fed to the last-bar indicator kernels are stored as float32: the
+# kernels accumulate in float64, and six significant digits are plenty for these
+# signals, so half the memory traffic costs no meaningful precision.
+_KERNEL_DTYPE = np.float32
+
+# Wilder's RSI is recursive, so it is evaluated over this many RSI periods of
+# history; the seed's influence decays by (1 - 1/n) per bar and is negligible
+# well before the window is exhausted.
+_WILDER_WARMUP_PERIODS = 10
+
 
 @dataclass
 class MeanReversionConfig(StrategyConfig):
@@ -31,6 +49,8 @@ class MeanReversionConfig(StrategyConfig):
 
     Attributes:
         rsi_period: RSI calculation period
+        rsi_method: "wilder" for Wilder's smoothed RSI (industry standard) or
+            "sma" for a simple rolling average of gains and losses
         rsi_oversold: RSI threshold for oversold (long entry)
         rsi_overbought: RSI threshold for overbought (short entry)
         rsi_exit_threshold: RSI level to consider normalization
@@ -46,6 +66,7 @@ class MeanReversionConfig(StrategyConfig):
     """
 
     rsi_period: int = 14
+    rsi_method: Literal["sma", "wilder"] = "wilder"
     rsi_oversold: float = 30.0
     rsi_overbought: float = 70.0
     rsi_exit_threshold: float = 50.0
@@ -60,6 +81,110 @@ class MeanReversionConfig(StrategyConfig):
     trend_filter_period: int = 50
 
 
+@dataclass(frozen=True, slots=True)
+class _BonusLadder:
+    """
+    Step function mapping a value to a confidence bonus via one bisect.
+
+    For "below" ladders a value strictly under thresholds[i] earns bonuses[i]
+    (first match wins); "above" ladders mirror this for values strictly over.
+    bonuses has one more entry than thresholds for the no-match case.
+    """
+
+    thresholds: tuple[float, ...]
+    bonuses: tuple[float, ...]
+    below: bool
+
+    def bonus(self, value: float) -> float:
+        if self.below:
+            return self.bonuses[bisect_right(self.thresholds, value)]
+        return self.bonuses[bisect_left(self.thresholds, value)]
+
+
+# condition -> (RSI ladder, Z-score ladder)
+_CONFIDENCE_LADDERS = {
+    "oversold": (
+        _BonusLadder(thresholds=(20.0, 25.0, 30.0), bonuses=(20.0, 15.0, 10.0, 0.0), below=True),
+        _BonusLadder(thresholds=(-3.0, -2.5), bonuses=(15.0, 10.0, 0.0), below=True),
+    ),
+    "overbought": (
+        _BonusLadder(thresholds=(70.0, 75.0, 80.0), bonuses=(0.0, 10.0, 15.0, 20.0), below=False),
+        _BonusLadder(thresholds=(2.5, 3.0), bonuses=(0.0, 10.0, 15.0), below=False),
+    ),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class MeanReversionIndicators:
+    """Latest-bar indicator values shared by entry and exit evaluation."""
+
+    rsi: float
+    bb_upper: float
+    bb_middle: float
+    bb_lower: float
+    z_score: float
+
+
+@dataclass
+class MeanReversionSignal:
+    """Entry setup produced when mean reversion conditions are met."""
+
+    ticker: str
+    side: str
+    price: float
+    stop_loss: float
+    target: float
+    confidence: float
+    reason: str
+
+
+class _CloseRing:
+    """
+    Per-symbol scratch buffer holding the most recent closes contiguously.
+
+    Backed by an array of twice the capacity so appends are amortized O(1) and
+    the live window is always a contiguous view that can go straight into the
+    indicator kernels.
+    """
+
+    __slots__ = ("capacity", "data", "end", "last_ts", "prev_ts")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.data = np.empty(2 * capacity, dtype=_KERNEL_DTYPE)
+        self.end = 0
+        self.last_ts: Any = None
+        self.prev_ts: Any = None
+
+    def load(self, closes: np.ndarray) -> None:
+        n = min(len(closes), self.capacity)
+        self.data[:n] = closes[len(closes) - n :]
+        self.end = n
+
+    def append(self, close: float) -> None:
+        if self.end == len(self.data):
+            keep = self.capacity - 1
+            self.data[:keep] = self.data[self.end - keep : self.end]
+            self.end = keep
+        self.data[self.end] = close
+        self.end += 1
+
+    def view(self) -> np.ndarray:
+        return self.data[max(0, self.end - self.capacity) : self.end]
+
+
+def _window_means(values: np.ndarray, *windows: int) -> tuple[float, ...]:
+    """
+    Means of the trailing `window` values for each window, from one cumulative sum.
+
+    A window longer than values averages everything available, like tail().mean().
+    """
+    n = min(max(windows), len(values))
+    csum = np.cumsum(values[-n:])
+    total = csum[-1]
+    return tuple(float((total - csum[-w - 1]) / w) if w < n else float(total / n) for w in windows)
+
+
 class MeanReversionStrategy(BaseStrategy):
     """
     Mean reversion trading strategy.
@@ -73,6 +198,10 @@ class MeanReversionStrategy(BaseStrategy):
             config = self._default_config()
         self.config = config
         self._entry_times: dict[str, datetime] = {}
+        # (id(df), len(df), last index label) -> (df, indicators). The df is held so
+        # its id cannot be recycled by another frame while the entry is cached.
+        self._indicator_cache: OrderedDict[tuple[int, int, Any], tuple[pd.DataFrame, MeanReversionIndicators]] = OrderedDict()
+        self._close_buf: dict[str, _CloseRing] = {}
 
     @staticmethod
     def _default_config() -> MeanReversionConfig:
@@ -116,29 +245,7 @@ class MeanReversionStrategy(BaseStrategy):
         - Volume spike indicating exhaustion
         - Not in strong uptrend (trend_strength < 0.10)
         """
-        from dataclasses import dataclass
-
-        @dataclass
-        class MeanReversionSignal:
-            ticker: str
-            side: str
-            price: float
-            stop_loss: float
-            target: float
-            confidence: float
-            reason: str
-
-        @dataclass
-        class MeanReversionPosition:
-            symbol: str
-            side: str
-            avg_entry_price: float
-            current_price: float
-            entry_time: datetime | None = None
-            stop_loss: float = 0.0
-            target: float = 0.0
-
-        passed, reason = self._check_basic_filters(signal, context)
+        passed, reason = self._check_basic_filters_cached(signal, context)
         if not passed:
             return EntryDecision(should_enter=False, reason=reason)
 
@@ -160,15 +267,15 @@ class MeanReversionStrategy(BaseStrategy):
 
         price = signal["price"]
 
-        rsi = self._calculate_rsi(df)
-        current_rsi = rsi.iloc[-1]
+        close_arr = df["close"].to_numpy(dtype=np.float64)
+        vol_arr = df["volume"].to_numpy(dtype=np.float64)
 
-        bb_upper, bb_middle, bb_lower = self._calculate_bollinger_bands(df)
-        z_score = self._calculate_z_score(df)
+        indicators = self._compute_indicators(df, signal["symbol"])
+        current_rsi = indicators.rsi
+        z_score = indicators.z_score
 
-        latest = df.iloc[-1]
-        avg_volume = df["volume"].tail(50).mean()
-        current_volume = latest["volume"]
+        avg_volume = vol_arr[-50:].mean()
+        current_volume = vol_arr[-1]
         volume_ratio = current_volume / avg_volume if avg_volume > 0 else 0
 
         if volume_ratio < self.config.min_volume_ratio:
@@ -177,17 +284,16 @@ class MeanReversionStrategy(BaseStrategy):
                 reason=f"Insufficient volume: ratio={volume_ratio:.2f} < {self.config.min_volume_ratio}",
             )
 
-        sma_long = df["close"].tail(self.config.trend_filter_period).mean()
-        sma_short = df["close"].tail(20).mean()
+        sma_long, sma_short = _window_means(close_arr, self.config.trend_filter_period, 20)
         trend_strength = (sma_short - sma_long) / sma_long
 
         should_enter = False
         mr_signal = None
 
-        if current_rsi < self.config.rsi_oversold and price < bb_lower.iloc[-1] and z_score < -self.config.deviation_threshold and trend_strength > -0.10:
-            std = (bb_upper.iloc[-1] - bb_middle.iloc[-1]) / self.config.bb_std
+        if current_rsi < self.config.rsi_oversold and price < indicators.bb_lower and z_score < -self.config.deviation_threshold and trend_strength > -0.10:
+            std = (indicators.bb_upper - indicators.bb_middle) / self.config.bb_std
             stop_loss = price - (std * self.config.stop_loss_std)
-            target = bb_middle.iloc[-1]
+            target = indicators.bb_middle
             confidence = self._calculate_confidence(current_rsi, z_score, "oversold")
 
             # Validate agent recommendation direction matches mean reversion signal
@@ -208,10 +314,10 @@ class MeanReversionStrategy(BaseStrategy):
                 reason=f"Oversold: RSI={current_rsi:.1f}, Z-score={z_score:.2f}, below BB",
             )
 
-        elif current_rsi > self.config.rsi_overbought and price > bb_upper.iloc[-1] and z_score > self.config.deviation_threshold and trend_strength < 0.10:
-            std = (bb_upper.iloc[-1] - bb_middle.iloc[-1]) / self.config.bb_std
+        elif current_rsi > self.config.rsi_overbought and price > indicators.bb_upper and z_score > self.config.deviation_threshold and trend_strength < 0.10:
+            std = (indicators.bb_upper - indicators.bb_middle) / self.config.bb_std
             stop_loss = price + (std * self.config.stop_loss_std)
-            target = bb_middle.iloc[-1]
+            target = indicators.bb_middle
             confidence = self._calculate_confidence(current_rsi, z_score, "overbought")
 
             # Validate agent recommendation direction matches mean reversion signal
@@ -236,7 +342,7 @@ class MeanReversionStrategy(BaseStrategy):
             reasons = []
             if current_rsi >= self.config.rsi_oversold and current_rsi <= self.config.rsi_overbought:
                 reasons.append(f"RSI neutral ({current_rsi:.1f})")
-            if not (price < bb_lower.iloc[-1] or price > bb_upper.iloc[-1]):
+            if not (price < indicators.bb_lower or price > indicators.bb_upper):
                 reasons.append("Price within Bollinger Bands")
             if not (z_score < -self.config.deviation_threshold or z_score > self.config.deviation_threshold):
                 reasons.append(f"Z-score within threshold ({z_score:.2f})")
@@ -275,6 +381,36 @@ class MeanReversionStrategy(BaseStrategy):
             target=mr_signal.target,
         )
 
+    def evaluate_entry_batch(
+        self,
+        signals: list[TradingSignals],
+        context: MarketContext,
+        agent_recommendations: "dict[str, TradingStrategy] | None" = None,
+    ) -> list[EntryDecision]:
+        """
+        Evaluate entry for a universe of signals sharing one market context.
+
+        Indicators for all symbols are computed with a single parallel kernel call
+        before each signal goes through evaluate_entry, which then hits the
+        indicator cache instead of running the kernels per symbol.
+
+        Args:
+            signals: TradingSignals for each candidate symbol
+            context: Market and account context for this tick
+            agent_recommendations: Optional agent recommendations keyed by symbol
+
+        Returns:
+            One EntryDecision per signal, in input order
+        """
+        recommendations = agent_recommendations or {}
+        decisions: list[EntryDecision] = []
+        # Chunk so precomputed entries are not evicted before they are consumed
+        for start in range(0, len(signals), _INDICATOR_CACHE_SIZE):
+            chunk = signals[start : start + _INDICATOR_CACHE_SIZE]
+            self._precompute_indicators(chunk)
+            decisions.extend(self.evaluate_entry(signal, context, recommendations.get(signal["symbol"])) for signal in chunk)
+        return decisions
+
     def evaluate_exit(
         self,
         position: "Position",
@@ -296,11 +432,10 @@ class MeanReversionStrategy(BaseStrategy):
         position_side = getattr(position, "side", "long")
         avg_entry_price = float(getattr(position, "avg_entry_price", 0))
 
-        bb_upper, bb_middle, bb_lower = self._calculate_bollinger_bands(df)
-        rsi = self._calculate_rsi(df)
-        current_rsi = rsi.iloc[-1]
+        indicators = self._compute_indicators(df, getattr(position, "symbol", None) or getattr(position, "ticker", None))
+        current_rsi = indicators.rsi
 
-        bb_std = (bb_upper.iloc[-1] - bb_middle.iloc[-1]) / self.config.bb_std
+        bb_std = (indicators.bb_upper - indicators.bb_middle) / self.config.bb_std
 
         stop_loss_long = avg_entry_price - (bb_std * self.config.stop_loss_std)
         stop_loss_short = avg_entry_price + (bb_std * self.config.stop_loss_std)
@@ -319,7 +454,7 @@ class MeanReversionStrategy(BaseStrategy):
                 urgency="immediate",
             )
 
-        target = bb_middle.iloc[-1]
+        target = indicators.bb_middle
 
         if position_side == "long" and price >= target:
             return ExitDecision(
@@ -347,68 +482,192 @@ class MeanReversionStrategy(BaseStrategy):
 
         return ExitDecision(should_exit=False, reason="Exit conditions not met")
 
-    def _calculate_rsi(self, df: pd.DataFrame) -> pd.Series:
-        """Calculate Relative Strength Index."""
-        delta = df["close"].diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
+    def _compute_indicators(self, df: pd.DataFrame, symbol: str | None = None) -> MeanReversionIndicators:
+        """
+        Return RSI, Bollinger Band and Z-score values for the last bar of df.
 
-        avg_gain = gain.rolling(window=self.config.rsi_period).mean()
-        avg_loss = loss.rolling(window=self.config.rsi_period).mean()
+        Results are memoized per DataFrame so that entry and exit evaluation of the
+        same signal run the rolling computations only once. When the symbol is
+        known, closes come from its reusable scratch buffer.
+        """
+        key = (id(df), len(df), df.index[-1])
+        cached = self._indicator_cache.get(key)
+        if cached is not None and cached[0] is df:
+            self._indicator_cache.move_to_end(key)
+            return cached[1]
+
+        # Only the last bar is consumed, so the kernels run over the shortest tail
+        # that still fills the RSI, Bollinger and Z-score windows.
+        if symbol is not None:
+            closes = self._symbol_closes(symbol, df)
+        else:
+            closes = df["close"].to_numpy()[-self._close_window() :].astype(_KERNEL_DTYPE)
+        bb_closes = closes[-self.config.bb_period :]
+        bb_upper, bb_middle, bb_lower = self._bb_last(bb_closes)
+        indicators = MeanReversionIndicators(
+            rsi=self._rsi_last(closes),
+            bb_upper=bb_upper,
+            bb_middle=bb_middle,
+            bb_lower=bb_lower,
+            z_score=self._z_score_from_bands(closes, bb_upper, bb_middle),
+        )
 
-        rs = avg_gain / avg_loss
-        return 100 - (100 / (1 + rs))
+        self._cache_indicators(df, indicators)
+        return indicators
 
-    def _calculate_bollinger_bands(self, df: pd.DataFrame) -> tuple[pd.Series, pd.Series, pd.Series]:
-        """Calculate Bollinger Bands."""
-        middle = df["close"].rolling(window=self.config.bb_period).mean()
-        std = df["close"].rolling(window=self.config.bb_period).std()
+    def _cache_indicators(self, df: pd.DataFrame, indicators: MeanReversionIndicators) -> None:
+        """Store indicators for df, evicting the least recently used entry when full."""
+        self._indicator_cache[(id(df), len(df), df.index[-1])] = (df, indicators)
+        if len(self._indicator_cache) > _INDICATOR_CACHE_SIZE:
+            self._indicator_cache.popitem(last=False)
+
+    def _precompute_indicators(self, signals: list[TradingSignals]) -> None:
+        """
+        Compute last-bar indicators for many signals in one batched kernel call.
+
+        Close windows are stacked into a right-aligned 2-D array and evaluated with
+        last_values_batch; the results seed the per-DataFrame indicator cache.
+        """
+        window = self._close_window()
+        frames: list[pd.DataFrame] = []
+        rows: list[np.ndarray] = []
+        for signal in signals:
+            df = signal.get("raw_data_daily")
+            if isinstance(df, pd.DataFrame) and len(df) > 0:
+                frames.append(df)
+                rows.append(self._symbol_closes(signal["symbol"], df))
+        if not frames:
+            return
+
+        closes = np.full((len(rows), window), np.nan, dtype=_KERNEL_DTYPE)
+        lengths = np.empty(len(rows), dtype=np.int64)
+        for i, row in enumerate(rows):
+            closes[i, window - len(row) :] = row
+            lengths[i] = len(row)
+
+        values = last_values_batch(
+            closes,
+            lengths,
+            self.config.rsi_period,
+            self.config.bb_period,
+            self.config.bb_std,
+            self.config.mean_period,
+            self.config.rsi_method == "wilder",
+        )
+        for df, (rsi, bb_upper, bb_middle, bb_lower, z_score) in zip(frames, values.tolist(), strict=True):
+            self._cache_indicators(
+                df,
+                MeanReversionIndicators(rsi=rsi, bb_upper=bb_upper, bb_middle=bb_middle, bb_lower=bb_lower, z_score=z_score),
+            )
+
+    def _rsi_bb(self, closes: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Run the compiled RSI/Bollinger Band kernel over close prices."""
+        return rsi_bb(closes, self.config.rsi_period, self.config.bb_period, self.config.bb_std)
+
+    def _close_window(self) -> int:
+        """Number of trailing closes needed for last-bar RSI, Bollinger and Z-score values."""
+        return max(self._rsi_window(), self.config.bb_period, self.config.mean_period)
+
+    def _rsi_window(self) -> int:
+        """Number of trailing closes the configured RSI method reads."""
+        if self.config.rsi_method == "wilder":
+            return self.config.rsi_period * _WILDER_WARMUP_PERIODS + 1
+        return self.config.rsi_period + 1
+
+    def _symbol_closes(self, symbol: str, df: pd.DataFrame) -> np.ndarray:
+        """
+        Return the symbol's recent closes from its scratch buffer.
 
-        upper = middle + (std * self.config.bb_std)
-        lower = middle - (std * self.config.bb_std)
+        When df carries a timestamp column, a refreshed last bar is written in
+        place and a single new bar is appended; anything else (gaps, revised
+        history, frames without timestamps) reloads the window from df.
+        """
+        ring = self._close_buf.get(symbol)
+        if ring is None:
+            ring = self._close_buf[symbol] = _CloseRing(self._close_window())
+
+        close_col = df["close"]
+        if "timestamp" in df.columns and len(df) >= 2 and ring.end >= 2:
+            timestamps = df["timestamp"]
+            last_ts = timestamps.iat[-1]
+            prev_ts = timestamps.iat[-2]
+            prev_close = float(close_col.iat[-2])
+            window = ring.view()
+            if last_ts == ring.last_ts and prev_ts == ring.prev_ts and prev_close == window[-2]:
+                window[-1] = close_col.iat[-1]
+                return window
+            if prev_ts == ring.last_ts and last_ts != prev_ts and prev_close == window[-1]:
+                ring.append(float(close_col.iat[-1]))
+                ring.prev_ts, ring.last_ts = prev_ts, last_ts
+                return ring.view()
+
+        ring.load(close_col.to_numpy())
+        if "timestamp" in df.columns and len(df) >= 2:
+            ring.prev_ts, ring.last_ts = df["timestamp"].iat[-2], df["timestamp"].iat[-1]
+        else:
+            ring.prev_ts = ring.last_ts = None
+        return ring.view()
+
+    def _rsi_last(self, closes: np.ndarray) -> float:
+        """Calculate RSI for the last bar of closes using the configured method."""
+        closes = closes[-self._rsi_window() :]
+        if self.config.rsi_method == "wilder":
+            return float(wilder_rsi_last(closes, self.config.rsi_period))
+        return float(rsi_last(closes, self.config.rsi_period))
 
-        return upper, middle, lower
+    def _bb_last(self, closes: np.ndarray) -> tuple[float, float, float]:
+        """Calculate (upper, middle, lower) Bollinger Bands for the last bar of closes."""
+        upper, middle, lower = bb_last(closes, self.config.bb_period, self.config.bb_std)
+        return float(upper), float(middle), float(lower)
+
+    def _calculate_rsi(self, df: pd.DataFrame) -> pd.Series:
+        """Calculate Relative Strength Index using the configured method."""
+        if self.config.rsi_method == "wilder":
+            return pd.Series(wilder_rsi(df["close"].to_numpy(dtype=np.float64), self.config.rsi_period), index=df.index)
+        rsi, _, _, _ = self._rsi_bb(df["close"].to_numpy(dtype=np.float64))
+        return pd.Series(rsi, index=df.index)
+
+    def _calculate_bollinger_bands(self, df: pd.DataFrame) -> tuple[pd.Series, pd.Series, pd.Series]:
+        """Calculate Bollinger Bands."""
+        middle, std = rolling_mean_std(df["close"].to_numpy(dtype=np.float64), self.config.bb_period)
+        band = std * self.config.bb_std
+        return pd.Series(middle + band, index=df.index), pd.Series(middle, index=df.index), pd.Series(middle - band, index=df.index)
 
     def _calculate_z_score(self, df: pd.DataFrame) -> float:
         """Calculate Z-score of current price from mean."""
-        mean = df["close"].tail(self.config.mean_period).mean()
-        std = df["close"].tail(self.config.mean_period).std()
+        return self._z_score_last(df["close"].to_numpy(dtype=np.float64))
 
-        if std == 0:
-            return 0.0
+    def _z_score_from_bands(self, close_arr: np.ndarray, bb_upper: float, bb_middle: float) -> float:
+        """
+        Z-score of the last close, derived from the Bollinger Bands when possible.
 
-        return (df.iloc[-1]["close"] - mean) / std
+        With mean_period == bb_period the band middle and half-width already hold
+        the window mean and bb_std * std, so no second pass over the window is
+        needed. Otherwise the Z-score is computed separately.
+        """
+        if self.config.mean_period != self.config.bb_period or self.config.bb_std <= 0:
+            return self._z_score_last(close_arr)
 
-    def _calculate_confidence(self, rsi: float, z_score: float, condition: str) -> float:
-        """Calculate confidence score."""
-        confidence = 50.0
+        band = bb_upper - bb_middle
+        if band == 0:
+            return 0.0
 
-        if condition == "oversold":
-            if rsi < 20:
-                confidence += 20
-            elif rsi < 25:
-                confidence += 15
-            elif rsi < 30:
-                confidence += 10
+        return float((close_arr[-1] - bb_middle) * self.config.bb_std / band)
 
-            if z_score < -3:
-                confidence += 15
-            elif z_score < -2.5:
-                confidence += 10
+    def _z_score_last(self, close_arr: np.ndarray) -> float:
+        """Calculate Z-score of the last close from the mean_period mean."""
+        window = close_arr[-self.config.mean_period :]
+        std = window.std(ddof=1, dtype=np.float64)
 
-        else:
-            if rsi > 80:
-                confidence += 20
-            elif rsi > 75:
-                confidence += 15
-            elif rsi > 70:
-                confidence += 10
-
-            if z_score > 3:
-                confidence += 15
-            elif z_score > 2.5:
-                confidence += 10
+        if std == 0:
+            return 0.0
+
+        return float((close_arr[-1] - window.mean(dtype=np.float64)) / std)
 
+    def _calculate_confidence(self, rsi: float, z_score: float, condition: str) -> float:
+        """Calculate confidence score."""
+        rsi_ladder, z_ladder = _CONFIDENCE_LADDERS["oversold" if condition == "oversold" else "overbought"]
+        confidence = 50.0 + rsi_ladder.bonus(rsi) + z_ladder.bonus(z_score)
         return min(confidence, 95.0)
 
     def to_dict(self) -> dict[str, Any]:
@@ -6,8 +6,13 @@ in trader.py, implements fuzzy logic entry evaluation with
 technical confirmation.
 """
 
-from typing import TYPE_CHECKING, cast
+import logging
+from collections.abc import Iterator
+from enum import IntFlag
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 from alpaca.trading.enums import OrderSide
 
@@ -22,6 +27,36 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Columns read from the last three candles when evaluating entries
+_DAILY_COLUMNS = ("RSI", "SMA_20", "SMA_50")
+
+# Entry condition names in evaluation order (cheap scalar checks first)
+_LONG_CONDITIONS = ("RSI_OVERSOLD", "ABOVE_MOVING_AVERAGE_20", "ABOVE_MOVING_AVERAGE_50", "BULLISH_ENGULFING", "HAMMER", "DOJI")
+_SHORT_CONDITIONS = ("RSI_OVERBOUGHT", "BELOW_MOVING_AVERAGE_20", "BELOW_MOVING_AVERAGE_50", "BEARISH_ENGULFING", "SHOOTING_STAR", "DOJI")
+
+
+class ExitCode(IntFlag):
+    """Categories of dynamic exit signals, combined as a bitmask."""
+
+    NONE = 0
+    CATASTROPHIC = 1
+    MOMENTUM = 2
+    TECH = 4
+
+
+def _tail_means(df: pd.DataFrame, columns: tuple[str, ...], n: int = 3) -> dict[str, float]:
+    """
+    Average the last n rows of the given columns, skipping NaN like pandas.
+
+    Only the requested columns are touched, so no intermediate Series is built
+    over the whole frame.
+    """
+    tail = np.array([df[column].to_numpy(dtype=np.float64)[-n:] for column in columns])
+    counts = np.count_nonzero(~np.isnan(tail), axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = np.nansum(tail, axis=1) / counts
+    return dict(zip(columns, means.tolist(), strict=True))
+
 
 class MomentumStrategy(BaseStrategy):
     """
@@ -37,7 +72,12 @@ class MomentumStrategy(BaseStrategy):
         if config is None:
             config = self._default_config()
         self.config = config
-        self.ta = TechnicalAnalyzer()
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_ta() -> TechnicalAnalyzer:
+        """Shared TechnicalAnalyzer, created on first use and reused by every instance."""
+        return TechnicalAnalyzer()
 
     @staticmethod
     def _default_config() -> StrategyConfig:
@@ -72,7 +112,7 @@ class MomentumStrategy(BaseStrategy):
         provides trade setup (entry, stop loss, target, quantity).
         """
         # Check basic filters (market open, cooldown, existing position)
-        passed, reason = self._check_basic_filters(signal, context)
+        passed, reason = self._check_basic_filters_cached(signal, context)
         if not passed:
             return EntryDecision(should_enter=False, reason=reason)
 
@@ -94,7 +134,7 @@ class MomentumStrategy(BaseStrategy):
         conditions_met = conditions_ratio >= self.config.entry_conditions_ratio
 
         logger.info(f"Entry conditions for {signal['symbol']}: {conditions_met_count}/{total_conditions} met ({conditions_ratio:.1%})")
-        if failed_conditions:
+        if failed_conditions and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Failed conditions: {', '.join(failed_conditions)}")
         logger.info(f"Entry conditions met for {signal['symbol']}: {conditions_met}")
 
@@ -121,119 +161,86 @@ class MomentumStrategy(BaseStrategy):
         """
         Generate and evaluate entry criteria based on trade type.
 
+        Conditions are evaluated cheapest-first and evaluation stops as soon as
+        the fuzzy threshold can no longer be reached; the remaining conditions
+        are then reported as failed without being computed.
+
         Returns:
             Tuple of (conditions_met_count, total_conditions, failed_conditions_list)
         """
-        # Get 3-candle averages for consistency
-        daily_data = signal["raw_data_daily"]
+        # Get 3-candle averages for consistency, reading only the columns used below
+        daily_3candle = _tail_means(signal["raw_data_daily"], _DAILY_COLUMNS)
         intraday_data = signal["raw_data_intraday"]
 
-        daily_3candle = cast(pd.Series, daily_data.iloc[-3:].select_dtypes(include="number").mean())
-        intraday_3candle = cast(pd.Series, intraday_data.iloc[-3:].select_dtypes(include="number").mean())
-
         price = signal["price"]
         rsi = daily_3candle["RSI"]
         sma20 = daily_3candle["SMA_20"]
         sma50 = daily_3candle["SMA_50"]
 
-        # Generate applicable conditions based on trade type
-        conditions_met_count = 0
-        failed_conditions = []
-
         # Define which conditions to check based on trade type
         if is_long:
-            # Long entry conditions
-            conditions_to_check = self._get_long_entry_conditions(price, rsi, sma20, sma50, intraday_3candle)
+            condition_names = _LONG_CONDITIONS
+            conditions_to_check = self._get_long_entry_conditions(price, rsi, sma20, sma50, intraday_data)
         else:
-            # Short entry conditions
-            conditions_to_check = self._get_short_entry_conditions(price, rsi, sma20, sma50, intraday_3candle)
+            condition_names = _SHORT_CONDITIONS
+            conditions_to_check = self._get_short_entry_conditions(price, rsi, sma20, sma50, intraday_data)
 
-        # Evaluate each condition
-        for condition_name, condition_met in conditions_to_check.items():
+        total_conditions = len(condition_names)
+        required = self._required_conditions(total_conditions)
+
+        # Evaluate each condition, stopping once the threshold is out of reach
+        conditions_met_count = 0
+        failed_conditions = []
+        for evaluated, (condition_name, condition_met) in enumerate(conditions_to_check, start=1):
             if condition_met:
                 conditions_met_count += 1
             else:
                 failed_conditions.append(condition_name)
+            if conditions_met_count + (total_conditions - evaluated) < required:
+                failed_conditions.extend(condition_names[evaluated:])
+                break
 
-        return conditions_met_count, len(conditions_to_check), failed_conditions
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Entry criteria inputs for {signal['symbol']}: price={price}, rsi={rsi}, sma20={sma20}, sma50={sma50}")
 
-    def _get_long_entry_conditions(self, price: float, rsi: float, sma20: float, sma50: float, intraday_3candle: pd.Series) -> dict[str, bool]:
-        """Get and evaluate long entry conditions."""
-        conditions = {}
+        return conditions_met_count, total_conditions, failed_conditions
 
-        # RSI oversold check (RSI < 30)
-        conditions["RSI_OVERSOLD"] = rsi < 30
-        if not conditions["RSI_OVERSOLD"]:
-            logger.debug(f"RSI oversold: {rsi} > 30")
-
-        # Price above SMA20
-        conditions["ABOVE_MOVING_AVERAGE_20"] = price >= sma20
-        if not conditions["ABOVE_MOVING_AVERAGE_20"]:
-            logger.debug(f"Price above SMA20: {price} < {sma20}")
-
-        # Price above SMA50
-        conditions["ABOVE_MOVING_AVERAGE_50"] = price >= sma50
-        if not conditions["ABOVE_MOVING_AVERAGE_50"]:
-            logger.debug(f"Price above SMA50: {price} < {sma50}")
-
-        # Bullish Engulfing pattern
-        bullish_engulfing_conf = intraday_3candle["Bullish_Engulfing"]
-        conditions["BULLISH_ENGULFING"] = bullish_engulfing_conf >= self.config.candlestick_pattern_confidence
-        if not conditions["BULLISH_ENGULFING"]:
-            logger.debug(f"Bullish Engulfing not detected (confidence: {bullish_engulfing_conf:.1f})")
-
-        # Hammer pattern
-        hammer_conf = intraday_3candle["Hammer"]
-        conditions["HAMMER"] = hammer_conf >= self.config.candlestick_pattern_confidence
-        if not conditions["HAMMER"]:
-            logger.debug(f"Hammer not detected (confidence: {hammer_conf:.1f})")
-
-        # Doji pattern
-        doji_conf = intraday_3candle["Doji"]
-        conditions["DOJI"] = doji_conf >= self.config.candlestick_pattern_confidence
-        if not conditions["DOJI"]:
-            logger.debug(f"Doji not detected (confidence: {doji_conf:.1f})")
-
-        return conditions
-
-    def _get_short_entry_conditions(self, price: float, rsi: float, sma20: float, sma50: float, intraday_3candle: pd.Series) -> dict[str, bool]:
-        """Get and evaluate short entry conditions."""
-        conditions = {}
+    def _required_conditions(self, total_conditions: int) -> int:
+        """Smallest number of met conditions whose ratio satisfies entry_conditions_ratio."""
+        for count in range(total_conditions + 1):
+            if count / total_conditions >= self.config.entry_conditions_ratio:
+                return count
+        return total_conditions + 1
+
+    def _pattern_confidence(self, intraday_data: pd.DataFrame, column: str) -> float:
+        """3-candle average confidence of a single candlestick pattern column."""
+        return _tail_means(intraday_data, (column,))[column]
 
+    def _get_long_entry_conditions(self, price: float, rsi: float, sma20: float, sma50: float, intraday_data: pd.DataFrame) -> Iterator[tuple[str, bool]]:
+        """Lazily evaluate long entry conditions, cheapest first."""
+        # RSI oversold check (RSI < 30)
+        yield "RSI_OVERSOLD", rsi < 30
+        # Price above SMA20 / SMA50
+        yield "ABOVE_MOVING_AVERAGE_20", price >= sma20
+        yield "ABOVE_MOVING_AVERAGE_50", price >= sma50
+        # Candlestick patterns (column reads)
+        pattern_confidence = self.config.candlestick_pattern_confidence
+        yield "BULLISH_ENGULFING", self._pattern_confidence(intraday_data, "Bullish_Engulfing") >= pattern_confidence
+        yield "HAMMER", self._pattern_confidence(intraday_data, "Hammer") >= pattern_confidence
+        yield "DOJI", self._pattern_confidence(intraday_data, "Doji") >= pattern_confidence
+
+    def _get_short_entry_conditions(self, price: float, rsi: float, sma20: float, sma50: float, intraday_data: pd.DataFrame) -> Iterator[tuple[str, bool]]:
+        """Lazily evaluate short entry conditions, cheapest first."""
         # RSI overbought check (RSI > 70)
-        conditions["RSI_OVERBOUGHT"] = rsi > 70
-        if not conditions["RSI_OVERBOUGHT"]:
-            logger.debug(f"RSI overbought: {rsi} < 70")
-
-        # Price below SMA20
-        conditions["BELOW_MOVING_AVERAGE_20"] = price <= sma20
-        if not conditions["BELOW_MOVING_AVERAGE_20"]:
-            logger.debug(f"Price below SMA20: {price} > {sma20}")
-
-        # Price below SMA50
-        conditions["BELOW_MOVING_AVERAGE_50"] = price <= sma50
-        if not conditions["BELOW_MOVING_AVERAGE_50"]:
-            logger.debug(f"Price below SMA50: {price} > {sma50}")
-
-        # Bearish Engulfing pattern
-        bearish_engulfing_conf = intraday_3candle["Bearish_Engulfing"]
-        conditions["BEARISH_ENGULFING"] = bearish_engulfing_conf <= -self.config.candlestick_pattern_confidence
-        if not conditions["BEARISH_ENGULFING"]:
-            logger.debug(f"Bearish Engulfing not detected (confidence: {bearish_engulfing_conf:.1f})")
-
-        # Shooting Star pattern
-        shooting_star_conf = intraday_3candle["Shooting_Star"]
-        conditions["SHOOTING_STAR"] = shooting_star_conf >= self.config.candlestick_pattern_confidence
-        if not conditions["SHOOTING_STAR"]:
-            logger.debug(f"Shooting Star not detected (confidence: {shooting_star_conf:.1f})")
-
-        # Doji pattern (also works for shorts)
-        doji_conf = intraday_3candle["Doji"]
-        conditions["DOJI"] = doji_conf >= self.config.candlestick_pattern_confidence
-        if not conditions["DOJI"]:
-            logger.debug(f"Doji not detected (confidence: {doji_conf:.1f})")
-
-        return conditions
+        yield "RSI_OVERBOUGHT", rsi > 70
+        # Price below SMA20 / SMA50
+        yield "BELOW_MOVING_AVERAGE_20", price <= sma20
+        yield "BELOW_MOVING_AVERAGE_50", price <= sma50
+        # Candlestick patterns (column reads); Doji also works for shorts
+        pattern_confidence = self.config.candlestick_pattern_confidence
+        yield "BEARISH_ENGULFING", self._pattern_confidence(intraday_data, "Bearish_Engulfing") <= -pattern_confidence
+        yield "SHOOTING_STAR", self._pattern_confidence(intraday_data, "Shooting_Star") >= pattern_confidence
+        yield "DOJI", self._pattern_confidence(intraday_data, "Doji") >= pattern_confidence
 
     def evaluate_exit(
         self,
@@ -269,52 +276,67 @@ class MomentumStrategy(BaseStrategy):
         unrealized_plpc = float(getattr(position, "unrealized_plpc", None) or getattr(position, "unrealized_pnl_pct", None) or 0.0)
         is_profitable = unrealized_plpc > 0
 
-        exit_signals = []
+        exit_codes = ExitCode.NONE
+        exit_signals: list[str] = []
 
         if is_profitable:
             # Let Winners Run - only exit on major reversal
             if is_long:
                 if momentum < self.config.exit_momentum_threshold:
+                    exit_codes |= ExitCode.MOMENTUM
                     exit_signals.append(f"Major momentum reversal: {momentum:.1f}% drop")
                 if score < self.config.exit_score_threshold:
+                    exit_codes |= ExitCode.TECH
                     exit_signals.append(f"Technical score collapse: {score:.2f}")
             else:  # is_short
                 if momentum > -self.config.exit_momentum_threshold:
+                    exit_codes |= ExitCode.MOMENTUM
                     exit_signals.append(f"Major momentum reversal: {momentum:.1f}% rise")
                 if score > 0.8:
+                    exit_codes |= ExitCode.TECH
                     exit_signals.append(f"Technical score collapse for short: {score:.2f}")
 
         else:
             # Cut Losses on Clear Signals
             if is_long:
-                weak_tech_signals = self.ta.weak_technicals(signal["signals"], OrderSide.BUY)
+                # Technical weakness only matters once momentum or score has degraded
+                needs_tech = momentum < self.config.exit_momentum_threshold or score < self.config.exit_score_threshold
+                weak_tech_signals = needs_tech and self._get_ta().weak_technicals(signal["signals"], OrderSide.BUY, signal.get("signals_mask"))
 
                 # Require BOTH momentum degradation AND technical weakness
                 if momentum < self.config.exit_momentum_threshold and weak_tech_signals:
+                    exit_codes |= ExitCode.MOMENTUM
                     exit_signals.append(f"Strong momentum drop: {momentum:.1f}% with weak technicals")
                 # OR severe technical collapse alone
                 elif score < self.config.exit_score_threshold and weak_tech_signals:
+                    exit_codes |= ExitCode.TECH
                     exit_signals.append(f"Technical score collapse: {score:.2f} with weak technicals")
                 # OR catastrophic momentum without needing technical confirmation
                 elif momentum < self.config.catastrophic_momentum:
+                    exit_codes |= ExitCode.CATASTROPHIC
                     exit_signals.append(f"Catastrophic momentum drop: {momentum:.1f}%")
 
             else:  # is_short
-                weak_tech_signals = self.ta.weak_technicals(signal["signals"], OrderSide.SELL)
+                needs_tech = momentum > -self.config.exit_momentum_threshold or score > 0.7
+                weak_tech_signals = needs_tech and self._get_ta().weak_technicals(signal["signals"], OrderSide.SELL, signal.get("signals_mask"))
 
                 if momentum > -self.config.exit_momentum_threshold and weak_tech_signals:
+                    exit_codes |= ExitCode.MOMENTUM
                     exit_signals.append(f"Strong momentum rise: {momentum:.1f}% with weak technicals")
                 elif score > 0.7 and weak_tech_signals:
+                    exit_codes |= ExitCode.TECH
                     exit_signals.append(f"Technical score strength: {score:.2f} with weak technicals")
                 elif momentum > -self.config.catastrophic_momentum:
+                    exit_codes |= ExitCode.CATASTROPHIC
                     exit_signals.append(f"Catastrophic momentum rise: {momentum:.1f}%")
 
         if exit_signals:
             reason_str = ", ".join(exit_signals)
-            urgency = self._determine_exit_urgency(exit_signals)
+            urgency = self._determine_exit_urgency(exit_codes)
             symbol = getattr(position, "symbol", None) or getattr(position, "ticker", "?")
             logger.info(f"\nDYNAMIC EXIT FOR {symbol} due to: {reason_str}")
-            logger.debug(f"Position details: {position}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Position details: {position}")
             if unrealized_plpc < 0:
                 logger.info(f"LOSS: {unrealized_plpc:.2%} P&L on trade")
             else:
@@ -323,11 +345,24 @@ class MomentumStrategy(BaseStrategy):
 
         return ExitDecision(should_exit=False, reason="Exit conditions not met")
 
-    def _determine_exit_urgency(self, exit_signals: list[str]) -> str:
-        """Determine exit urgency based on exit reasons."""
-        for signal in exit_signals:
-            if "Catastrophic" in signal:
-                return "immediate"
-            if "momentum" in signal.lower():
-                return "urgent"
+    def _determine_exit_urgency(self, exit_codes: ExitCode | list[str]) -> str:
+        """
+        Determine exit urgency based on exit reasons.
+
+        Accepts the ExitCode bitmask built by evaluate_exit. A list of reason
+        strings is still accepted for backwards compatibility and is scanned
+        the old way; prefer passing ExitCode.
+        """
+        if isinstance(exit_codes, list):
+            for signal in exit_codes:
+                if "Catastrophic" in signal:
+                    return "immediate"
+                if "momentum" in signal.lower():
+                    return "urgent"
+            return "normal"
+
+        if exit_codes & ExitCode.CATASTROPHIC:
+            return "immediate"
+        if exit_codes & ExitCode.MOMENTUM:
+            return "urgent"
         return "normal"
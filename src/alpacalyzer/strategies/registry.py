@@ -32,6 +32,8 @@ class StrategyRegistry:
     - _instances: Caches singleton instances for strategies without custom configs
     - _default_configs: Stores default configs for each strategy
 
+    The sorted list of names is cached in _sorted_names and reset by register().
+
     Example:
         >>> StrategyRegistry.register("momentum", MomentumStrategy)
         >>> strategy = StrategyRegistry.get("momentum")
@@ -41,6 +43,7 @@ class StrategyRegistry:
     _strategies: dict[str, type[Strategy]] = {}
     _instances: dict[str, Strategy] = {}
     _default_configs: dict[str, StrategyConfig] = {}
+    _sorted_names: tuple[str, ...] | None = None
 
     @classmethod
     def register(
@@ -62,6 +65,9 @@ class StrategyRegistry:
             >>> StrategyRegistry.register("momentum", MomentumStrategy, config)
         """
         cls._strategies[name] = strategy_class
+        cls._sorted_names = None
+        # Drop any instance cached for a previously registered class under this name
+        cls._instances.pop(name, None)
         if default_config:
             cls._default_configs[name] = default_config
 
@@ -70,8 +76,9 @@ class StrategyRegistry:
         """
         Get or create a strategy instance.
 
-        If no custom config is provided, returns a cached singleton instance.
-        Otherwise, creates a new instance with the provided config.
+        If no custom config is provided, returns a cached singleton instance
+        (see get_default). Otherwise, creates a new instance with the provided
+        config (see get_with_config).
 
         Args:
             name: Name of the registered strategy
@@ -91,23 +98,59 @@ class StrategyRegistry:
             >>> custom_config = StrategyConfig(stop_loss_pct=0.10)
             >>> strategy = StrategyRegistry.get("momentum", config=custom_config)
         """
-        if name not in cls._strategies:
-            raise ValueError(f"Unknown strategy: {name}. Available: {cls.list_strategies()}")
+        if config is None:
+            return cls.get_default(name)
+        return cls.get_with_config(name, config)
 
-        # Return cached instance if no custom config
-        if config is None and name in cls._instances:
-            return cls._instances[name]
+    @classmethod
+    def get_default(cls, name: str) -> Strategy:
+        """
+        Get the cached strategy instance built with its default config.
 
-        # Create new instance
-        use_config = config or cls._default_configs.get(name)
-        instance = cls._strategies[name](use_config)
+        This is the hot path for callers that never pass a custom config: a
+        warm cache costs a single dictionary lookup.
 
-        # Cache instance if no custom config was provided
-        if config is None:
-            cls._instances[name] = instance
+        Args:
+            name: Name of the registered strategy
 
+        Returns:
+            Cached strategy instance
+
+        Raises:
+            ValueError: If strategy name is not registered
+        """
+        instance = cls._instances.get(name)
+        if instance is not None:
+            return instance
+
+        strategy_class = cls._strategies.get(name)
+        if strategy_class is None:
+            raise ValueError(f"Unknown strategy: {name}. Available: {cls.list_strategies()}")
+
+        instance = strategy_class(cls._default_configs.get(name))
+        cls._instances[name] = instance
         return instance
 
+    @classmethod
+    def get_with_config(cls, name: str, config: StrategyConfig) -> Strategy:
+        """
+        Create a new, uncached strategy instance with a custom config.
+
+        Args:
+            name: Name of the registered strategy
+            config: Custom configuration for the instance
+
+        Returns:
+            New strategy instance
+
+        Raises:
+            ValueError: If strategy name is not registered
+        """
+        strategy_class = cls._strategies.get(name)
+        if strategy_class is None:
+            raise ValueError(f"Unknown strategy: {name}. Available: {cls.list_strategies()}")
+        return strategy_class(config)
+
     @classmethod
     def list_strategies(cls) -> list[str]:
         """
@@ -116,7 +159,10 @@ class StrategyRegistry:
         Returns:
             List of strategy names in registration order (sorted for consistency)
         """
-        return sorted(cls._strategies.keys())
+        names = cls._sorted_names
+        if names is None:
+            names = cls._sorted_names = tuple(sorted(cls._strategies))
+        return list(names)
 
     @classmethod
     def get_default_config(cls, name: str) -> StrategyConfig | None:
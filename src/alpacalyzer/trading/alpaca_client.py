@@ -1,20 +1,30 @@
+import asyncio
+import itertools
+import logging
 import os
-from datetime import UTC, datetime, timedelta
-from typing import cast
+import time
+from collections.abc import Mapping
+from datetime import UTC, date, datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
+from alpaca.common.rest import RESTClient
 from alpaca.data.enums import Adjustment
 from alpaca.data.historical import StockHistoricalDataClient
-from alpaca.data.models import Bar, BarSet
+from alpaca.data.models import Bar, BarSet, Trade
 from alpaca.data.requests import StockBarsRequest, StockLatestBarRequest, StockLatestTradeRequest
 from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
 from alpaca.trading.client import TradingClient
 from alpaca.trading.enums import OrderSide
-from alpaca.trading.models import Calendar, Clock, Order, Position, TradeAccount, TradeUpdate
+from alpaca.trading.models import Calendar, Order, Position, TradeAccount, TradeUpdate
 from alpaca.trading.requests import GetCalendarRequest
 from alpaca.trading.stream import TradingStream
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from alpacalyzer.events import (
     OrderCanceledEvent,
@@ -37,73 +47,141 @@ ALPACA_SECRET_KEY = os.getenv("ALPACA_SECRET_KEY", "test")
 # Initialize Alpaca TradingClient (Set paper=True for paper trading)
 trading_client = TradingClient(ALPACA_API_KEY, ALPACA_SECRET_KEY, paper=True)
 history_client = StockHistoricalDataClient(ALPACA_API_KEY, ALPACA_SECRET_KEY)
-trading_stream = TradingStream(ALPACA_API_KEY, ALPACA_SECRET_KEY, paper=True)
+# Ping every 10s and treat 20s without a pong as a dead socket (the SDK default waits 180s),
+# so a silently dropped stream falls into the SDK's reconnect-with-backoff loop quickly
+_STREAM_WEBSOCKET_PARAMS = {"ping_interval": 10, "ping_timeout": 20, "max_queue": 1024}
+trading_stream = TradingStream(ALPACA_API_KEY, ALPACA_SECRET_KEY, paper=True, websocket_params=_STREAM_WEBSOCKET_PARAMS)
+
+
+def _tune_session(client: RESTClient) -> None:
+    """
+    Mount a larger keep-alive pool with connection-error retries on an SDK client's session.
+
+    The SDK already reuses one requests.Session per client (and retries 429s
+    itself); this lets concurrent callers share warm connections instead of
+    discarding them, and retries a GET once, immediately, when a pooled
+    connection turns out to be dead.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=1, read=0, allowed_methods=frozenset({"GET"})),
+    )
+    client._session.mount("https://", adapter)
+
+
+_tune_session(trading_client)
+_tune_session(history_client)
 
 
 # Expose trading_client for import
-__all__ = ["trading_client", "history_client"]
+__all__ = ["history_client", "trading_client", "trading_stream"]
+
+
+# One segment per bracket/OCO leg, appended to the log_order line
+_LEG_TMPL = " leg=%s type=%s qty=%s limit=%s stop=%s status=%s"
 
 
 def log_order(order: Order) -> None:
     """Logs key details of an Alpaca order in a readable format."""
-    legs_info = ""
-    if order.legs:
-        for leg in order.legs:
-            legs_info += f" leg={leg.side} type={leg.order_type} qty={leg.qty} limit={leg.limit_price or 'N/A'} stop={leg.stop_price or 'N/A'} status={leg.status.value}"
-
-    logger.info(
-        f"order submitted | ticker={order.symbol} side={order.side} qty={order.qty}"
-        f" type={order.order_type or 'N/A'} class={order.order_class.value}"
-        f" limit={order.limit_price or 'N/A'} stop={order.stop_price or 'N/A'}"
-        f" tif={order.time_in_force.value} status={order.status.value}"
-        f" filled_qty={order.filled_qty} filled_avg={order.filled_avg_price or 'N/A'}"
-        f" order_id={order.id}{legs_info}"
-    )
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
+    parts = [
+        (
+            f"order submitted | ticker={order.symbol} side={order.side} qty={order.qty}"
+            f" type={order.order_type or 'N/A'} class={order.order_class.value}"
+            f" limit={order.limit_price or 'N/A'} stop={order.stop_price or 'N/A'}"
+            f" tif={order.time_in_force.value} status={order.status.value}"
+            f" filled_qty={order.filled_qty} filled_avg={order.filled_avg_price or 'N/A'}"
+            f" order_id={order.id}"
+        )
+    ]
+    parts.extend(_LEG_TMPL % (leg.side, leg.order_type, leg.qty, leg.limit_price or "N/A", leg.stop_price or "N/A", leg.status.value) for leg in order.legs or ())
 
-@timed_lru_cache(seconds=60, maxsize=128)
-def get_market_status() -> str:
-    """
-    Determine the current market session: open, pre-market, after-hours, or closed.
+    logger.info("".join(parts))
 
-    Returns:
-        str: "open", "pre-market", "after-hours", or "closed".
-    """
-    # Fetch current market clock (timestamps are in UTC)
-    clock = trading_client.get_clock()
-    clock_instance = cast(Clock, clock)
 
-    # Convert timestamps to UTC timezone-aware datetimes
-    current_time = clock_instance.timestamp.replace(tzinfo=UTC)
-    market_open_time = clock_instance.next_open.replace(tzinfo=UTC)
+# Alpaca calendar times are wall-clock times on the exchange
+_MARKET_TZ = ZoneInfo("America/New_York")
+# US pre-market starts 4 hours before the open; after-hours lasts 4 hours after the close
+_EXTENDED_HOURS = timedelta(hours=4)
+
+# Trading sessions (open UTC, close UTC) by exchange date, reloaded once per day
+_calendar_cache: dict[date, tuple[datetime, datetime]] = {}
+_calendar_cache_loaded: date | None = None
 
-    # Get today's close by checking the most recent trading day
 
-    trading_days = trading_client.get_calendar(GetCalendarRequest(start=current_time.date(), end=current_time.date()))
-    trading_days_instance = cast(list[Calendar], trading_days)
-    if not trading_days:
-        logger.info(f"not a trading day | date={current_time.date()} next_open={market_open_time}")
-        return "closed"  # No market data available, assume closed
+def _ensure_calendar(today: date) -> dict[date, tuple[datetime, datetime]]:
+    """
+    Return trading sessions keyed by date, fetching a rolling window once per day.
 
-    today_market_close = trading_days_instance[0].close.replace(tzinfo=UTC)
+    The window covers the past week and the next 30 days, so weekend and
+    holiday lookups are served from memory.
+    """
+    global _calendar_cache, _calendar_cache_loaded
+
+    if _calendar_cache_loaded != today:
+        calendar: list[Calendar] = trading_client.get_calendar(GetCalendarRequest(start=today - timedelta(days=7), end=today + timedelta(days=30)))  # type: ignore[assignment]
+        _calendar_cache = {
+            day.date: (
+                day.open.replace(tzinfo=_MARKET_TZ).astimezone(UTC),
+                day.close.replace(tzinfo=_MARKET_TZ).astimezone(UTC),
+            )
+            for day in calendar
+        }
+        _calendar_cache_loaded = today
+    return _calendar_cache
 
-    # US Market pre-market starts 4 hours before the official open
-    pre_market_start_time = market_open_time - timedelta(hours=4)
 
-    # US Market after-hours trading lasts 4 hours after the close
-    after_hours_end_time = today_market_close + timedelta(hours=4)
+def _classify_market_session(now: datetime, session: tuple[datetime, datetime] | None) -> str:
+    """Classify now against today's session as "open", "pre-market", "after-hours" or "closed"."""
+    if session is None:
+        return "closed"
 
-    # Market session logic
-    if clock_instance.is_open:
+    market_open, market_close = session
+    if market_open <= now < market_close:
         return "open"
 
-    if pre_market_start_time <= current_time < market_open_time:
+    if market_open - _EXTENDED_HOURS <= now < market_open:
         return "pre-market"
 
-    if today_market_close <= current_time < after_hours_end_time:
+    if market_close <= now < market_close + _EXTENDED_HOURS:
         return "after-hours"
 
-    return "closed"  # Default case: market is fully closed
+    return "closed"
+
+
+def get_market_status() -> str:
+    """
+    Determine the current market session: open, pre-market, after-hours, or closed.
+
+    The trading calendar is fetched once per day; the session is then
+    classified locally against the current time, so most calls make no
+    network request.
+
+    Returns:
+        str: "open", "pre-market", "after-hours", or "closed".
+    """
+    now = datetime.now(UTC)
+    today = now.astimezone(_MARKET_TZ).date()
+    return _classify_market_session(now, _ensure_calendar(today).get(today))
+
+
+# Timeframe of the intraday bars, shared by every minute-resolution bars request
+_FIVE_MINUTE = TimeFrame(5, TimeFrameUnit.Minute)
+
+
+@lru_cache(maxsize=512)
+def _latest_trade_request(symbol: str) -> StockLatestTradeRequest:
+    """Return a reusable latest-trade request for symbol; the data client never mutates requests."""
+    return StockLatestTradeRequest(symbol_or_symbols=symbol)
+
+
+@lru_cache(maxsize=512)
+def _latest_bar_request(symbol: str) -> StockLatestBarRequest:
+    """Return a reusable latest-bar request for symbol; the data client never mutates requests."""
+    return StockLatestBarRequest(symbol_or_symbols=symbol)
 
 
 @timed_lru_cache(seconds=60, maxsize=128)
@@ -118,108 +196,241 @@ def get_current_price(ticker: str) -> float | None:
         Optional[float]: Latest trade price or None if not found
     """
     try:
-        response = history_client.get_stock_latest_trade(StockLatestTradeRequest(symbol_or_symbols=ticker))
+        response = history_client.get_stock_latest_trade(_latest_trade_request(ticker))
         return float(response[ticker].price)
     except Exception as e:
-        logger.debug(f"price fetch failed | ticker={ticker} error={e}", exc_info=True)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("price fetch failed | ticker=%s error=%s", ticker, e, exc_info=True)
         return None
 
 
+def get_current_prices(tickers: list[str]) -> dict[str, float]:
+    """
+    Fetches the latest trade prices for several tickers in a single request.
+
+    Results also seed the get_current_price cache, so later single-ticker
+    lookups within the cache window do not hit the API again.
+
+    Args:
+        tickers (list[str]): Stock ticker symbols
+
+    Returns:
+        dict[str, float]: Latest trade price per ticker; tickers without a trade are omitted
+    """
+    if not tickers:
+        return {}
+    try:
+        response: dict[str, Trade] = history_client.get_stock_latest_trade(StockLatestTradeRequest(symbol_or_symbols=list(tickers)))  # type: ignore[assignment]
+    except Exception as e:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("batch price fetch failed | tickers=%d error=%s", len(tickers), e, exc_info=True)
+        return {}
+
+    prices: dict[str, float] = {}
+    for ticker, trade in response.items():
+        price = float(trade.price)
+        prices[ticker] = price
+        get_current_price.cache_prime(price, ticker)  # type: ignore[attr-defined]
+    return prices
+
+
+def get_stock_bars(symbol, request_type="minute", market_status: str | None = None) -> pd.DataFrame | None:
+    """
+    Get historical data from Alpaca.
+
+    Callers fetching bars for many symbols can look up market_status once and
+    pass it in; otherwise it is looked up on every call. Only whether the
+    market is open becomes part of the cache key.
+    """
+    if market_status is None:
+        try:
+            market_status = get_market_status()
+        except Exception as e:
+            logger.error("market status lookup failed | ticker=%s error=%s", symbol, e, exc_info=True)
+            return None
+    return _get_stock_bars(symbol, request_type, market_status == "open")
+
+
+def prefetch_stock_bars(symbols: list[str], request_type: str = "minute", market_status: str | None = None) -> None:
+    """
+    Fetch bars for several symbols in one request and seed the get_stock_bars cache.
+
+    Like get_current_prices, this lets a scan that analyzes N tickers issue one
+    bars request (plus one latest-bar request while the market is open) instead
+    of N of each. Symbols without bars, or a failed batch, are left unprimed so
+    get_stock_bars still fetches them individually.
+    """
+    symbols = list(dict.fromkeys(symbols))
+    if not symbols:
+        return
+    if market_status is None:
+        try:
+            market_status = get_market_status()
+        except Exception as e:
+            logger.warning("market status lookup failed | tickers=%d error=%s", len(symbols), e, exc_info=True)
+            return
+    market_open = market_status == "open"
+
+    try:
+        bars_response: BarSet = history_client.get_stock_bars(_bars_request(symbols, request_type))  # type: ignore[assignment]
+        latest_bars: dict[str, Bar] = history_client.get_stock_latest_bar(StockLatestBarRequest(symbol_or_symbols=symbols)) if market_open else {}  # type: ignore[assignment]
+    except Exception as e:
+        logger.warning("batch stock bars fetch failed | tickers=%d error=%s", len(symbols), e, exc_info=True)
+        return
+
+    for symbol in symbols:
+        candles = bars_response.data.get(symbol)
+        if candles:
+            df = bars_to_df(candles, extra=latest_bars.get(symbol) or candles[-1])
+            _get_stock_bars.cache_prime(df, symbol, request_type, market_open)  # type: ignore[attr-defined]
+
+
+def _bars_request(symbol_or_symbols: str | list[str], request_type: str) -> StockBarsRequest:
+    """Build the bars request for get_stock_bars: 24h of 5-minute bars or 100 days of daily bars."""
+    end = datetime.now(UTC) - timedelta(seconds=930)  # 15.5 minutes ago
+    if request_type == "minute":
+        start = end - timedelta(minutes=1440)  # Last 24 hours
+        timeframe = _FIVE_MINUTE
+    else:
+        start = end - timedelta(days=100)  # Last 100 days
+        timeframe = TimeFrame.Day
+    return StockBarsRequest(
+        symbol_or_symbols=symbol_or_symbols,
+        timeframe=timeframe,  # type: ignore[arg-type]
+        start=start,
+        end=end,
+        adjustment=Adjustment.ALL,
+    )
+
+
 @timed_lru_cache(seconds=60, maxsize=128)
-def get_stock_bars(symbol, request_type="minute") -> pd.DataFrame | None:
-    """Get historical data from Alpaca."""
+def _get_stock_bars(symbol, request_type: str, market_open: bool) -> pd.DataFrame | None:
+    """Fetch bars for get_stock_bars, appending the latest bar while the market is open."""
     try:
-        now_utc = datetime.now(UTC)  # Get the current UTC time
-        end = now_utc - timedelta(seconds=930)  # 15.5 minutes ago
-
-        # Determine the `start` time based on the `request_type`
-        if request_type == "minute":
-            start = end - timedelta(minutes=1440)  # Last 24 hours
-            request = StockBarsRequest(
-                symbol_or_symbols=symbol,
-                timeframe=TimeFrame(5, TimeFrameUnit.Minute),  # type: ignore[arg-type]
-                start=start,
-                end=end,
-                adjustment=Adjustment.ALL,
-            )
-        else:
-            start = end - timedelta(days=100)  # Last 100 days
-            request = StockBarsRequest(
-                symbol_or_symbols=symbol,
-                timeframe=TimeFrame.Day,
-                start=start,
-                end=end,
-                adjustment=Adjustment.ALL,
-            )
+        request = _bars_request(symbol, request_type)
         try:
-            bars_response = history_client.get_stock_bars(request)
-            candles = cast(BarSet, bars_response).data.get(symbol)
+            bars_response: BarSet = history_client.get_stock_bars(request)  # type: ignore[assignment]
+            candles = bars_response.data.get(symbol)
             if not candles or candles is None:
                 return None
 
-            # Check market status
-            if get_market_status() == "open":
+            latest_bar = None
+            if market_open:
                 # Fetch the latest bar for fresh data (only available during market hours)
-                latest_bar_response = history_client.get_stock_latest_bar(StockLatestBarRequest(symbol_or_symbols=symbol))
-                latest_bar = cast(dict[str, Bar], latest_bar_response).get(symbol)
-
-                # Append the latest bar if available, otherwise duplicate the last candle
-                candles.append(latest_bar if latest_bar else candles[-1])
-            else:
-                # Market is closed, duplicate the last candle
-                candles.append(candles[-1])
+                latest_bar_response = history_client.get_stock_latest_bar(_latest_bar_request(symbol))
+                latest_bar = latest_bar_response.get(symbol)  # type: ignore[union-attr]
 
-            return bars_to_df(candles)
+            # Add the latest bar if available, otherwise duplicate the last candle
+            return bars_to_df(candles, extra=latest_bar or candles[-1])
 
         except Exception as e:
-            logger.error(f"stock bars fetch failed | ticker={symbol} error={e}", exc_info=True)
+            logger.error("stock bars fetch failed | ticker=%s error=%s", symbol, e, exc_info=True)
             return None
 
     except Exception as e:
-        logger.error(f"historical data fetch failed | ticker={symbol} error={e}", exc_info=True)
+        logger.error("historical data fetch failed | ticker=%s error=%s", symbol, e, exc_info=True)
         return None
 
 
-def bars_to_df(bars: list[Bar]) -> pd.DataFrame:
-    """Convert the list of Alpaca Bars to a DataFrame."""
-    # Convert list of Bar objects to dictionaries
-    df = pd.DataFrame([bar.model_dump() for bar in bars])
-
-    # Ensure timestamp is converted to datetime and set as index
-    df["timestamp"] = pd.to_datetime(df["timestamp"])
-    df.set_index("timestamp", inplace=True)
+def bars_to_df(bars: list[Bar], extra: Bar | None = None) -> pd.DataFrame:
+    """
+    Convert the list of Alpaca Bars to a DataFrame indexed by timestamp.
 
-    # Convert numeric columns to appropriate types
-    numeric_cols = ["open", "high", "low", "close", "volume", "trade_count", "vwap"]
-    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors="coerce")
+    Bar attributes are copied straight into one preallocated float64 array per
+    column, so no per-bar dict is built and no numeric coercion pass is needed.
+    Missing trade_count/vwap values become NaN. When extra is given it becomes
+    the final row, without appending it to bars.
+    """
+    n = len(bars) + (extra is not None)
+    symbols: list[str] = [""] * n
+    timestamps: list[datetime | None] = [None] * n
+    open_ = np.empty(n, dtype=np.float64)
+    high = np.empty(n, dtype=np.float64)
+    low = np.empty(n, dtype=np.float64)
+    close = np.empty(n, dtype=np.float64)
+    volume = np.empty(n, dtype=np.float64)
+    trade_count = np.empty(n, dtype=np.float64)
+    vwap = np.empty(n, dtype=np.float64)
+
+    rows = bars if extra is None else itertools.chain(bars, (extra,))
+    for i, bar in enumerate(rows):
+        symbols[i] = bar.symbol
+        timestamps[i] = bar.timestamp
+        open_[i] = bar.open
+        high[i] = bar.high
+        low[i] = bar.low
+        close[i] = bar.close
+        volume[i] = bar.volume
+        trade_count[i] = np.nan if bar.trade_count is None else bar.trade_count
+        vwap[i] = np.nan if bar.vwap is None else bar.vwap
+
+    df = pd.DataFrame(
+        {
+            "symbol": symbols,
+            "open": open_,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": volume,
+            "trade_count": trade_count,
+            "vwap": vwap,
+        },
+        index=pd.Index(pd.to_datetime(timestamps), name="timestamp"),
+    )
 
-    # Sort by timestamp (ascending order)
-    df.sort_index(inplace=True)
+    # Alpaca returns bars in chronological order; only sort when that does not hold
+    if not df.index.is_monotonic_increasing:
+        df.sort_index(inplace=True)
 
     return df
 
 
-def get_account_info() -> dict[str, float | int]:
-    """Get account information."""
-    account = trading_client.get_account()
-    account_instance = cast(TradeAccount, account)
-    return {
-        "equity": float(account_instance.equity) if account_instance.equity else 0,
-        "buying_power": float(account_instance.buying_power) if account_instance.buying_power else 0,
-        "initial_margin": float(account_instance.initial_margin) if account_instance.initial_margin else 0,
-        "margin_multiplier": float(account_instance.multiplier) if account_instance.multiplier else 0,
-        "daytrading_buying_power": float(account_instance.daytrading_buying_power) if account_instance.daytrading_buying_power else 0,
-        "maintenance_margin": float(account_instance.maintenance_margin) if account_instance.maintenance_margin else 0,
-    }
+def _to_float(value: str | float | None) -> float:
+    """Convert an optional Alpaca decimal string to float, treating missing values as 0.0."""
+    return float(value) if value else 0.0
+
+
+# Seconds an account snapshot is reused before get_account_info fetches a new one
+_ACCOUNT_INFO_TTL = 5.0
+
+# (monotonic expiry, snapshot) of the last get_account_info fetch
+_account_info_cache: tuple[float, Mapping[str, float]] | None = None
+
+
+def get_account_info() -> Mapping[str, float]:
+    """
+    Get account information.
+
+    The result is cached for 5 seconds and returned as a read-only mapping,
+    since every caller within that window shares the same object.
+    """
+    global _account_info_cache
+
+    now = time.monotonic()
+    if _account_info_cache is not None and _account_info_cache[0] > now:
+        return _account_info_cache[1]
+
+    account_instance: TradeAccount = trading_client.get_account()  # type: ignore[assignment]
+    info = MappingProxyType(
+        {
+            "equity": _to_float(account_instance.equity),
+            "buying_power": _to_float(account_instance.buying_power),
+            "initial_margin": _to_float(account_instance.initial_margin),
+            "margin_multiplier": _to_float(account_instance.multiplier),
+            "daytrading_buying_power": _to_float(account_instance.daytrading_buying_power),
+            "maintenance_margin": _to_float(account_instance.maintenance_margin),
+        }
+    )
+    _account_info_cache = (now + _ACCOUNT_INFO_TTL, info)
+    return info
 
 
 def get_positions() -> list[Position]:
     """Get all positions."""
     try:
-        positions = trading_client.get_all_positions()
-        return cast(list[Position], positions)
+        return trading_client.get_all_positions()  # type: ignore[return-value]
     except Exception as e:
-        logger.error(f"fetch positions failed | error={e}", exc_info=True)
+        logger.error("fetch positions failed | error=%s", e, exc_info=True)
         return []
 
 
@@ -231,24 +442,18 @@ def get_market_close_time() -> datetime | None:
         Optional[datetime]: The market close time as a timezone-aware datetime object,
                             or None if the current day is not a trading day.
     """
-    today = datetime.now(UTC).date()
-    calendar_request = GetCalendarRequest(start=today, end=today)
+    today = datetime.now(_MARKET_TZ).date()
 
     try:
-        calendars_response = trading_client.get_calendar(calendar_request)
-        calendars = cast(list[Calendar], calendars_response)
-        if calendars:
-            market_close_time_naive = calendars[0].close
-            # Alpaca returns market times in America/New_York timezone
-            market_close_time_et = market_close_time_naive.replace(tzinfo=ZoneInfo("America/New_York"))
-            # Convert to UTC
-            market_close_time_utc = market_close_time_et.astimezone(UTC)
+        session = _ensure_calendar(today).get(today)
+        if session:
+            market_close_time_utc = session[1]
             logger.info(f"market close time | date={today} utc={market_close_time_utc}")
             return market_close_time_utc
         logger.info(f"not a trading day | date={today}")
         return None
     except Exception as e:
-        logger.error(f"market calendar fetch failed | error={e}", exc_info=True)
+        logger.error("market calendar fetch failed | error=%s", e, exc_info=True)
         return None
 
 
@@ -259,30 +464,45 @@ def liquidate_all_positions() -> None:
         trading_client.close_all_positions(cancel_orders=True)
         logger.info("liquidation complete")
     except Exception as e:
-        logger.error(f"liquidation failed | error={e}", exc_info=True)
+        logger.error("liquidation failed | error=%s", e, exc_info=True)
 
 
 def parse_strategy_from_client_order_id(client_order_id: str) -> str:
     """Assuming client_order_id format is '{strategy}_{symbol}_{side}_{uuid}'."""
-    parts = client_order_id.split("_")
+    # Split from the right so strategy names containing "_" (mean_reversion) stay whole
+    parts = client_order_id.rsplit("_", 3)
     if len(parts) > 1:
         return parts[0]
-    if "day" in client_order_id:
-        return "day"
-    if "swing" in client_order_id:
-        return "swing"
-    if "hedge" in client_order_id:
-        return "hedge"
+    for legacy in ("day", "swing", "hedge"):
+        if legacy in client_order_id:
+            return legacy
     return "bracket"
 
 
+def _optional_int(value) -> int | None:
+    """Convert an Alpaca quantity (often a string) to int, or None if missing or malformed."""
+    try:
+        return int(float(value)) if value is not None else None
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _optional_float(value) -> float | None:
+    """Convert an Alpaca price (often a string) to float, or None if missing or malformed."""
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
 async def trade_updates_handler(update: TradeUpdate):
     """
     Listen to Alpaca trade updates and emit standardized analytics execution logs.
 
     We emit structured events via emit_event() and also write compact one-line [EXECUTION] entries
     into trading_logs.log that legacy EOD analysis can parse to reconstruct actual entries/exits,
-    partial fills, cancels and rejections.
+    partial fills, cancels and rejections. Events are emitted from a worker thread so
+    handler file writes do not stall the trading stream's event loop.
 
     Format examples:
       [EXECUTION] Ticker: NVDA, Side: BUY, Cum: 27/27 @ 179.87, OrderType: limit, OrderId: e806..., ClientOrderId: hedge_NVDA_BUY_xxx, Status: fill
@@ -293,36 +513,22 @@ async def trade_updates_handler(update: TradeUpdate):
     client_order_id = order.client_order_id
     symbol = order.symbol
     event = update.event or "unknown"
-    side = order.side if order.side else OrderSide.BUY
+    side = order.side or OrderSide.BUY
+    side_str = side.value.upper() if isinstance(side, OrderSide) else str(side).upper()
     strategy = parse_strategy_from_client_order_id(client_order_id)
-
-    # Helper conversions (Alpaca SDK often uses strings for qty/prices)
-    def _to_int(x) -> int | None:
-        try:
-            return int(float(x)) if x is not None else None
-        except Exception:
-            return None
-
-    def _to_float(x) -> float | None:
-        try:
-            return float(x) if x is not None else None
-        except Exception:
-            return None
-
-    side_str = getattr(side, "value", str(side)).upper()
     order_id = getattr(order, "id", None) or "N/A"
-    ord_qty = _to_int(getattr(order, "qty", None))
-    filled_qty = _to_int(getattr(order, "filled_qty", None))
-    filled_avg_price = _to_float(getattr(order, "filled_avg_price", None))
-    limit_price = _to_float(getattr(order, "limit_price", None))
-    stop_price = _to_float(getattr(order, "stop_price", None))
-    # Some TradeUpdate payloads include a last fill price
-    last_px = _to_float(getattr(update, "price", None))
-
-    logger.info(f"trade update | event={event} ticker={symbol} strategy={strategy} side={side_str}")
 
     # Include cumulative fill snapshot for fill/partial_fill
     if event in {"fill", "partial_fill"}:
+        # Quantities and prices are only needed here; new/accepted updates skip the parsing
+        ord_qty = _optional_int(getattr(order, "qty", None))
+        filled_qty = _optional_int(getattr(order, "filled_qty", None))
+        filled_avg_price = _optional_float(getattr(order, "filled_avg_price", None))
+        # Some TradeUpdate payloads include a last fill price
+        last_px = _optional_float(getattr(update, "price", None))
+        limit_price = _optional_float(getattr(order, "limit_price", None))
+        stop_price = _optional_float(getattr(order, "stop_price", None))
+
         # Prefer filled_avg_price, fallback to last_px, then limit/stop
         px = filled_avg_price or last_px or limit_price or stop_price
         cum_seg = ""
@@ -333,11 +539,13 @@ async def trade_updates_handler(update: TradeUpdate):
         elif px is not None:
             cum_seg = f"Px: {px}"
 
-        logger.info(f"order fill | ticker={symbol} {cum_seg} event={event}")
+        # One line per fill; the generic trade update line below would only repeat it
+        logger.info(f"order fill | ticker={symbol} {cum_seg} event={event} strategy={strategy} side={side_str}")
 
         # Emit OrderFilledEvent for analytics (skip for invalid orders)
         if order_id != "N/A" and ord_qty is not None and filled_qty is not None and px is not None and symbol is not None:
-            emit_event(
+            await asyncio.to_thread(
+                emit_event,
                 OrderFilledEvent(
                     timestamp=datetime.now(UTC),
                     ticker=symbol,
@@ -348,35 +556,37 @@ async def trade_updates_handler(update: TradeUpdate):
                     filled_qty=filled_qty,
                     avg_price=float(px),
                     strategy=strategy,
-                )
+                ),
             )
 
-    elif event in {"canceled", "rejected"}:
-        # Emit appropriate event (skip for invalid orders)
-        if order_id != "N/A" and symbol is not None:
-            if event == "canceled":
-                emit_event(
-                    OrderCanceledEvent(
-                        timestamp=datetime.now(UTC),
-                        ticker=symbol,
-                        order_id=str(order_id),
-                        client_order_id=str(client_order_id),
-                        reason=getattr(update, "reason", None),
-                    )
-                )
-            elif event == "rejected":
-                emit_event(
-                    OrderRejectedEvent(
-                        timestamp=datetime.now(UTC),
-                        ticker=symbol,
-                        order_id=str(order_id),
-                        client_order_id=str(client_order_id),
-                        reason=getattr(update, "reason", None) or getattr(update, "message", None) or getattr(update, "status_message", None) or "Unknown reason",
-                    )
-                )
+        return
 
-    else:
-        pass
+    logger.info(f"trade update | event={event} ticker={symbol} strategy={strategy} side={side_str}")
+
+    # Emit appropriate event (skip for invalid orders)
+    if event in {"canceled", "rejected"} and order_id != "N/A" and symbol is not None:
+        if event == "canceled":
+            await asyncio.to_thread(
+                emit_event,
+                OrderCanceledEvent(
+                    timestamp=datetime.now(UTC),
+                    ticker=symbol,
+                    order_id=str(order_id),
+                    client_order_id=str(client_order_id),
+                    reason=getattr(update, "reason", None),
+                ),
+            )
+        elif event == "rejected":
+            await asyncio.to_thread(
+                emit_event,
+                OrderRejectedEvent(
+                    timestamp=datetime.now(UTC),
+                    ticker=symbol,
+                    order_id=str(order_id),
+                    client_order_id=str(client_order_id),
+                    reason=getattr(update, "reason", None) or getattr(update, "message", None) or getattr(update, "status_message", None) or "Unknown reason",
+                ),
+            )
 
 
 def consume_trade_updates():
@@ -1,13 +1,20 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
 from pandas import DataFrame
 
 from alpacalyzer.data.models import TopTicker, TopTickersResponse
 from alpacalyzer.data.reddit import fetch_reddit_posts, fetch_user_posts
-from alpacalyzer.llm import LLMTier, get_llm_client
+from alpacalyzer.llm import LLMTier, complete_structured_cached
 from alpacalyzer.prompts import load_prompt
 from alpacalyzer.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Identical scanner inputs within this window reuse the previous LLM answer;
+# consecutive scans usually see the same Reddit posts and candidates
+LLM_RESPONSE_TTL = 600.0
+
 
 def get_reddit_insights() -> TopTickersResponse | None:
     system_message = {
@@ -34,11 +41,13 @@ def get_reddit_insights() -> TopTickersResponse | None:
             }}
         """
 
-    trading_edge_ideas = fetch_reddit_posts("TradingEdge")
-    winning_watch_list_ideas = fetch_user_posts("WinningWatchlist")
-    combined_ideas = trading_edge_ideas + winning_watch_list_ideas
-    formatted_reddit_ideas = "\n\n".join([f"Title: {post['title']}\nBody: {post['body']}" for post in combined_ideas])
-    logger.debug(f"Reddit insights input: {formatted_reddit_ideas}")
+    # The two feeds are independent requests, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        trading_edge_ideas = executor.submit(fetch_reddit_posts, "TradingEdge")
+        winning_watch_list_ideas = executor.submit(fetch_user_posts, "WinningWatchlist")
+        combined_ideas = chain(trading_edge_ideas.result(), winning_watch_list_ideas.result())
+    formatted_reddit_ideas = "\n\n".join(f"Title: {post['title']}\nBody: {post['body']}" for post in combined_ideas)
+    logger.debug("Reddit insights input: %s", formatted_reddit_ideas)
 
     human_message = {
         "role": "user",
@@ -50,14 +59,15 @@ def get_reddit_insights() -> TopTickersResponse | None:
     # Combine the messages into a list that you can send to your API
     messages = [system_message, human_message]
 
-    client = get_llm_client()
-    return client.complete_structured(messages, TopTickersResponse, tier=LLMTier.FAST, caller="opportunity_finder_reddit")
+    return complete_structured_cached(messages, TopTickersResponse, LLMTier.FAST, caller="opportunity_finder_reddit", ttl=LLM_RESPONSE_TTL)
+
+
+_TOP_TICKER_FORMAT = "Symbol: %s\nSignal: %s\nConfidence: %s%%\nReasoning: %s\n"
 
 
 def format_top_tickers(tickers: list[TopTicker]) -> str:
     """Format list of TopTicker objects into a readable string for API consumption."""
-    formatted = [f"Symbol: {ticker.ticker}\nSignal: {ticker.signal}\nConfidence: {ticker.confidence}%\nReasoning: {ticker.reasoning}\n" for ticker in tickers]
-    return "\n".join(formatted)
+    return "\n".join(_TOP_TICKER_FORMAT % (ticker.ticker, ticker.signal, ticker.confidence, ticker.reasoning) for ticker in tickers)
 
 
 def get_top_candidates(top_tickers: list[TopTicker], finviz_df: DataFrame) -> TopTickersResponse | None:
@@ -95,5 +105,4 @@ def get_top_candidates(top_tickers: list[TopTicker], finviz_df: DataFrame) -> To
     }
 
     messages = [system_message, human_message]
-    client = get_llm_client()
-    return client.complete_structured(messages, TopTickersResponse, tier=LLMTier.FAST, caller="opportunity_finder_candidates")
+    return complete_structured_cached(messages, TopTickersResponse, LLMTier.FAST, caller="opportunity_finder_candidates", ttl=LLM_RESPONSE_TTL)
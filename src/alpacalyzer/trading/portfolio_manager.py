@@ -1,14 +1,47 @@
 import json
+from functools import cache
 from typing import Any
 
+import numpy as np
 from langchain_core.messages import HumanMessage
 
-from alpacalyzer.data.models import PortfolioManagerOutput
+from alpacalyzer.data.models import PortfolioDecision, PortfolioManagerOutput
 from alpacalyzer.graph.state import AgentState, show_agent_reasoning
-from alpacalyzer.llm import LLMTier, get_llm_client
+from alpacalyzer.llm import LLMTier, complete_structured_cached
 from alpacalyzer.prompts import load_prompt
 from alpacalyzer.utils.progress import progress
 
+# Re-running the graph on unchanged signals, prices and portfolio within this
+# window reuses the previous decision instead of asking the model again. The
+# prompt is sorted JSON of every input, so its hash identifies the whole state.
+DECISION_CACHE_TTL = 60.0
+
+# Response structure appended to the system prompt
+_OUTPUT_FORMAT = (
+    "Output strictly in JSON with the following structure:\n"
+    "{\n"
+    '  "decisions": [\n'
+    "    {\n"
+    '      "ticker": "TICKER1",\n'
+    '      "action": "buy/sell/short/cover/hold",\n'
+    '      "quantity": integer (shares),\n'
+    '      "confidence": float (0-100%),\n'
+    '      "reasoning": "string"\n'
+    "    },\n"
+    "    {\n"
+    '      "ticker": "TICKER2",\n'
+    "      ...\n"
+    "    }\n"
+    "  ]\n"
+    "}"
+)
+
+
+@cache
+def _system_prompt() -> str:
+    """Return the portfolio manager prompt with the response structure appended, built once."""
+    return f"{load_prompt('portfolio_manager')}\n\n{_OUTPUT_FORMAT}"
+
 
 ##### Portfolio Management Agent #####
 def portfolio_management_agent(state: AgentState):
@@ -19,47 +52,53 @@ def portfolio_management_agent(state: AgentState):
     analyst_signals = state["data"]["analyst_signals"]
     tickers = state["data"]["tickers"]
 
-    progress.update_status("portfolio_management_agent", None, "Analyzing signals")
+    progress.update_status("portfolio_management_agent", None, "Processing analyst signals")
 
-    # Get position limits, current prices, and signals for every ticker
+    # Get position limits, current prices, and signals for every ticker.
+    # Progress is reported once for the whole batch: each update re-renders the status table.
+    risk_signals = analyst_signals.get("risk_management_agent", {})
     position_limits = {}
     current_prices = {}
-    max_shares = {}
-    signals_by_ticker = {}
     for ticker in tickers:
-        progress.update_status("portfolio_management_agent", ticker, "Processing analyst signals")
-
         # Get position limits and current prices for the ticker
-        risk_data = analyst_signals.get("risk_management_agent", {}).get(ticker, {})
+        risk_data = risk_signals.get(ticker, {})
         position_limits[ticker] = risk_data.get("remaining_position_limit", 0)
         current_prices[ticker] = risk_data.get("current_price", 0)
 
-        # Calculate maximum shares allowed based on position limit and price
-        if current_prices[ticker] > 0:
-            max_shares[ticker] = int(position_limits[ticker] / current_prices[ticker])
-        else:
-            max_shares[ticker] = 0
-
-        # Get signals for the ticker
-        ticker_signals = {}
-        for agent, signals in analyst_signals.items():
-            if agent != "risk_management_agent" and ticker in signals:
-                ticker_signals[agent] = {
-                    "signal": signals[ticker]["signal"],
-                    "confidence": signals[ticker]["confidence"],
-                }
-        signals_by_ticker[ticker] = ticker_signals
-        progress.update_status("portfolio_management_agent", ticker, "Done")
+    # Get signals for every ticker, walking each agent's signals once
+    signals_by_ticker: dict[str, dict[str, dict[str, Any]]] = {ticker: {} for ticker in tickers}
+    for agent, signals in analyst_signals.items():
+        if agent == "risk_management_agent":
+            continue
+        for ticker, sig in signals.items():
+            ticker_signals = signals_by_ticker.get(ticker)
+            if ticker_signals is not None:
+                ticker_signals[agent] = {"signal": sig["signal"], "confidence": sig["confidence"]}
+
+    # Calculate maximum shares allowed based on position limit and price, in one pass
+    limits = np.array([position_limits[ticker] for ticker in tickers], dtype=float)
+    prices = np.array([current_prices[ticker] for ticker in tickers], dtype=float)
+    shares = np.divide(limits, prices, out=np.zeros_like(limits), where=prices > 0).astype(np.int64)
+    max_shares = dict(zip(tickers, shares.tolist(), strict=True))
+
+    # Without buying capacity or an open position the only possible action is hold,
+    # so those tickers are decided here instead of taking up room in the prompt
+    positions = portfolio.get("positions", {})
+    actionable = [ticker for ticker in tickers if max_shares[ticker] > 0 or ticker in positions]
+    skipped = [ticker for ticker in tickers if max_shares[ticker] <= 0 and ticker not in positions]
 
     progress.update_status("portfolio_management_agent", None, "Making trading decisions")
 
     # Generate the trading decision
-    result = generate_trading_decision(
-        signals_by_ticker=signals_by_ticker,
-        current_prices=current_prices,
-        max_shares=max_shares,
-        portfolio=portfolio,
-    )
+    if actionable:
+        result = generate_trading_decision(
+            signals_by_ticker={ticker: signals_by_ticker[ticker] for ticker in actionable},
+            current_prices={ticker: current_prices[ticker] for ticker in actionable},
+            max_shares={ticker: max_shares[ticker] for ticker in actionable},
+            portfolio=portfolio,
+        )
+    else:
+        result = PortfolioManagerOutput(decisions=[])
 
     if result is None:
         progress.update_status("portfolio_management_agent", None, "Failed to generate trading decision")
@@ -69,10 +108,12 @@ def portfolio_management_agent(state: AgentState):
         }
 
     portfolio_decisions = {decision.ticker: decision.model_dump() for decision in result.decisions}
+    for ticker in skipped:
+        portfolio_decisions[ticker] = PortfolioDecision(ticker=ticker, action="hold", quantity=0, confidence=0.0, reasoning="No position and no buying capacity").model_dump()
 
     # Create the portfolio management message
     message = HumanMessage(
-        content=json.dumps(portfolio_decisions),
+        content=json.dumps(portfolio_decisions, separators=(",", ":")),
         name="portfolio_management",
     )
 
@@ -101,68 +142,44 @@ def generate_trading_decision(
     portfolio: dict[str, float],
 ) -> PortfolioManagerOutput | None:
     """Attempts to get a decision from the LLM with retry logic"""
+    # The system message carries everything that never changes between calls, so
+    # the request shares a long, byte-identical prefix that providers can cache
     system_message = {
         "role": "system",
-        "content": load_prompt("portfolio_manager"),
+        "content": _system_prompt(),
     }
 
-    # Define a template for the user (human) message
-    human_template = (
-        "Based on the team's analysis, make your trading decisions for each ticker.\n\n"
-        "Here are the signals by ticker:\n{signals_by_ticker}\n\n"
-        "Current Prices ($):\n{current_prices}\n\n"
-        "Maximum Shares Allowed For Purchases:\n{max_shares}\n\n"
-        "Portfolio Cash ($): {portfolio_cash}\n"
-        "Current Positions: {portfolio_positions}\n"
-        "Margin Used ($): {margin_used}\n"
-        "Margin Limit ($): {margin_limit}\n"
-        "Shorting Buying Power ($): {shorting_buying_power}\n\n"
-        "Output strictly in JSON with the following structure:\n"
-        "{{\n"
-        '  "decisions": [\n'
-        "    {{\n"
-        '      "ticker": "TICKER1",\n'
-        '      "action": "buy/sell/short/cover/hold",\n'
-        '      "quantity": integer (shares),\n'
-        '      "confidence": float (0-100%),\n'
-        '      "reasoning": "string"\n'
-        "    }},\n"
-        "    {{\n"
-        '      "ticker": "TICKER2",\n'
-        "      ...\n"
-        "    }}\n"
-        "  ]\n"
-        "}}"
-    )
-
-    # Prepare dynamic input values (assumes these variables are defined)
-    signals_by_ticker_str = json.dumps(signals_by_ticker, indent=2)
+    # Prepare dynamic input values (assumes these variables are defined).
+    # JSON is compact: indentation only adds prompt tokens for the model to read.
+    # Keys are sorted so the same data always renders to the same bytes, whatever
+    # order the scanners produced the tickers in.
+    signals_by_ticker_str = json.dumps(signals_by_ticker, separators=(",", ":"), sort_keys=True)
     current_prices_formatted = {k: f"${v:.2f}" for k, v in current_prices.items()}
-    current_prices_str = json.dumps(current_prices_formatted, indent=2)
+    current_prices_str = json.dumps(current_prices_formatted, separators=(",", ":"), sort_keys=True)
     max_shares_formatted = {k: f"{v:,} shares" for k, v in max_shares.items()}
-    max_shares_str = json.dumps(max_shares_formatted, indent=2)
+    max_shares_str = json.dumps(max_shares_formatted, separators=(",", ":"), sort_keys=True)
     portfolio_cash_str = f"${portfolio.get('cash', 0):,.2f}"
-    portfolio_positions_str = json.dumps(portfolio.get("positions", {}), indent=2)
+    portfolio_positions_str = json.dumps(portfolio.get("positions", {}), separators=(",", ":"), sort_keys=True)
     margin_used_str = f"${portfolio.get('margin_used', 0):,.2f}"
     margin_limit_str = f"${portfolio.get('margin_limit', 0):,.2f}"
     shorting_buying_power_str = f"${portfolio.get('shorting_buying_power', 0):,.2f}"
 
-    # Format the human message using the template
+    # Build the human message, holding only per-call data, directly as an f-string
     human_message = {
         "role": "user",
-        "content": human_template.format(
-            signals_by_ticker=signals_by_ticker_str,
-            current_prices=current_prices_str,
-            max_shares=max_shares_str,
-            portfolio_cash=portfolio_cash_str,
-            portfolio_positions=portfolio_positions_str,
-            margin_used=margin_used_str,
-            margin_limit=margin_limit_str,
-            shorting_buying_power=shorting_buying_power_str,
+        "content": (
+            "Based on the team's analysis, make your trading decisions for each ticker.\n\n"
+            f"Here are the signals by ticker:\n{signals_by_ticker_str}\n\n"
+            f"Current Prices ($):\n{current_prices_str}\n\n"
+            f"Maximum Shares Allowed For Purchases:\n{max_shares_str}\n\n"
+            f"Portfolio Cash ($): {portfolio_cash_str}\n"
+            f"Current Positions: {portfolio_positions_str}\n"
+            f"Margin Used ($): {margin_used_str}\n"
+            f"Margin Limit ($): {margin_limit_str}\n"
+            f"Shorting Buying Power ($): {shorting_buying_power_str}"
         ),
     }
 
     # Combine the messages into a list that you can send to your API
     messages = [system_message, human_message]
-    client = get_llm_client()
-    return client.complete_structured(messages, PortfolioManagerOutput, tier=LLMTier.STANDARD, caller="portfolio_manager")
+    return complete_structured_cached(messages, PortfolioManagerOutput, LLMTier.STANDARD, caller="portfolio_manager", ttl=DECISION_CACHE_TTL)
@@ -1,11 +1,11 @@
 import json
-from typing import cast
+from collections.abc import Mapping
 
 from alpaca.trading.models import Position
 from langchain_core.messages import HumanMessage
 
 from alpacalyzer.graph.state import AgentState, show_agent_reasoning
-from alpacalyzer.trading.alpaca_client import get_account_info, get_current_price, trading_client
+from alpacalyzer.trading.alpaca_client import get_account_info, get_current_price, get_current_prices, trading_client
 from alpacalyzer.utils.logger import get_logger
 from alpacalyzer.utils.progress import progress
 
@@ -41,7 +41,7 @@ Safety Factor:
 DEFAULT_MARGIN_REQUIREMENT = 0.5  # Fallback for Reg-T accounts
 
 
-def get_margin_requirement(account: dict[str, float | int]) -> float:
+def get_margin_requirement(account: Mapping[str, float | int]) -> float:
     """
     Derive margin requirement from Alpaca account multiplier.
 
@@ -153,12 +153,11 @@ def risk_management_agent(state: AgentState):
     tickers = data["tickers"]
 
     risk_analysis = {}
-    alpaca_positions = []
+    alpaca_positions: list[Position] = []
     account = {}
 
     try:
-        alpaca_positions_response = trading_client.get_all_positions()
-        alpaca_positions = cast(list[Position], alpaca_positions_response)
+        alpaca_positions = trading_client.get_all_positions()  # type: ignore[assignment]
         account = get_account_info()
         state["data"]["portfolio"]["cash"] = account["equity"]
         state["data"]["portfolio"]["margin_requirement"] = account["maintenance_margin"]
@@ -168,6 +167,12 @@ def risk_management_agent(state: AgentState):
 
     vix = data.get("vix")
 
+    # Price every ticker in one request; per-ticker lookups below then hit the cache
+    get_current_prices(tickers)
+
+    # Signals from the analyst agents (excluding risk_management_agent itself), collected once
+    other_agent_signals = [agent_signals for agent_name, agent_signals in data.get("analyst_signals", {}).items() if agent_name != "risk_management_agent"]
+
     for ticker in tickers:
         progress.update_status("risk_management_agent", ticker, "Analyzing position data")
 
@@ -221,14 +226,11 @@ def risk_management_agent(state: AgentState):
         safety_factor = 0.9
 
         ticker_data = data.get(ticker, {})
-        analyst_signals = data.get("analyst_signals", {})
 
-        # Determine bearish consensus from analyst signals (excluding risk_management_agent itself)
+        # Determine bearish consensus from analyst signals
         bearish_count = 0
         total_count = 0
-        for agent_name, agent_signals in analyst_signals.items():
-            if agent_name == "risk_management_agent":
-                continue
+        for agent_signals in other_agent_signals:
             ticker_signal = agent_signals.get(ticker, {})
             signal = ticker_signal.get("signal", "")
             if isinstance(signal, str) and signal:
@@ -48,9 +48,12 @@ def trading_strategist_agent(state: AgentState):
         trading_strategies[decision.ticker] = trading_strategies_response
         progress.update_status("trading_strategist_agent", decision.ticker, "Done")
 
+    # Dump the strategies once; the message and the reasoning display share it
+    strategies_dump = {ticker: strategy.model_dump() for ticker, strategy in trading_strategies.items()}
+
     # Create the portfolio management message
     message = HumanMessage(
-        content=json.dumps({ticker: strategy.model_dump() for ticker, strategy in trading_strategies.items()}),
+        content=json.dumps(strategies_dump, separators=(",", ":")),
         name="trading_strategist_agent",
     )
 
@@ -58,7 +61,7 @@ def trading_strategist_agent(state: AgentState):
     if state["metadata"]["show_reasoning"]:
         if trading_strategies:
             show_agent_reasoning(
-                {ticker: strategy.model_dump() for ticker, strategy in trading_strategies.items()},
+                strategies_dump,
                 "Trading Strategist Agent",
             )
         else:
@@ -87,7 +90,7 @@ def serialize_trading_signals(signals: TradingSignals) -> str:
         "momentum": f"{signals['momentum']:.2f}%",
     }
 
-    return json.dumps(json_ready_signals, indent=2)
+    return json.dumps(json_ready_signals, separators=(",", ":"))
 
 
 def get_trading_strategies(trading_signals: TradingSignals, decision: PortfolioDecision) -> TradingStrategyResponse | None:
@@ -106,7 +109,7 @@ def get_trading_strategies(trading_signals: TradingSignals, decision: PortfolioD
     )
 
     signals_str = serialize_trading_signals(trading_signals)
-    decision_str = json.dumps(decision.model_dump(), indent=2)
+    decision_str = json.dumps(decision.model_dump(), separators=(",", ":"))
     candles_3_months_str = format_candles_to_markdown(trading_signals["raw_data_daily"], max_rows=90, granularity="day")
     candles_5_min_str = format_candles_to_markdown(trading_signals["raw_data_intraday"], max_rows=120, granularity="minute")
 
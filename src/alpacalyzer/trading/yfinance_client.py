@@ -12,6 +12,9 @@ class YFinanceClient:
     A reusable client for fetching data from Yahoo Finance with built-in.
 
     rate limit handling and retry logic.
+
+    Lookups are static and cached per argument, so every instance shares the
+    same VIX, news and intraday caches.
     """
 
     def __init__(self):
@@ -23,8 +26,9 @@ class YFinanceClient:
             retry_wait (int): Wait time (in seconds) before retrying a failed request.
         """
 
+    @staticmethod
     @timed_lru_cache(seconds=3600, maxsize=128)
-    def get_vix(self, period: str = "1d"):
+    def get_vix(period: str = "1d"):
         """
         Fetch the latest historical data for the VIX volatility index.
 
@@ -49,8 +53,9 @@ class YFinanceClient:
             logger.error(f"VIX history retrieval failed | error={e}")
             return 25.0
 
+    @staticmethod
     @timed_lru_cache(seconds=1800, maxsize=128)
-    def get_news(self, ticker_symbol: str, limit: int = 5):
+    def get_news(ticker_symbol: str, limit: int = 5):
         """
         Fetch the latest news articles for a given ticker.
 
@@ -78,8 +83,9 @@ class YFinanceClient:
             logger.error(f"news retrieval failed | ticker={ticker_symbol} error={e}")
             return []
 
+    @staticmethod
     @timed_lru_cache(seconds=1800, maxsize=128)
-    def get_intraday_data(self, ticker_symbol: str, period: str = "1d", interval: str = "1m"):
+    def get_intraday_data(ticker_symbol: str, period: str = "1d", interval: str = "1m"):
         """
         Fetch intraday historical data for a given ticker.
 
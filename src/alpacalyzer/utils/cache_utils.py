@@ -1,5 +1,7 @@
+from collections import OrderedDict
 from collections.abc import Callable
-from functools import lru_cache, wraps
+from functools import wraps
+from threading import Lock
 from time import time
 from typing import Any, TypeVar
 
@@ -8,34 +10,56 @@ F = TypeVar("F", bound=Callable[..., Any])
 
 def timed_lru_cache(seconds: int, maxsize: int = 128) -> Callable[[F], F]:
     """
-    A decorator that combines lru_cache with a time-based expiry.
+    A decorator that combines an LRU cache with a time-based expiry.
 
     Args:
         seconds (int): Cache expiry time in seconds.
         maxsize (int): Maximum size of the cache.
 
     Returns:
-        function: Decorated function with time-based expiry.
+        function: Decorated function with time-based expiry. It exposes
+        cache_clear() and cache_prime(value, *args, **kwargs), which seeds the
+        result for those arguments without calling the function.
     """
 
     def decorator(func):
-        cached_func = lru_cache(maxsize=maxsize)(func)
-        cache_expiry: dict[tuple[Any, ...], float] = {}
+        # key -> (value, computed at), oldest use first. Entries expire `seconds`
+        # after they were computed or primed; reading them doesn't extend that.
+        entries: OrderedDict[tuple[Any, ...], tuple[Any, float]] = OrderedDict()
+        # Callers fetch from worker threads; the lock only guards the bookkeeping
+        lock = Lock()
+
+        def store(key, value, now):
+            with lock:
+                entries[key] = (value, now)
+                entries.move_to_end(key)
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
 
         @wraps(func)
         def wrapped(*args, **kwargs):
             now = time()
             key = args + tuple(kwargs.items())
-            if key in cache_expiry:
-                if now - cache_expiry[key] > seconds:
-                    cached_func.cache_clear()
-                    cache_expiry.pop(key, None)
+            with lock:
+                hit = entries.get(key)
+                if hit is not None and now - hit[1] <= seconds:
+                    entries.move_to_end(key)
+                    return hit[0]
 
-            result = cached_func(*args, **kwargs)
-            cache_expiry[key] = now
+            result = func(*args, **kwargs)
+            store(key, result, now)
             return result
 
-        wrapped.cache_clear = cached_func.cache_clear  # type: ignore
+        def cache_prime(value, *args, **kwargs):
+            """Store value as the cached result for the given arguments."""
+            store(args + tuple(kwargs.items()), value, time())
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+
+        wrapped.cache_clear = cache_clear  # type: ignore
+        wrapped.cache_prime = cache_prime  # type: ignore
         return wrapped
 
     return decorator
@@ -47,8 +47,6 @@ def format_candles_to_markdown(
     header = "| " + " | ".join(df.columns) + " |"
     separator = "|" + "|".join([" --- " for _ in df.columns]) + "|"
 
-    rows = []
-    for _, row in df.iterrows():
-        rows.append("| " + " | ".join(str(v) for v in row.values) + " |")
+    rows = ["| " + " | ".join(str(v) for v in values) + " |" for values in df.itertuples(index=False, name=None)]
 
     return "\n".join([header, separator] + rows)
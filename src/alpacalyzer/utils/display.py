@@ -31,24 +31,24 @@ def wrap_text(text: Any, width: int = 60) -> str:
         # Convert any other type to string
         text_str = str(text)
 
-    # Wrap long reasoning text to make it more readable
-    wrapped_text = ""
+    # Wrap long reasoning text to make it more readable; lines are collected
+    # and joined once instead of growing one string per word
+    lines: list[str] = []
     current_line = ""
     # Use a fixed width of 60 characters to match the table column width
     max_line_length = width
     for word in text_str.split():
         if len(current_line) + len(word) + 1 > max_line_length:
-            wrapped_text += current_line + "\n"
+            lines.append(current_line)
             current_line = word
+        elif current_line:
+            current_line = f"{current_line} {word}"
         else:
-            if current_line:
-                current_line += " " + word
-            else:
-                current_line = word
+            current_line = word
     if current_line:
-        wrapped_text += current_line
+        lines.append(current_line)
 
-    return wrapped_text
+    return "\n".join(lines)
 
 
 # Correct rounding for prices
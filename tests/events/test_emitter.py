@@ -278,6 +278,31 @@ def test_file_handler_no_rotation_under_limit(tmp_path):
     assert not (tmp_path / "events.jsonl.1").exists(), "Should not rotate under limit"
 
 
+def test_file_handler_keeps_file_open_between_events(tmp_path):
+    """Test FileEventHandler opens the file once and reopens it after close()."""
+    file_path = tmp_path / "events.jsonl"
+    handler = FileEventHandler(file_path=str(file_path))
+
+    event = ScanCompleteEvent(
+        timestamp=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+        source="reddit",
+        tickers_found=["TSLA"],
+        duration_seconds=5.0,
+    )
+
+    with patch("alpacalyzer.events.emitter.open", side_effect=open, create=True) as mock_open:
+        handler.handle(event)
+        handler.handle(event)
+        assert mock_open.call_count == 1
+
+        handler.close()
+        handler.handle(event)
+        assert mock_open.call_count == 2
+
+    handler.close()
+    assert len(file_path.read_text().splitlines()) == 3
+
+
 def test_callback_handler():
     """Test CallbackEventHandler calls callback function."""
     received_events = []
@@ -1,5 +1,6 @@
 """Tests for technical signal caching in ExecutionEngine."""
 
+import threading
 from time import time as time_func
 from unittest.mock import MagicMock
 
@@ -302,6 +303,37 @@ class TestCacheIntegration:
 
         assert len(engine._signal_cache) == 0
 
+    def test_prefetch_analyzes_misses_concurrently(self, engine):
+        """Test that prefetch runs uncached tickers in parallel and skips cached ones."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def analyze_stock(ticker):
+            barrier.wait()  # only passes if both misses are in flight at once
+            return create_mock_signal(ticker) if ticker == "MSFT" else None
+
+        engine._ta.analyze_stock = MagicMock(side_effect=analyze_stock)
+        engine._ta.prefetch_bars = MagicMock()
+        engine._cache_signal("AAPL", create_mock_signal("AAPL"))
+
+        engine._prefetch_signals(["AAPL", "MSFT", "NVDA", "MSFT"])
+
+        engine._ta.prefetch_bars.assert_called_once_with(["MSFT", "NVDA"])
+
+        assert sorted(c.args[0] for c in engine._ta.analyze_stock.call_args_list) == ["MSFT", "NVDA"]
+        assert engine._get_cached_signal("MSFT") is not None
+        assert engine._get_cached_signal("NVDA") is None
+
+    def test_prefetch_skips_single_miss(self, engine):
+        """Test that a lone miss is left to the regular exit path."""
+        engine._ta.analyze_stock = MagicMock(return_value=create_mock_signal())
+        engine._ta.prefetch_bars = MagicMock()
+
+        engine._prefetch_signals(["AAPL"])
+
+        engine._ta.prefetch_bars.assert_not_called()
+
+        engine._ta.analyze_stock.assert_not_called()
+
 
 class TestCacheEntryBehavior:
     """Tests for specific cache entry behaviors."""
@@ -102,3 +102,25 @@ def test_complete_structured_handles_missing_usage():
     assert event.prompt_tokens == 0
     assert event.completion_tokens == 0
     assert event.total_tokens == 0
+
+
+def test_complete_structured_marks_anthropic_system_prompt_cacheable():
+    """The system prompt is sent as a cache_control block to Anthropic models only."""
+    client = LLMClient(api_key="test-key", base_url="http://fake")
+    messages = [{"role": "system", "content": "static rules"}, {"role": "user", "content": "test"}]
+    mock_response = _make_mock_openai_response('{"answer": "42"}', usage=_make_mock_usage())
+
+    with (
+        patch.object(client.client.chat.completions, "create", return_value=mock_response) as mock_create,
+        patch("alpacalyzer.llm.client.emit_event"),
+        patch("alpacalyzer.llm.client.get_model_for_tier", side_effect=["anthropic/claude-3.5-sonnet", "openai/gpt-4o"]),
+    ):
+        client.complete_structured(messages=messages, response_model=MockResponse)
+        client.complete_structured(messages=messages, response_model=MockResponse)
+
+    anthropic_call, openai_call = mock_create.call_args_list
+    system_block = anthropic_call.kwargs["messages"][0]["content"][0]
+    assert system_block["cache_control"] == {"type": "ephemeral"}
+    assert system_block["text"].startswith("static rules")
+    assert openai_call.kwargs["messages"][0]["content"].startswith("static rules")
+    assert messages[0] == {"role": "system", "content": "static rules"}
@@ -1,5 +1,9 @@
 """Tests for BaseStrategy functionality."""
 
+from dataclasses import replace
+from datetime import UTC, datetime
+from unittest.mock import patch
+
 import pandas as pd
 import pytest
 from alpaca.trading.models import Position
@@ -182,6 +186,33 @@ def test_base_strategy_check_basic_filters_case_insensitive(bullish_signal, mark
     assert passed
 
 
+def test_base_strategy_check_basic_filters_cached_per_tick(bullish_signal, market_context):
+    """Test _check_basic_filters_cached reuses results within a tick and recomputes on a new one."""
+    strategy = MockStrategy()
+    market_context.timestamp = datetime(2024, 1, 2, 15, 30, tzinfo=UTC)
+
+    with patch.object(MockStrategy, "_check_basic_filters", wraps=strategy._check_basic_filters) as check:
+        assert strategy._check_basic_filters_cached(bullish_signal, market_context) == (True, "Basic filters passed")
+        assert strategy._check_basic_filters_cached(bullish_signal, market_context) == (True, "Basic filters passed")
+        assert check.call_count == 1
+
+        next_tick = replace(market_context, timestamp=datetime(2024, 1, 2, 15, 31, tzinfo=UTC), cooldown_tickers=["AAPL"])
+        passed, reason = strategy._check_basic_filters_cached(bullish_signal, next_tick)
+        assert not passed
+        assert "cooldown" in reason.lower()
+        assert check.call_count == 2
+
+
+def test_base_strategy_check_basic_filters_cached_without_timestamp(bullish_signal, market_context):
+    """Test contexts without a timestamp bypass the filter cache."""
+    strategy = MockStrategy()
+
+    with patch.object(MockStrategy, "_check_basic_filters", wraps=strategy._check_basic_filters) as check:
+        strategy._check_basic_filters_cached(bullish_signal, market_context)
+        strategy._check_basic_filters_cached(bullish_signal, market_context)
+        assert check.call_count == 2
+
+
 # =============================================================================
 # ATR/VIX-Aware Position Sizing Tests (Issue #95)
 # =============================================================================
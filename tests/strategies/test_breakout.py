@@ -245,6 +245,7 @@ class TestBreakoutStrategyEntry:
 
         assert decision.should_enter is False
         assert "volume" in decision.reason.lower()
+        assert decision.metrics["volume_ratio"] < config.min_volume_ratio
 
     def test_no_entry_market_closed(self):
         """Test no entry when market is closed."""
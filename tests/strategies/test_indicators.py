@@ -0,0 +1,175 @@
+"""Tests for compiled strategy indicator kernels."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from alpacalyzer.strategies.indicators import bb_last, last_values_batch, rolling_mean_std, rsi_bb, rsi_last, wilder_rsi, wilder_rsi_last
+
+
+def _pandas_rsi(close: pd.Series, period: int) -> pd.Series:
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0)
+    loss = -delta.where(delta < 0, 0)
+    rs = gain.rolling(window=period).mean() / loss.rolling(window=period).mean()
+    return 100 - (100 / (1 + rs))
+
+
+def _pandas_wilder_rsi(close: pd.Series, period: int) -> pd.Series:
+    delta = close.diff()
+    gain = delta.clip(lower=0)
+    loss = -delta.clip(upper=0)
+    # Seed with the simple mean of the first `period` changes, then smooth with alpha = 1 / period
+    gain.iloc[period] = gain.iloc[1 : period + 1].mean()
+    loss.iloc[period] = loss.iloc[1 : period + 1].mean()
+    avg_gain = gain.iloc[period:].ewm(alpha=1 / period, adjust=False).mean()
+    avg_loss = loss.iloc[period:].ewm(alpha=1 / period, adjust=False).mean()
+    return (100 - (100 / (1 + avg_gain / avg_loss))).reindex(close.index)
+
+
+def _pandas_bb(close: pd.Series, period: int, num_std: float) -> tuple[pd.Series, pd.Series, pd.Series]:
+    middle = close.rolling(window=period).mean()
+    std = close.rolling(window=period).std()
+    return middle + std * num_std, middle, middle - std * num_std
+
+
+@pytest.fixture
+def random_walk():
+    """Reproducible random-walk close prices."""
+    rng = np.random.default_rng(42)
+    return pd.Series(100.0 + np.cumsum(rng.normal(0, 1.5, 300)))
+
+
+class TestRsiBb:
+    """Test the fused RSI/Bollinger Band kernel against pandas rolling."""
+
+    @pytest.mark.parametrize(("rsi_n", "bb_n", "bb_std"), [(14, 20, 2.0), (12, 18, 1.8), (5, 5, 2.5)])
+    def test_matches_pandas_rolling(self, random_walk, rsi_n, bb_n, bb_std):
+        rsi, upper, middle, lower = rsi_bb(random_walk.to_numpy(), rsi_n, bb_n, bb_std)
+        exp_upper, exp_middle, exp_lower = _pandas_bb(random_walk, bb_n, bb_std)
+
+        np.testing.assert_allclose(rsi, _pandas_rsi(random_walk, rsi_n).to_numpy(), rtol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(upper, exp_upper.to_numpy(), rtol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(middle, exp_middle.to_numpy(), rtol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(lower, exp_lower.to_numpy(), rtol=1e-9, equal_nan=True)
+
+    def test_rsi_extremes(self):
+        rising = np.arange(1.0, 31.0)
+        flat = np.full(30, 50.0)
+
+        rsi_rising, _, _, _ = rsi_bb(rising, 14, 20, 2.0)
+        rsi_flat, upper, middle, lower = rsi_bb(flat, 14, 20, 2.0)
+
+        assert rsi_rising[-1] == 100.0
+        assert np.isnan(rsi_flat[-1])
+        assert upper[-1] == middle[-1] == lower[-1] == 50.0
+
+    def test_warm_up_is_nan(self, random_walk):
+        rsi, upper, _, _ = rsi_bb(random_walk.to_numpy(), 14, 20, 2.0)
+
+        assert np.isnan(rsi[:12]).all()
+        assert not np.isnan(rsi[13])
+        assert np.isnan(upper[:19]).all()
+        assert not np.isnan(upper[19])
+
+
+class TestWilderRsi:
+    """Test Wilder's smoothed RSI kernels."""
+
+    @pytest.mark.parametrize("period", [14, 5])
+    def test_matches_pandas_ewm(self, random_walk, period):
+        rsi = wilder_rsi(random_walk.to_numpy(), period)
+
+        np.testing.assert_allclose(rsi, _pandas_wilder_rsi(random_walk, period).to_numpy(), rtol=1e-9, equal_nan=True)
+        assert np.isnan(rsi[:period]).all()
+        assert not np.isnan(rsi[period])
+
+    def test_last_matches_full_kernel(self, random_walk):
+        close = random_walk.to_numpy()
+
+        assert wilder_rsi_last(close, 14) == pytest.approx(wilder_rsi(close, 14)[-1])
+        assert wilder_rsi_last(close.astype(np.float32), 14) == pytest.approx(wilder_rsi_last(close, 14), rel=1e-5)
+
+    def test_extremes_and_short_input(self):
+        assert wilder_rsi_last(np.arange(1.0, 31.0), 14) == 100.0
+        assert np.isnan(wilder_rsi_last(np.full(30, 50.0), 14))
+        assert np.isnan(wilder_rsi_last(np.arange(1.0, 15.0), 14))
+
+
+class TestLastValueKernels:
+    """Test the scalar last-bar kernels against the full-array kernel."""
+
+    @pytest.mark.parametrize(("rsi_n", "bb_n"), [(14, 20), (5, 5), (20, 10)])
+    def test_match_full_kernel(self, random_walk, rsi_n, bb_n):
+        close = random_walk.to_numpy()
+        rsi, upper, middle, lower = rsi_bb(close, rsi_n, bb_n, 2.0)
+
+        assert rsi_last(close, rsi_n) == pytest.approx(rsi[-1])
+        assert rsi_last(close[-(rsi_n + 1) :], rsi_n) == pytest.approx(rsi[-1])
+        assert bb_last(close, bb_n, 2.0) == pytest.approx((upper[-1], middle[-1], lower[-1]))
+
+    def test_float32_input_matches_float64(self, random_walk):
+        close = random_walk.to_numpy()
+        close32 = close.astype(np.float32)
+
+        assert rsi_last(close32, 14) == pytest.approx(rsi_last(close, 14), rel=1e-5)
+        assert bb_last(close32, 20, 2.0) == pytest.approx(bb_last(close, 20, 2.0), rel=1e-6)
+
+    def test_short_input_is_nan(self):
+        close = np.arange(1.0, 6.0)
+
+        assert np.isnan(rsi_last(close, 14))
+        assert all(np.isnan(v) for v in bb_last(close, 20, 2.0))
+
+
+class TestLastValuesBatch:
+    """Test the batched last-bar kernel against the scalar kernels."""
+
+    def test_matches_scalar_kernels_per_row(self, random_walk):
+        close = random_walk.to_numpy()
+        histories = [close[-30:], close[100:125], close[:10]]
+        closes = np.full((3, 30), np.nan)
+        for i, history in enumerate(histories):
+            closes[i, 30 - len(history) :] = history
+        lengths = np.array([len(h) for h in histories], dtype=np.int64)
+
+        values = last_values_batch(closes, lengths, 14, 20, 2.0, 20)
+
+        for history, row in zip(histories[:2], values[:2], strict=True):
+            window = history[-20:]
+            assert row[0] == pytest.approx(rsi_last(history, 14))
+            assert tuple(row[1:4]) == pytest.approx(bb_last(history, 20, 2.0))
+            assert row[4] == pytest.approx((history[-1] - window.mean()) / window.std(ddof=1))
+        assert np.isnan(values[2]).all()
+
+    def test_wilder_flag_uses_wilder_rsi(self, random_walk):
+        close = random_walk.to_numpy()[-150:]
+        closes = close.reshape(1, -1)
+        lengths = np.array([len(close)], dtype=np.int64)
+
+        values = last_values_batch(closes, lengths, 14, 20, 2.0, 20, True)
+
+        assert values[0, 0] == pytest.approx(wilder_rsi_last(close, 14))
+
+
+class TestRollingMeanStd:
+    """Test the cumulative-sum rolling mean/std against pandas rolling."""
+
+    @pytest.mark.parametrize("window", [2, 20, 50])
+    def test_matches_pandas_rolling(self, random_walk, window):
+        mean, std = rolling_mean_std(random_walk.to_numpy(), window)
+
+        np.testing.assert_allclose(mean, random_walk.rolling(window).mean().to_numpy(), rtol=1e-9, equal_nan=True)
+        np.testing.assert_allclose(std, random_walk.rolling(window).std().to_numpy(), rtol=1e-7, atol=1e-6, equal_nan=True)
+
+    def test_flat_series_has_zero_std(self):
+        mean, std = rolling_mean_std(np.full(30, 123.45), 20)
+
+        assert mean[-1] == pytest.approx(123.45)
+        assert std[-1] == 0.0
+
+    def test_short_input_is_all_nan(self):
+        mean, std = rolling_mean_std(np.arange(5.0), 20)
+
+        assert np.isnan(mean).all()
+        assert np.isnan(std).all()
@@ -2,13 +2,14 @@
 
 from unittest.mock import MagicMock
 
+import numpy as np
 import pandas as pd
 import pytest
 from alpaca.trading.models import Position
 
 from alpacalyzer.analysis.technical_analysis import TradingSignals
 from alpacalyzer.strategies.base import MarketContext
-from alpacalyzer.strategies.mean_reversion import MeanReversionConfig, MeanReversionStrategy
+from alpacalyzer.strategies.mean_reversion import MeanReversionConfig, MeanReversionStrategy, _window_means
 
 
 @pytest.fixture
@@ -197,6 +198,7 @@ class TestMeanReversionConfigDefault:
 
         assert config.name == "mean_reversion"
         assert config.rsi_period == 14
+        assert config.rsi_method == "wilder"
         assert config.rsi_oversold == 30.0
         assert config.rsi_overbought == 70.0
         assert config.rsi_exit_threshold == 50.0
@@ -427,6 +429,69 @@ class TestMeanReversionStrategyIndicators:
 
         assert isinstance(z_score, float)
 
+    def test_compute_indicators_reuses_cached_values(self, mean_reversion_strategy):
+        """Test indicators are computed once per DataFrame and match the Series helpers."""
+        df = pd.DataFrame(
+            {
+                "close": [100.0 + i * 0.5 + (i % 3 - 1) * 0.2 for i in range(30)],
+            }
+        )
+        first = mean_reversion_strategy._compute_indicators(df)
+        second = mean_reversion_strategy._compute_indicators(df)
+
+        assert first is second
+        upper, middle, lower = mean_reversion_strategy._calculate_bollinger_bands(df)
+        assert first.bb_upper == pytest.approx(upper.iloc[-1])
+        assert first.bb_middle == pytest.approx(middle.iloc[-1])
+        assert first.bb_lower == pytest.approx(lower.iloc[-1])
+        assert first.rsi == pytest.approx(mean_reversion_strategy._calculate_rsi(df).iloc[-1])
+        assert first.z_score == pytest.approx(mean_reversion_strategy._calculate_z_score(df))
+
+    @pytest.mark.parametrize("rsi_method", ["wilder", "sma"])
+    def test_compute_indicators_uses_configured_rsi_method(self, rsi_method):
+        """Test last-bar RSI matches the Series RSI of the configured method on long histories."""
+        strategy = MeanReversionStrategy(MeanReversionConfig(name="mr", description="mr", rsi_method=rsi_method))
+        df = pd.DataFrame({"close": [100.0 + i * 0.05 + (i % 9 - 4) * 0.8 for i in range(300)]})
+
+        indicators = strategy._compute_indicators(df)
+
+        # Wilder RSI only reads the warm-up window, so allow for the truncated seed
+        assert indicators.rsi == pytest.approx(strategy._calculate_rsi(df).iloc[-1], abs=1e-3)
+
+    def test_window_means_match_tail_means(self):
+        """Test cumulative-sum window means equal independent tail means."""
+        values = np.array([100.0 + i * 0.3 + (i % 5 - 2) * 1.1 for i in range(80)])
+
+        assert _window_means(values, 50, 20, 1) == pytest.approx((values[-50:].mean(), values[-20:].mean(), values[-1]))
+        assert _window_means(values[:10], 50, 20) == pytest.approx((values[:10].mean(), values[:10].mean()))
+
+    @pytest.mark.parametrize("mean_period", [20, 15])
+    def test_z_score_from_bands_matches_direct_z_score(self, mean_period):
+        """Test the Bollinger-derived Z-score equals the directly computed one."""
+        strategy = MeanReversionStrategy(MeanReversionConfig(name="mr", description="mr", mean_period=mean_period))
+        df = pd.DataFrame({"close": [100.0 + i * 0.5 + (i % 4 - 2) * 0.7 for i in range(40)]})
+        upper, middle, _ = strategy._calculate_bollinger_bands(df)
+
+        z_score = strategy._z_score_from_bands(df["close"].to_numpy(), upper.iloc[-1], middle.iloc[-1])
+
+        assert z_score == pytest.approx(strategy._calculate_z_score(df))
+
+    def test_symbol_closes_tracks_new_and_refreshed_bars(self, mean_reversion_strategy):
+        """Test the per-symbol close buffer matches the frame tail across updates."""
+        window = mean_reversion_strategy._close_window()
+        timestamps = pd.date_range("2024-01-01", periods=60, freq="D")
+        closes = [100.0 + (i % 7) - i * 0.1 for i in range(61)]
+
+        def frame(n_bars, last_close=None):
+            df = pd.DataFrame({"timestamp": timestamps[:n_bars], "close": closes[:n_bars]})
+            if last_close is not None:
+                df.loc[n_bars - 1, "close"] = last_close
+            return df
+
+        for df in (frame(40), frame(40, last_close=95.5), frame(41), frame(50)):
+            buffered = mean_reversion_strategy._symbol_closes("AAPL", df)
+            np.testing.assert_array_equal(buffered, df["close"].to_numpy()[-window:].astype(np.float32))
+
     def test_calculate_confidence_oversold(self, mean_reversion_strategy):
         """Test confidence calculation for oversold condition."""
         confidence = mean_reversion_strategy._calculate_confidence(20.0, -3.0, "oversold")
@@ -441,6 +506,23 @@ class TestMeanReversionStrategyIndicators:
         assert confidence > 50
         assert confidence <= 95
 
+    @pytest.mark.parametrize(
+        ("rsi", "z_score", "condition", "expected"),
+        [
+            (19.9, -3.1, "oversold", 85.0),
+            (20.0, -3.0, "oversold", 75.0),
+            (25.0, -2.5, "oversold", 60.0),
+            (30.0, -2.0, "oversold", 50.0),
+            (80.1, 3.1, "overbought", 85.0),
+            (80.0, 3.0, "overbought", 75.0),
+            (75.0, 2.5, "overbought", 60.0),
+            (70.0, 2.0, "overbought", 50.0),
+        ],
+    )
+    def test_calculate_confidence_thresholds(self, mean_reversion_strategy, rsi, z_score, condition, expected):
+        """Test confidence bonuses switch exactly at the strict thresholds."""
+        assert mean_reversion_strategy._calculate_confidence(rsi, z_score, condition) == expected
+
     def test_calculate_confidence_moderate(self, mean_reversion_strategy):
         """Test confidence calculation for moderate conditions."""
         confidence = mean_reversion_strategy._calculate_confidence(32.0, -2.1, "oversold")
@@ -697,3 +779,18 @@ class TestMeanReversionAgentIntegration:
         assert not decision.should_enter
         assert "trade_type mismatch" in decision.reason.lower()
         assert "short" in decision.reason.lower() or "overbought" in decision.reason.lower()
+
+    def test_evaluate_entry_batch_matches_individual_evaluation(self, relaxed_config, oversold_signal_for_agent, overbought_signal_for_agent, neutral_signal, market_context):
+        """Test batched entry evaluation returns the same decisions as per-signal calls."""
+        signals = [
+            oversold_signal_for_agent,
+            TradingSignals(**{**overbought_signal_for_agent, "symbol": "MSFT"}),
+            TradingSignals(**{**neutral_signal, "symbol": "TSLA"}),
+        ]
+
+        batch = MeanReversionStrategy(relaxed_config).evaluate_entry_batch(signals, market_context)
+        single = [MeanReversionStrategy(relaxed_config).evaluate_entry(signal, market_context) for signal in signals]
+
+        assert [d.should_enter for d in batch] == [True, True, False]
+        assert [(d.should_enter, d.reason, d.suggested_size) for d in batch] == [(d.should_enter, d.reason, d.suggested_size) for d in single]
+        assert [d.stop_loss for d in batch] == pytest.approx([d.stop_loss for d in single])
@@ -8,7 +8,7 @@ from alpacalyzer.analysis.technical_analysis import TradingSignals
 from alpacalyzer.data.models import EntryCriteria, EntryType, TradingStrategy
 from alpacalyzer.strategies.base import MarketContext
 from alpacalyzer.strategies.config import StrategyConfig
-from alpacalyzer.strategies.momentum import MomentumStrategy
+from alpacalyzer.strategies.momentum import ExitCode, MomentumStrategy, _tail_means
 
 
 @pytest.fixture
@@ -246,6 +246,10 @@ class TestMomentumStrategyDefaultConfig:
         assert config.price_tolerance_pct == 0.015
         assert config.candlestick_pattern_confidence == 80.0
 
+    def test_instances_share_technical_analyzer(self, momentum_strategy):
+        """Test every strategy instance reuses one TechnicalAnalyzer."""
+        assert momentum_strategy._get_ta() is MomentumStrategy()._get_ta()
+
 
 class TestMomentumStrategyEvaluateEntry:
     """Test entry evaluation logic."""
@@ -405,6 +409,35 @@ class TestMomentumStrategyEntryCriteria:
 
         assert "DOJI" not in failed
 
+    def test_entry_criteria_short_circuit_skips_pattern_reads(self, momentum_strategy, bullish_signal_oversold):
+        """Test evaluation stops once the threshold is unreachable, without reading pattern columns."""
+        signal = dict(bullish_signal_oversold)
+        signal["price"] = 100.0  # Below both SMAs, so only 4 conditions remain after two failures
+        signal["raw_data_intraday"] = pd.DataFrame()  # Any pattern column read would raise KeyError
+
+        conditions_met, total, failed = momentum_strategy._evaluate_entry_criteria(signal, is_long=True)
+
+        assert conditions_met == 0
+        assert total == 6
+        assert failed == ["RSI_OVERSOLD", "ABOVE_MOVING_AVERAGE_20", "ABOVE_MOVING_AVERAGE_50", "BULLISH_ENGULFING", "HAMMER", "DOJI"]
+
+    def test_tail_means_matches_pandas(self):
+        """Test 3-candle means skip NaN the same way pandas mean does."""
+        df = pd.DataFrame(
+            {
+                "RSI": [10.0, 30.0, 40.0, float("nan")],
+                "SMA_20": [1.0, 2.0, 3.0, 4.0],
+                "SMA_50": [float("nan")] * 4,
+                "Unused": ["a", "b", "c", "d"],
+            }
+        )
+
+        means = _tail_means(df, ("RSI", "SMA_20", "SMA_50"))
+
+        assert means["RSI"] == pytest.approx(35.0)
+        assert means["SMA_20"] == pytest.approx(3.0)
+        assert pd.isna(means["SMA_50"])
+
 
 class TestMomentumStrategyEvaluateExit:
     """Test exit evaluation logic."""
@@ -666,6 +699,30 @@ class TestMomentumStrategyEvaluateExit:
         assert "catastrophic" in decision.reason.lower()
         assert decision.urgency == "immediate"
 
+    def test_losing_long_skips_technicals_when_momentum_and_score_hold(self, momentum_strategy, losing_long_position, market_context, monkeypatch):
+        """Test weak_technicals is not evaluated unless momentum or score has degraded."""
+        signal = TradingSignals(
+            symbol="AAPL",
+            price=147.0,
+            atr=2.5,
+            rvol=1.2,
+            signals=[],
+            raw_score=75,
+            score=0.75,
+            momentum=1.0,
+            raw_data_daily=pd.DataFrame(),
+            raw_data_intraday=pd.DataFrame(),
+        )
+
+        def fail(*args, **kwargs):
+            raise AssertionError("weak_technicals should not run")
+
+        monkeypatch.setattr(momentum_strategy._get_ta(), "weak_technicals", fail)
+
+        decision = momentum_strategy.evaluate_exit(losing_long_position, signal, market_context)
+
+        assert not decision.should_exit
+
 
 class TestMomentumStrategyExitUrgency:
     """Test exit urgency determination."""
@@ -691,6 +748,20 @@ class TestMomentumStrategyExitUrgency:
 
         assert urgency == "normal"
 
+    @pytest.mark.parametrize(
+        ("codes", "expected"),
+        [
+            (ExitCode.CATASTROPHIC, "immediate"),
+            (ExitCode.CATASTROPHIC | ExitCode.MOMENTUM, "immediate"),
+            (ExitCode.MOMENTUM | ExitCode.TECH, "urgent"),
+            (ExitCode.TECH, "normal"),
+            (ExitCode.NONE, "normal"),
+        ],
+    )
+    def test_exit_urgency_from_codes(self, momentum_strategy, codes, expected):
+        """Test urgency is resolved from the ExitCode bitmask."""
+        assert momentum_strategy._determine_exit_urgency(codes) == expected
+
 
 class TestMomentumStrategyCustomConfig:
     """Test custom configuration."""
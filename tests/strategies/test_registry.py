@@ -57,6 +57,7 @@ class TestStrategyRegistry:
         StrategyRegistry._strategies.clear()
         StrategyRegistry._instances.clear()
         StrategyRegistry._default_configs.clear()
+        StrategyRegistry._sorted_names = None
 
     def teardown_method(self):
         """Restore built-in strategies after each test."""
@@ -127,6 +128,49 @@ class TestStrategyRegistry:
         assert strategy_default is not strategy_custom
         assert strategy_default is StrategyRegistry.get("test")  # Cached instance
 
+    def test_get_default_shares_cache_with_get(self):
+        """Test that get_default() and get() return the same cached instance."""
+        StrategyRegistry.register("test", MockStrategy)
+
+        assert StrategyRegistry.get_default("test") is StrategyRegistry.get("test")
+
+    def test_get_with_config_is_not_cached(self):
+        """Test that get_with_config() builds a fresh instance every call."""
+        custom_config = StrategyConfig(name="custom", stop_loss_pct=0.10)
+        StrategyRegistry.register("test", MockStrategy)
+
+        first = StrategyRegistry.get_with_config("test", custom_config)
+        second = StrategyRegistry.get_with_config("test", custom_config)
+
+        assert first is not second
+        assert first.config is custom_config  # type: ignore[attr-defined]
+        assert "test" not in StrategyRegistry._instances
+
+    def test_get_with_config_unknown_strategy_raises_error(self):
+        """Test that get_with_config() rejects unregistered names."""
+        with pytest.raises(ValueError, match="Unknown strategy: unknown"):
+            StrategyRegistry.get_with_config("unknown", StrategyConfig(name="custom"))
+
+    def test_reregister_drops_cached_instance(self):
+        """Test that re-registering a name replaces the cached singleton."""
+        StrategyRegistry.register("test", MockStrategy)
+        first = StrategyRegistry.get("test")
+
+        StrategyRegistry.register("test", MockStrategy)
+
+        assert StrategyRegistry.get("test") is not first
+
+    def test_list_strategies_refreshes_after_register(self):
+        """Test the cached name list picks up newly registered strategies."""
+        StrategyRegistry.register("beta", MockStrategy)
+        assert StrategyRegistry.list_strategies() == ["beta"]
+
+        StrategyRegistry.register("alpha", MockStrategy)
+        names = StrategyRegistry.list_strategies()
+        names.append("mutated")
+
+        assert StrategyRegistry.list_strategies() == ["alpha", "beta"]
+
     def test_get_unknown_strategy_raises_error(self):
         """Test that getting unknown strategy raises ValueError."""
         with pytest.raises(ValueError) as exc_info:
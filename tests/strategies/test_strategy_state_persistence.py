@@ -5,7 +5,7 @@ Tests that strategy-specific state (position data, false breakout counts,
 entry times) survives restart via to_dict/from_dict serialization.
 """
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 from alpacalyzer.strategies.breakout import BreakoutPositionData, BreakoutStrategy
 from alpacalyzer.strategies.mean_reversion import MeanReversionStrategy
@@ -203,6 +203,17 @@ class TestMeanReversionStrategyStatePersistence:
         assert "TSLA" in strategy._entry_times
         assert strategy._entry_times["TSLA"] == datetime(2026, 1, 14, 14, 0, 0, tzinfo=UTC)
 
+    def test_from_dict_preserves_offsets_and_naive_times(self):
+        """Test entry times keep their UTC offset, and naive times stay naive."""
+        strategy = MeanReversionStrategy()
+
+        strategy.from_dict({"entry_times": {"AAPL": "2026-01-15T05:30:00-05:00", "MSFT": "2026-01-15T10:30:00.250000"}})
+
+        assert strategy._entry_times["AAPL"] == datetime.fromisoformat("2026-01-15T05:30:00-05:00")
+        assert strategy._entry_times["AAPL"].utcoffset() == timedelta(hours=-5)
+        assert strategy._entry_times["MSFT"] == datetime(2026, 1, 15, 10, 30, 0, 250000)
+        assert strategy._entry_times["MSFT"].tzinfo is None
+
     def test_roundtrip_serialization(self):
         """Test full roundtrip: to_dict -> from_dict preserves state."""
         original = MeanReversionStrategy()
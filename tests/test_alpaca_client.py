@@ -0,0 +1,377 @@
+"""Tests for Alpaca client helpers."""
+
+import threading
+from datetime import UTC, date, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+from alpaca.data.models import Bar
+from alpaca.trading.enums import OrderSide
+from alpaca.trading.models import Calendar
+
+from alpacalyzer.events import OrderCanceledEvent, OrderFilledEvent
+from alpacalyzer.trading.alpaca_client import (
+    _classify_market_session,
+    _ensure_calendar,
+    _get_stock_bars,
+    bars_to_df,
+    get_account_info,
+    get_current_price,
+    get_current_prices,
+    get_stock_bars,
+    history_client,
+    log_order,
+    parse_strategy_from_client_order_id,
+    prefetch_stock_bars,
+    trade_updates_handler,
+    trading_client,
+    trading_stream,
+)
+
+
+def _bar(minutes: int, close: float, trade_count: float | None = 10, vwap: float | None = 1.2) -> Bar:
+    return Bar(
+        "AAPL",
+        {
+            "t": datetime(2024, 1, 2, 14, 30, tzinfo=UTC) + timedelta(minutes=minutes),
+            "o": close - 0.5,
+            "h": close + 1.0,
+            "l": close - 1.0,
+            "c": close,
+            "v": 1000,
+            "n": trade_count,
+            "vw": vwap,
+        },
+    )
+
+
+@pytest.mark.parametrize("client", [trading_client, history_client])
+def test_sdk_sessions_use_tuned_adapter(client):
+    adapter = client._session.get_adapter("https://data.alpaca.markets")
+
+    assert adapter._pool_maxsize == 16
+    assert adapter.max_retries.total == 1
+    assert "POST" not in adapter.max_retries.allowed_methods
+
+
+def test_trading_stream_detects_dead_socket_quickly():
+    params = trading_stream._websocket_params
+
+    assert params["ping_interval"] == 10
+    assert params["ping_timeout"] == 20
+
+
+class TestBarsToDf:
+    """Tests for bars_to_df."""
+
+    def test_columns_dtypes_and_index(self):
+        df = bars_to_df([_bar(0, 100.0), _bar(5, 101.0)])
+
+        assert list(df.columns) == ["symbol", "open", "high", "low", "close", "volume", "trade_count", "vwap"]
+        assert df.index.name == "timestamp"
+        assert isinstance(df.index, pd.DatetimeIndex)
+        assert str(df.index.tz) == "UTC"
+        assert (df.dtypes.drop("symbol") == np.float64).all()
+        assert df["close"].tolist() == [100.0, 101.0]
+        assert df["symbol"].tolist() == ["AAPL", "AAPL"]
+
+    def test_missing_optional_fields_are_nan(self):
+        df = bars_to_df([_bar(0, 100.0, trade_count=None, vwap=None)])
+
+        assert np.isnan(df["trade_count"].iloc[0])
+        assert np.isnan(df["vwap"].iloc[0])
+
+    def test_out_of_order_bars_are_sorted(self):
+        df = bars_to_df([_bar(10, 102.0), _bar(0, 100.0), _bar(5, 101.0)])
+
+        assert df.index.is_monotonic_increasing
+        assert df["close"].tolist() == [100.0, 101.0, 102.0]
+
+    def test_extra_bar_is_last_row_and_bars_untouched(self):
+        bars = [_bar(0, 100.0), _bar(5, 101.0)]
+
+        df = bars_to_df(bars, extra=_bar(10, 102.0))
+
+        assert df["close"].tolist() == [100.0, 101.0, 102.0]
+        assert len(bars) == 2
+
+
+class TestGetCurrentPrices:
+    """Tests for the batched latest-trade lookup."""
+
+    def test_single_request_primes_per_ticker_cache(self):
+        trades = {"AAPL": MagicMock(price=190.5), "MSFT": MagicMock(price=410.0)}
+        get_current_price.cache_clear()
+
+        with patch("alpacalyzer.trading.alpaca_client.history_client") as mock_client:
+            mock_client.get_stock_latest_trade.return_value = trades
+
+            prices = get_current_prices(["AAPL", "MSFT"])
+
+            assert prices == {"AAPL": 190.5, "MSFT": 410.0}
+            assert get_current_price("AAPL") == 190.5
+            assert get_current_price("MSFT") == 410.0
+            mock_client.get_stock_latest_trade.assert_called_once()
+            assert mock_client.get_stock_latest_trade.call_args.args[0].symbol_or_symbols == ["AAPL", "MSFT"]
+
+        get_current_price.cache_clear()
+
+    def test_request_failure_returns_empty(self):
+        with patch("alpacalyzer.trading.alpaca_client.history_client") as mock_client:
+            mock_client.get_stock_latest_trade.side_effect = RuntimeError("boom")
+
+            assert get_current_prices(["AAPL"]) == {}
+
+    def test_failure_skips_debug_log_when_disabled(self):
+        with (
+            patch("alpacalyzer.trading.alpaca_client.history_client") as mock_client,
+            patch("alpacalyzer.trading.alpaca_client.logger") as mock_logger,
+        ):
+            mock_client.get_stock_latest_trade.side_effect = RuntimeError("boom")
+            mock_logger.isEnabledFor.return_value = False
+
+            assert get_current_price.__wrapped__("MSFT") is None
+
+        mock_logger.debug.assert_not_called()
+
+    def test_single_ticker_request_is_reused(self):
+        with patch("alpacalyzer.trading.alpaca_client.history_client") as mock_client:
+            mock_client.get_stock_latest_trade.side_effect = lambda req: {req.symbol_or_symbols: MagicMock(price=10.0)}
+
+            assert get_current_price.__wrapped__("NVDA") == 10.0
+            assert get_current_price.__wrapped__("NVDA") == 10.0
+
+        first, second = (c.args[0] for c in mock_client.get_stock_latest_trade.call_args_list)
+        assert first is second
+
+    def test_empty_tickers_skip_request(self):
+        with patch("alpacalyzer.trading.alpaca_client.history_client") as mock_client:
+            assert get_current_prices([]) == {}
+            mock_client.get_stock_latest_trade.assert_not_called()
+
+
+class TestPrefetchStockBars:
+    """Tests for the batched bars fetch."""
+
+    def test_single_request_primes_per_symbol_cache(self):
+        _get_stock_bars.cache_clear()
+
+        with patch("alpacalyzer.trading.alpaca_client.history_client") as mock_client:
+            mock_client.get_stock_bars.return_value = MagicMock(data={"AAPL": [_bar(0, 100.0), _bar(5, 101.0)]})
+            mock_client.get_stock_latest_bar.return_value = {"AAPL": _bar(10, 102.0)}
+
+            prefetch_stock_bars(["AAPL", "MSFT", "AAPL"], "minute", "open")
+
+            assert mock_client.get_stock_bars.call_args.args[0].symbol_or_symbols == ["AAPL", "MSFT"]
+            assert get_stock_bars("AAPL", "minute", "open")["close"].tolist() == [100.0, 101.0, 102.0]
+            mock_client.get_stock_bars.assert_called_once()
+
+            assert get_stock_bars("MSFT", "minute", "open") is None  # no bars in the batch, fetched on its own
+            assert mock_client.get_stock_bars.call_count == 2
+
+        _get_stock_bars.cache_clear()
+
+    def test_closed_market_skips_latest_bar(self):
+        _get_stock_bars.cache_clear()
+
+        with patch("alpacalyzer.trading.alpaca_client.history_client") as mock_client:
+            mock_client.get_stock_bars.return_value = MagicMock(data={"AAPL": [_bar(0, 100.0)]})
+
+            prefetch_stock_bars(["AAPL"], "day", "closed")
+
+            mock_client.get_stock_latest_bar.assert_not_called()
+            assert get_stock_bars("AAPL", "day", "closed")["close"].tolist() == [100.0, 100.0]
+
+        _get_stock_bars.cache_clear()
+
+    def test_request_failure_leaves_cache_cold(self):
+        _get_stock_bars.cache_clear()
+
+        with patch("alpacalyzer.trading.alpaca_client.history_client") as mock_client:
+            mock_client.get_stock_bars.side_effect = [RuntimeError("boom"), MagicMock(data={})]
+
+            prefetch_stock_bars(["AAPL"], "day", "closed")
+
+            assert get_stock_bars("AAPL", "day", "closed") is None
+            assert mock_client.get_stock_bars.call_count == 2
+
+        _get_stock_bars.cache_clear()
+
+
+class TestGetAccountInfo:
+    """Tests for get_account_info."""
+
+    @staticmethod
+    def _account() -> MagicMock:
+        return MagicMock(equity="1000.5", buying_power="2000", initial_margin=None, multiplier="2", daytrading_buying_power="0", maintenance_margin="150")
+
+    def test_cached_read_only_mapping(self, monkeypatch):
+        monkeypatch.setattr("alpacalyzer.trading.alpaca_client._account_info_cache", None)
+
+        with patch("alpacalyzer.trading.alpaca_client.trading_client") as mock_client:
+            mock_client.get_account.return_value = self._account()
+
+            info = get_account_info()
+            assert get_account_info() is info
+
+        mock_client.get_account.assert_called_once()
+        assert info["equity"] == 1000.5
+        assert info["initial_margin"] == 0.0
+        assert info["margin_multiplier"] == 2.0
+        with pytest.raises(TypeError):
+            info["equity"] = 0.0  # type: ignore[index]
+
+    def test_refetches_after_ttl(self, monkeypatch):
+        monkeypatch.setattr("alpacalyzer.trading.alpaca_client._account_info_cache", None)
+        monkeypatch.setattr("alpacalyzer.trading.alpaca_client.time", MagicMock(monotonic=MagicMock(side_effect=[100.0, 104.0, 106.0])))
+
+        with patch("alpacalyzer.trading.alpaca_client.trading_client") as mock_client:
+            mock_client.get_account.return_value = self._account()
+
+            first = get_account_info()
+            assert get_account_info() is first
+            assert get_account_info() is not first
+
+        assert mock_client.get_account.call_count == 2
+
+
+SESSION = (datetime(2024, 1, 2, 14, 30, tzinfo=UTC), datetime(2024, 1, 2, 21, 0, tzinfo=UTC))
+
+
+class TestMarketStatus:
+    """Tests for local market session classification."""
+
+    @pytest.mark.parametrize(
+        ("now", "session", "expected"),
+        [
+            (datetime(2024, 1, 2, 15, 0, tzinfo=UTC), SESSION, "open"),
+            (datetime(2024, 1, 2, 12, 0, tzinfo=UTC), SESSION, "pre-market"),
+            (datetime(2024, 1, 2, 9, 0, tzinfo=UTC), SESSION, "closed"),
+            (datetime(2024, 1, 2, 22, 0, tzinfo=UTC), SESSION, "after-hours"),
+            (datetime(2024, 1, 3, 1, 30, tzinfo=UTC), SESSION, "closed"),
+            (datetime(2024, 1, 6, 15, 0, tzinfo=UTC), None, "closed"),
+        ],
+    )
+    def test_classify_market_session(self, now, session, expected):
+        assert _classify_market_session(now, session) == expected
+
+    def test_calendar_fetched_once_per_day(self, monkeypatch):
+        calendar = [Calendar(date="2024-01-02", open="09:30", close="16:00"), Calendar(date="2024-01-03", open="09:30", close="13:00")]
+        monkeypatch.setattr("alpacalyzer.trading.alpaca_client._calendar_cache", {})
+        monkeypatch.setattr("alpacalyzer.trading.alpaca_client._calendar_cache_loaded", None)
+
+        with patch("alpacalyzer.trading.alpaca_client.trading_client") as mock_client:
+            mock_client.get_calendar.return_value = calendar
+
+            sessions = _ensure_calendar(date(2024, 1, 2))
+            _ensure_calendar(date(2024, 1, 2))
+
+            mock_client.get_calendar.assert_called_once()
+            request = mock_client.get_calendar.call_args.args[0]
+            assert request.start == date(2023, 12, 26)
+            assert request.end == date(2024, 2, 1)
+            assert sessions[date(2024, 1, 2)] == SESSION
+            assert sessions[date(2024, 1, 3)][1] == datetime(2024, 1, 3, 18, 0, tzinfo=UTC)
+
+            _ensure_calendar(date(2024, 1, 3))
+            assert mock_client.get_calendar.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("client_order_id", "expected"),
+    [
+        ("momentum_AAPL_buy_1a2b", "momentum"),
+        ("mean_reversion_AAPL_sell_1a2b", "mean_reversion"),
+        ("swingtrade-1a2b", "swing"),
+        ("dayorder", "day"),
+        ("1a2b3c", "bracket"),
+    ],
+)
+def test_parse_strategy_from_client_order_id(client_order_id, expected):
+    assert parse_strategy_from_client_order_id(client_order_id) == expected
+
+
+class TestLogOrder:
+    """Tests for log_order."""
+
+    @staticmethod
+    def _order(legs: list | None = None) -> MagicMock:
+        order = MagicMock(symbol="AAPL", side="buy", qty="10", order_type="limit", limit_price="190.0", stop_price=None, filled_qty="0", filled_avg_price=None, id="o1")
+        order.order_class.value = "bracket"
+        order.time_in_force.value = "gtc"
+        order.status.value = "new"
+        order.legs = legs
+        return order
+
+    def test_logs_order_and_legs_on_one_line(self):
+        leg = MagicMock(side="sell", order_type="stop", qty="10", limit_price=None, stop_price="180.0")
+        leg.status.value = "held"
+
+        with patch("alpacalyzer.trading.alpaca_client.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = True
+            log_order(self._order([leg, leg]))
+
+        message = mock_logger.info.call_args.args[0]
+        assert message.startswith("order submitted | ticker=AAPL side=buy qty=10")
+        assert message.endswith("order_id=o1 leg=sell type=stop qty=10 limit=N/A stop=180.0 status=held leg=sell type=stop qty=10 limit=N/A stop=180.0 status=held")
+
+    def test_skips_formatting_when_info_disabled(self):
+        order = self._order()
+
+        with patch("alpacalyzer.trading.alpaca_client.logger") as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            log_order(order)
+
+        mock_logger.info.assert_not_called()
+
+
+class TestTradeUpdatesHandler:
+    """Tests for the trade update stream handler."""
+
+    @staticmethod
+    def _update(event: str) -> MagicMock:
+        order = MagicMock(client_order_id="momentum_AAPL_buy_1", symbol="AAPL", side=OrderSide.BUY, qty="10", filled_qty="10", filled_avg_price="190.5", limit_price=None, stop_price=None, id="o1")
+        return MagicMock(order=order, event=event, price=None, reason=None)
+
+    @pytest.mark.asyncio
+    async def test_fill_logs_one_line_and_emits_event(self):
+        with patch("alpacalyzer.trading.alpaca_client.logger") as mock_logger, patch("alpacalyzer.trading.alpaca_client.emit_event") as mock_emit:
+            await trade_updates_handler(self._update("fill"))
+
+        mock_logger.info.assert_called_once()
+        message = mock_logger.info.call_args.args[0]
+        assert message.startswith("order fill | ticker=AAPL Cum: 10/10 @ 190.5")
+        assert "strategy=momentum side=BUY" in message
+        assert isinstance(mock_emit.call_args.args[0], OrderFilledEvent)
+
+    @pytest.mark.asyncio
+    async def test_cancel_logs_trade_update(self):
+        with patch("alpacalyzer.trading.alpaca_client.logger") as mock_logger, patch("alpacalyzer.trading.alpaca_client.emit_event") as mock_emit:
+            await trade_updates_handler(self._update("canceled"))
+
+        assert mock_logger.info.call_args.args[0].startswith("trade update | event=canceled ticker=AAPL")
+        assert isinstance(mock_emit.call_args.args[0], OrderCanceledEvent)
+
+    @pytest.mark.asyncio
+    async def test_accepted_skips_fill_parsing(self):
+        update = self._update("new")
+        update.order.qty = "not-a-number"
+        update.order.side = None
+
+        with patch("alpacalyzer.trading.alpaca_client.logger") as mock_logger, patch("alpacalyzer.trading.alpaca_client.emit_event") as mock_emit:
+            await trade_updates_handler(update)
+
+        mock_logger.info.assert_called_once_with("trade update | event=new ticker=AAPL strategy=momentum side=BUY")
+        mock_emit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_events_emitted_off_the_event_loop(self):
+        loop_thread = threading.get_ident()
+        emit_threads = []
+
+        with patch("alpacalyzer.trading.alpaca_client.logger"), patch("alpacalyzer.trading.alpaca_client.emit_event", side_effect=lambda event: emit_threads.append(threading.get_ident())):
+            await trade_updates_handler(self._update("fill"))
+
+        assert emit_threads and emit_threads[0] != loop_thread
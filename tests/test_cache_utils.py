@@ -0,0 +1,74 @@
+"""Tests for the timed LRU cache decorator."""
+
+from unittest.mock import patch
+
+from alpacalyzer.utils.cache_utils import timed_lru_cache
+
+
+def _counting(seconds: int = 60, maxsize: int = 128):
+    calls = []
+
+    @timed_lru_cache(seconds=seconds, maxsize=maxsize)
+    def fetch(key):
+        calls.append(key)
+        return f"{key}-{len(calls)}"
+
+    return fetch, calls
+
+
+def test_entry_expires_from_when_it_was_computed_even_while_read():
+    fetch, calls = _counting(seconds=60)
+    clock = [1000.0]
+
+    with patch("alpacalyzer.utils.cache_utils.time", side_effect=lambda: clock[0]):
+        assert fetch("VIX") == "VIX-1"
+        for _ in range(4):  # read every 15s, which must not keep the entry alive
+            clock[0] += 15
+            assert fetch("VIX") == "VIX-1"
+        clock[0] += 15  # 75s after the fetch
+        assert fetch("VIX") == "VIX-2"
+
+    assert calls == ["VIX", "VIX"]
+
+
+def test_expired_entry_does_not_evict_others():
+    fetch, calls = _counting(seconds=60)
+    clock = [1000.0]
+
+    with patch("alpacalyzer.utils.cache_utils.time", side_effect=lambda: clock[0]):
+        fetch("AAPL")
+        clock[0] += 50
+        fetch("MSFT")
+        clock[0] += 20  # AAPL expired, MSFT still fresh
+        fetch("AAPL")
+        fetch("MSFT")
+
+    assert calls == ["AAPL", "MSFT", "AAPL"]
+
+
+def test_least_recently_used_entry_evicted_at_maxsize():
+    fetch, calls = _counting(maxsize=2)
+
+    fetch("AAPL")
+    fetch("MSFT")
+    fetch("AAPL")
+    fetch("NVDA")  # evicts MSFT, the least recently used
+    fetch("AAPL")
+    fetch("MSFT")
+
+    assert calls == ["AAPL", "MSFT", "NVDA", "MSFT"]
+
+
+def test_primed_value_served_and_expires():
+    fetch, calls = _counting(seconds=60)
+    clock = [1000.0]
+
+    with patch("alpacalyzer.utils.cache_utils.time", side_effect=lambda: clock[0]):
+        fetch.cache_prime("primed", "AAPL")
+        assert fetch("AAPL") == "primed"
+        clock[0] += 61
+        assert fetch("AAPL") == "AAPL-1"
+
+    fetch.cache_clear()
+    assert fetch("AAPL") == "AAPL-2"
+    assert calls == ["AAPL", "AAPL"]
@@ -82,6 +82,20 @@ class TestCooldownEntry:
         result = entry.is_expired()
         assert isinstance(result, bool)
 
+    def test_is_expired_uses_given_time(self):
+        """Test is_expired evaluates against an explicit reference time."""
+        exit_time = datetime(2024, 1, 2, 15, 0, tzinfo=UTC)
+        entry = CooldownEntry(
+            ticker="AAPL",
+            exit_time=exit_time,
+            cooldown_hours=3,
+            reason="stop_loss_hit",
+            strategy_name="momentum",
+        )
+
+        assert not entry.is_expired(exit_time + timedelta(hours=2))
+        assert entry.is_expired(exit_time + timedelta(hours=4))
+
     def test_remaining_time_when_active(self):
         """Test remaining_time returns positive timedelta when active."""
         entry = CooldownEntry(
@@ -126,3 +126,74 @@ class TestPricesToDf:
         assert "close" in df.columns
         assert df.iloc[0]["close"] == 101.0
         assert df.iloc[1]["close"] == 102.0
+
+
+class TestGetPrices:
+    """Tests for Yahoo Finance price conversion."""
+
+    def test_history_rows_become_prices(self):
+        """Test each history row maps to a Price in index order."""
+        import pandas as pd
+
+        from alpacalyzer.data.api import get_prices
+
+        history = pd.DataFrame(
+            {"Open": [100, 101.5], "High": [102.0, 103.0], "Low": [99.0, 100.0], "Close": [101.0, 102.5], "Volume": [1000.0, 1100]},
+            index=pd.DatetimeIndex(["2024-01-02", "2024-01-03"], tz="America/New_York"),
+        )
+
+        with (
+            patch("alpacalyzer.data.api._cache") as mock_cache,
+            patch("alpacalyzer.data.api.yf.Ticker") as mock_ticker,
+        ):
+            mock_cache.get_prices.return_value = None
+            mock_ticker.return_value.history.return_value = history
+
+            prices = get_prices("AAPL", "2024-01-01", "2024-01-05")
+
+        assert [p.time for p in prices] == ["2024-01-02", "2024-01-03"]
+        assert prices[0].open == 100.0
+        assert prices[1].close == 102.5
+        assert prices[0].volume == 1000
+        mock_cache.set_prices.assert_called_once()
+
+
+class TestYFinanceClientCache:
+    """Tests for the YFinanceClient lookup caches."""
+
+    def test_vix_cache_shared_across_instances(self):
+        """Test a fresh client reuses the VIX fetched by another instance."""
+        import pandas as pd
+
+        from alpacalyzer.trading.yfinance_client import YFinanceClient
+
+        YFinanceClient.get_vix.cache_clear()  # type: ignore[attr-defined]
+        try:
+            with patch("alpacalyzer.trading.yfinance_client.yf.Ticker") as mock_ticker:
+                mock_ticker.return_value.history.return_value = pd.DataFrame({"Close": [18.0, 19.5]})
+
+                assert YFinanceClient().get_vix() == 19.5
+                assert YFinanceClient().get_vix() == 19.5
+
+            mock_ticker.assert_called_once_with("^VIX")
+        finally:
+            YFinanceClient.get_vix.cache_clear()  # type: ignore[attr-defined]
+
+    def test_no_cache_flag_refetches_through_client_cache(self):
+        """Test get_vix(use_cache=False) bypasses the shared client cache as well."""
+        import pandas as pd
+
+        from alpacalyzer.data.api import _vix_cache, get_vix
+        from alpacalyzer.trading.yfinance_client import YFinanceClient
+
+        _vix_cache.clear()
+        YFinanceClient.get_vix.cache_clear()  # type: ignore[attr-defined]
+        try:
+            with patch("alpacalyzer.trading.yfinance_client.yf.Ticker") as mock_ticker:
+                mock_ticker.return_value.history.side_effect = [pd.DataFrame({"Close": [18.0]}), pd.DataFrame({"Close": [22.0]})]
+
+                assert get_vix() == 18.0
+                assert get_vix(use_cache=False) == 22.0
+        finally:
+            _vix_cache.clear()
+            YFinanceClient.get_vix.cache_clear()  # type: ignore[attr-defined]
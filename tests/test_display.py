@@ -2,7 +2,7 @@ from unittest.mock import patch
 
 import pytest
 
-from alpacalyzer.utils.display import print_trading_output
+from alpacalyzer.utils.display import print_trading_output, wrap_text
 
 
 @pytest.fixture
@@ -313,3 +313,9 @@ def test_print_trading_output_with_strategy_display(mock_logger, mock_tabulate,
             break
 
     assert strategy_header_printed, "Trading strategy section header not printed"
+
+
+def test_wrap_text_breaks_at_width():
+    assert wrap_text("alpha beta gamma delta", width=11) == "alpha beta\ngamma delta"
+    assert wrap_text("", width=10) == ""
+    assert wrap_text({"a": 1}, width=60) == '{ "a": 1 }'
@@ -1,8 +1,11 @@
 """Tests for EOD Performance Analyzer JSON event parsing."""
 
+from datetime import UTC, datetime
+from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
 import pytest
+from alpaca.trading.models import Calendar
 
 from alpacalyzer.analysis.eod_performance import EODPerformanceAnalyzer
 
@@ -333,3 +336,19 @@ def test_build_strategy_performance(analyzer):
     assert strategy_perf["mean_reversion"]["exits"] == 1
     assert strategy_perf["mean_reversion"]["wins"] == 0
     assert strategy_perf["mean_reversion"]["total_pnl"] == -500.0
+
+
+def test_session_close_looked_up_once_per_date(analyzer):
+    et = ZoneInfo("America/New_York")
+    calendar = [Calendar(date="2024-01-05", open="09:30", close="16:00")]
+
+    with patch("alpacalyzer.analysis.eod_performance.trading_client") as mock_client:
+        mock_client.get_calendar.side_effect = [calendar, []]
+
+        first = analyzer._get_session_close_utc_for_et_date(datetime(2024, 1, 5, 10, 0, tzinfo=et))
+        second = analyzer._get_session_close_utc_for_et_date(datetime(2024, 1, 5, 14, 0, tzinfo=et))
+        assert analyzer._get_session_close_utc_for_et_date(datetime(2024, 1, 6, 10, 0, tzinfo=et)) is None
+        assert analyzer._get_session_close_utc_for_et_date(datetime(2024, 1, 6, 12, 0, tzinfo=et)) is None
+
+    assert first == second == datetime(2024, 1, 5, 21, 0, tzinfo=UTC)
+    assert mock_client.get_calendar.call_count == 2
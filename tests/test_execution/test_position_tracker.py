@@ -3,6 +3,7 @@
 from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
+import pytest
 from alpaca.trading.models import Position
 
 
@@ -535,6 +536,62 @@ class TestPositionTracker:
         assert position.market_value == 16000.0
         assert position.unrealized_pnl == 1000.0
 
+    def test_sync_from_broker_merges_broker_fills(self):
+        """Test sync_from_broker takes the broker's merged quantity and entry price."""
+        from alpacalyzer.execution.position_tracker import PositionTracker
+
+        tracker = PositionTracker()
+        tracker.add_position(ticker="AAPL", side="long", quantity=100, entry_price=150.0, strategy_name="momentum")
+
+        mock_position = MagicMock(spec=Position)
+        mock_position.symbol = "AAPL"
+        mock_position.qty = "150"
+        mock_position.avg_entry_price = "152.0"
+        mock_position.current_price = "160.0"
+
+        with patch("alpacalyzer.trading.alpaca_client.get_positions", return_value=[mock_position]):
+            changes = tracker.sync_from_broker()
+
+        position = tracker.get("AAPL")
+        assert changes == []
+        assert position is not None
+        assert position.quantity == 150
+        assert position.avg_entry_price == 152.0
+        assert position.strategy_name == "momentum"
+        assert position.unrealized_pnl == 1200.0
+
+    def test_sync_from_broker_malformed_position_keeps_tracked_state(self):
+        """Test a malformed broker position leaves the tracked positions untouched."""
+        from alpacalyzer.execution.position_tracker import PositionTracker
+
+        tracker = PositionTracker()
+        tracker.add_position(ticker="AAPL", side="long", quantity=100, entry_price=150.0, strategy_name="momentum", stop_loss=140.0)
+        tracker.add_position(ticker="MSFT", side="long", quantity=50, entry_price=300.0, strategy_name="swing")
+
+        good = MagicMock(spec=Position)
+        good.symbol = "AAPL"
+        good.qty = "100"
+        good.avg_entry_price = "150.0"
+        good.current_price = "160.0"
+        bad = MagicMock(spec=Position)
+        bad.symbol = "MSFT"
+        bad.qty = "not-a-number"
+        bad.avg_entry_price = "300.0"
+        bad.current_price = "310.0"
+
+        with patch("alpacalyzer.trading.alpaca_client.get_positions", return_value=[good, bad]), pytest.raises(ValueError):
+            tracker.sync_from_broker()
+
+        assert tracker.count() == 2
+        aapl = tracker.get("AAPL")
+        assert aapl is not None
+        assert aapl.strategy_name == "momentum"
+        assert aapl.stop_loss == 140.0
+        msft = tracker.get("MSFT")
+        assert msft is not None
+        assert msft.strategy_name == "swing"
+        assert tracker.get_closed_positions() == []
+
     def test_sync_from_broker_remove_closed(self):
         """Test sync_from_broker removes closed positions."""
         from alpacalyzer.execution.position_tracker import PositionTracker
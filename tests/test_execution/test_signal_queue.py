@@ -385,6 +385,17 @@ class TestSignalQueue:
         assert queue.contains("AAPL") is False
         assert queue.contains("MSFT") is True
 
+    def test_cleanup_keeps_live_signal_with_same_priority(self):
+        """Test that expiring one signal does not drop another of equal priority."""
+        from alpacalyzer.execution.signal_queue import PendingSignal, SignalQueue
+
+        queue = SignalQueue()
+        queue.add(PendingSignal(priority=50, ticker="AAPL", action="buy", confidence=75.0, source="test", expires_at=datetime.now(UTC) - timedelta(hours=1)))
+        queue.add(PendingSignal(priority=50, ticker="MSFT", action="buy", confidence=75.0, source="test", expires_at=datetime.now(UTC) + timedelta(hours=1)))
+
+        assert queue.size() == 1
+        assert queue.peek().ticker == "MSFT"
+
     def test_priority_ordering(self):
         """Test that signals are popped in priority order."""
         from alpacalyzer.execution.signal_queue import PendingSignal, SignalQueue
@@ -122,6 +122,15 @@ class TestExecutionEngine:
 
         assert engine.signal_queue.size() == 1
 
+    def test_blocked_tickers(self):
+        """Positions, cooldowns and queued signals all block new analysis."""
+        engine = ExecutionEngine(MockStrategy())
+        engine.positions._positions["AAPL"] = MagicMock()
+        engine.cooldowns.add_cooldown("MSFT", reason="test")
+        engine.add_signal(PendingSignal(priority=50, ticker="NVDA", action="buy", confidence=75.0, source="test"))
+
+        assert engine.blocked_tickers() == {"AAPL", "MSFT", "NVDA"}
+
     def test_start_stop(self):
         """Can start and stop the engine."""
         engine = ExecutionEngine(MockStrategy())
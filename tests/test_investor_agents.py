@@ -101,6 +101,8 @@ class TestInvestorAgentSerializeFunctions:
         result = serialize_buffett_analysis("AAPL", analysis_data)
         parsed = json.loads(result)
 
+        assert result == json.dumps(parsed, separators=(",", ":"))  # compact: no whitespace tokens in the prompt
+
         assert parsed["ticker"] == "AAPL"
         assert parsed["signal"] == "bullish"
         assert parsed["score"] == "8.0/10"
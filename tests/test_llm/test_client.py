@@ -57,3 +57,24 @@ class TestLLMClient:
         with patch("alpacalyzer.llm.client.OpenAI", return_value=mock_client):
             client = LLMClient(default_headers={"X-Custom": "Value"})
             assert client.client.default_headers.get("X-Custom") == "Value"
+
+    def test_complete_structured_sends_temperature_only_when_given(self):
+        from pydantic import BaseModel
+
+        class Answer(BaseModel):
+            answer: str
+
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = '{"answer": "42"}'
+        client = LLMClient(api_key="test-key", base_url="http://fake")
+
+        with (
+            patch.object(client.client.chat.completions, "create", return_value=mock_response) as mock_create,
+            patch("alpacalyzer.llm.client.emit_event"),
+        ):
+            client.complete_structured(messages=[{"role": "user", "content": "q"}], response_model=Answer)
+            client.complete_structured(messages=[{"role": "user", "content": "q"}], response_model=Answer, temperature=0)
+
+        default_call, pinned_call = mock_create.call_args_list
+        assert "temperature" not in default_call.kwargs
+        assert pinned_call.kwargs["temperature"] == 0
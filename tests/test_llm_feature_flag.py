@@ -5,7 +5,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 from pydantic import BaseModel
 
-from alpacalyzer.llm import complete_structured, use_new_llm
+from alpacalyzer import llm
+from alpacalyzer.llm import LLMTier, complete_structured, complete_structured_cached, use_new_llm
 
 
 class SampleModel(BaseModel):
@@ -74,3 +75,21 @@ class TestCompleteStructured:
                     messages=[{"role": "user", "content": "test"}],
                     response_model=SampleModel,
                 )
+
+
+class TestCompleteStructuredCached:
+    def test_cache_keyed_per_caller_and_pinned_to_temperature_zero(self, monkeypatch):
+        monkeypatch.setattr(llm, "_response_cache", {})
+        mock_client = MagicMock()
+        mock_client.complete_structured.side_effect = [SampleModel(name="a", value=1), SampleModel(name="b", value=2)]
+        messages = [{"role": "user", "content": "same prompt"}]
+
+        with patch("alpacalyzer.llm.get_llm_client", return_value=mock_client):
+            first = complete_structured_cached(messages, SampleModel, LLMTier.FAST, caller="one", ttl=60)
+            again = complete_structured_cached(messages, SampleModel, LLMTier.FAST, caller="one", ttl=60)
+            other = complete_structured_cached(messages, SampleModel, LLMTier.FAST, caller="two", ttl=60)
+
+        assert again == first and again is not first
+        assert other.name == "b"
+        assert mock_client.complete_structured.call_count == 2
+        assert all(call.kwargs["temperature"] == 0 for call in mock_client.complete_structured.call_args_list)
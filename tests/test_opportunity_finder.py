@@ -0,0 +1,81 @@
+"""Tests for the opportunity finder's Reddit fetching and LLM response cache."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+import pytest
+
+from alpacalyzer import llm
+from alpacalyzer.data.models import TopTicker, TopTickersResponse
+from alpacalyzer.trading import opportunity_finder
+from alpacalyzer.trading.opportunity_finder import format_top_tickers, get_reddit_insights, get_top_candidates
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache(monkeypatch):
+    monkeypatch.setattr(llm, "_response_cache", {})
+
+
+def _ticker(symbol: str = "AAPL") -> TopTicker:
+    return TopTicker(ticker=symbol, signal="bullish", confidence=80.0, reasoning="Strong momentum")
+
+
+def test_format_top_tickers():
+    assert format_top_tickers([_ticker("AAPL"), _ticker("MSFT")]) == (
+        "Symbol: AAPL\nSignal: bullish\nConfidence: 80.0%\nReasoning: Strong momentum\n\nSymbol: MSFT\nSignal: bullish\nConfidence: 80.0%\nReasoning: Strong momentum\n"
+    )
+
+
+def test_identical_prompt_reuses_response():
+    client = MagicMock()
+    client.complete_structured.return_value = TopTickersResponse(top_tickers=[_ticker()])
+    df = pd.DataFrame({"Ticker": ["AAPL"], "Price": [150.0]})
+
+    with patch("alpacalyzer.llm.get_llm_client", return_value=client):
+        first = get_top_candidates([_ticker()], df)
+        first.top_tickers.clear()
+        second = get_top_candidates([_ticker()], df)
+        get_top_candidates([_ticker("MSFT")], df)
+
+    assert [t.ticker for t in second.top_tickers] == ["AAPL"]
+    assert client.complete_structured.call_count == 2
+    assert all(call.kwargs["temperature"] == 0 for call in client.complete_structured.call_args_list)
+
+
+def test_expired_or_failed_response_is_refetched(monkeypatch):
+    client = MagicMock()
+    client.complete_structured.side_effect = [None, TopTickersResponse(top_tickers=[_ticker()]), TopTickersResponse(top_tickers=[])]
+    clock = MagicMock()
+    clock.monotonic.return_value = 1000.0
+    monkeypatch.setattr(llm, "time", clock)
+    df = pd.DataFrame({"Ticker": ["AAPL"]})
+
+    with patch("alpacalyzer.llm.get_llm_client", return_value=client):
+        assert get_top_candidates([_ticker()], df) is None
+        assert get_top_candidates([_ticker()], df).top_tickers
+        clock.monotonic.return_value = 1000.0 + opportunity_finder.LLM_RESPONSE_TTL
+        assert get_top_candidates([_ticker()], df).top_tickers == []
+
+    assert client.complete_structured.call_count == 3
+
+
+def test_reddit_feeds_fetched_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fetch(name):
+        barrier.wait()  # only passes if both feeds are requested at once
+        return [{"title": f"{name} idea", "body": "text"}]
+
+    client = MagicMock()
+    client.complete_structured.return_value = TopTickersResponse(top_tickers=[_ticker()])
+
+    with (
+        patch("alpacalyzer.trading.opportunity_finder.fetch_reddit_posts", side_effect=fetch),
+        patch("alpacalyzer.trading.opportunity_finder.fetch_user_posts", side_effect=fetch),
+        patch("alpacalyzer.llm.get_llm_client", return_value=client),
+    ):
+        assert get_reddit_insights().top_tickers[0].ticker == "AAPL"
+
+    prompt = client.complete_structured.call_args.args[0][1]["content"]
+    assert prompt.index("TradingEdge idea") < prompt.index("WinningWatchlist idea")
@@ -285,6 +285,22 @@ class TestTradingOrchestratorAnalyze:
             assert len(call_args) == 1
             assert call_args[0].ticker == "MSFT"
 
+    def test_analyze_skips_tickers_blocked_by_engine(self, orchestrator, mock_execution_engine):
+        """Test that analyze() skips tickers the engine already holds, cools down or has queued."""
+        opportunities = [
+            TopTicker(ticker="AAPL", confidence=75, signal="bullish", reasoning="Strong momentum"),
+            TopTicker(ticker="MSFT", confidence=80, signal="bullish", reasoning="Strong momentum"),
+        ]
+        mock_execution_engine.blocked_tickers.return_value = {"AAPL"}
+
+        with patch("alpacalyzer.orchestrator.get_positions", return_value=[]), patch("alpacalyzer.orchestrator.call_hedge_fund_agents") as mock_hedge_fund:
+            mock_hedge_fund.return_value = {"decisions": {}, "analyst_signals": {}}
+
+            orchestrator.analyze(opportunities)
+
+            call_args = mock_hedge_fund.call_args[0][0]
+            assert [opp.ticker for opp in call_args] == ["MSFT"]
+
 
 class TestTradingOrchestratorExecute:
     """Tests for TradingOrchestrator.execute() method."""
@@ -269,6 +269,18 @@ class TestOrderManager:
         assert mock_order.client_order_id in order_manager._pending_orders
         mock_trading_client.submit_order.assert_called_once()
 
+    def test_submit_bracket_order_defers_request_formatting(self, order_manager, mock_trading_client):
+        """Test the order request is passed to the debug log unformatted."""
+        mock_trading_client.get_asset.return_value = Mock(spec=Asset, tradable=True, shortable=True)
+        mock_trading_client.submit_order.return_value = Mock(spec=Order, id="order123", client_order_id="momentum_AAPL_buy_12345678", symbol="AAPL")
+        params = OrderParams(ticker="AAPL", side="buy", quantity=100, entry_price=150.00, stop_loss=145.50, target=163.50, strategy_name="momentum")
+
+        with patch("alpacalyzer.execution.order_manager.log_order"), patch("alpacalyzer.execution.order_manager.logger") as mock_logger:
+            order_manager.submit_bracket_order(params)
+
+        request = mock_trading_client.submit_order.call_args.args[0]
+        mock_logger.debug.assert_any_call("Submitting bracket order: %s", request)
+
     def test_submit_bracket_order_asset_validation_failure(self, order_manager, mock_trading_client):
         """Test bracket order submission with asset validation failure."""
         # Mock asset validation failure
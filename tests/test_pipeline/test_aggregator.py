@@ -447,6 +447,13 @@ class TestOpportunityAggregator:
         assert aggregator._last_aggregation is not None
         assert isinstance(aggregator._last_aggregation, datetime)
 
+    def test_aggregate_uses_one_timestamp(self, aggregator, sample_scan_results):
+        """Test that every opportunity in a pass is stamped with the same instant."""
+        aggregator.aggregate(sample_scan_results)
+
+        stamps = {opp.first_seen for opp in aggregator._opportunities.values()} | {opp.last_seen for opp in aggregator._opportunities.values()}
+        assert stamps == {aggregator._last_aggregation}
+
     def test_aggregate_skips_cached_results(self, aggregator):
         """Test that cached scan results are not re-processed into opportunities."""
         fresh_result = ScanResult(
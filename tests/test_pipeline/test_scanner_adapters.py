@@ -0,0 +1,31 @@
+"""Tests for the pipeline scanner adapters' DataFrame conversion."""
+
+from unittest.mock import patch
+
+import pandas as pd
+
+from alpacalyzer.pipeline.scanner_adapters import FinvizScannerAdapter, WSBScannerAdapter
+
+
+class TestDfToTickers:
+    def test_wsb_rows_converted_and_blank_tickers_skipped(self):
+        with patch("alpacalyzer.scanners.wsb_scanner.WSBScanner"):
+            adapter = WSBScannerAdapter()
+        df = pd.DataFrame({"ticker": ["AAPL", "", "MSFT"], "mentions": [25, 3, 4], "rank": [1, 2, 3], "score": [0.9, 0.5, 1.4]})
+
+        tickers = adapter._df_to_tickers(df)
+
+        assert [t.ticker for t in tickers] == ["AAPL", "MSFT"]
+        assert [t.signal for t in tickers] == ["bullish", "neutral"]
+        assert tickers[1].confidence == 1.0
+        assert tickers[0].reasoning == "Rank 1 with 25 mentions (score: 0.90)"
+
+    def test_finviz_skips_unparseable_rows(self):
+        with patch("alpacalyzer.scanners.finviz_scanner.FinvizScanner"):
+            adapter = FinvizScannerAdapter()
+        df = pd.DataFrame({"Ticker": ["AAPL", "MSFT"], "Relative Volume": [5.0, "n/a"], "RSI": [25.0, 50.0]})
+
+        tickers = adapter._df_to_tickers(df)
+
+        assert [t.ticker for t in tickers] == ["AAPL"]
+        assert tickers[0].signal == "bullish"
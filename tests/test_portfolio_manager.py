@@ -0,0 +1,181 @@
+"""Tests for the portfolio management agent's signal aggregation."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from alpacalyzer import llm
+from alpacalyzer.data.models import PortfolioDecision, PortfolioManagerOutput
+from alpacalyzer.trading.portfolio_manager import generate_trading_decision, portfolio_management_agent
+
+
+@pytest.fixture(autouse=True)
+def clear_decision_cache(monkeypatch):
+    monkeypatch.setattr(llm, "_response_cache", {})
+
+
+def test_signals_aggregated_per_ticker():
+    state = {
+        "messages": [],
+        "metadata": {"show_reasoning": False},
+        "data": {
+            "portfolio": {"cash": 1000.0, "positions": {"MSFT": {"shares": 3, "side": "long"}, "NVDA": {"shares": 2, "side": "short"}}},
+            "tickers": ["AAPL", "MSFT", "NVDA"],
+            "analyst_signals": {
+                "risk_management_agent": {
+                    "AAPL": {"remaining_position_limit": 1000.0, "current_price": 150.0},
+                    "MSFT": {"remaining_position_limit": 500.0, "current_price": 0},
+                    "NVDA": {"remaining_position_limit": -250.0, "current_price": 100.0},
+                },
+                "technical_analyst_agent": {
+                    "AAPL": {"signal": "bullish", "confidence": 80, "reasoning": "trend"},
+                    "NVDA": {"signal": "bearish", "confidence": 60, "reasoning": "overbought"},
+                },
+                "sentiment_agent": {"AAPL": {"signal": "neutral", "confidence": 50}},
+            },
+        },
+    }
+
+    with (
+        patch("alpacalyzer.trading.portfolio_manager.generate_trading_decision", return_value=None) as decide,
+        patch("alpacalyzer.trading.portfolio_manager.progress") as progress,
+    ):
+        portfolio_management_agent(state)
+
+    kwargs = decide.call_args.kwargs
+    assert kwargs["signals_by_ticker"] == {
+        "AAPL": {"technical_analyst_agent": {"signal": "bullish", "confidence": 80}, "sentiment_agent": {"signal": "neutral", "confidence": 50}},
+        "MSFT": {},
+        "NVDA": {"technical_analyst_agent": {"signal": "bearish", "confidence": 60}},
+    }
+    assert kwargs["current_prices"] == {"AAPL": 150.0, "MSFT": 0, "NVDA": 100.0}
+    assert kwargs["max_shares"] == {"AAPL": 6, "MSFT": 0, "NVDA": -2}  # truncated like int()
+    assert all(type(shares) is int for shares in kwargs["max_shares"].values())
+    assert progress.update_status.call_count == 3  # not once per ticker
+
+
+def test_tickers_without_capacity_or_position_are_held_without_llm():
+    state = {
+        "messages": [],
+        "metadata": {"show_reasoning": False},
+        "data": {
+            "portfolio": {"cash": 1000.0, "positions": {"MSFT": {"shares": 3, "side": "long"}}},
+            "tickers": ["AAPL", "MSFT", "TSLA"],
+            "analyst_signals": {
+                "risk_management_agent": {
+                    "AAPL": {"remaining_position_limit": 1000.0, "current_price": 150.0},
+                    "MSFT": {"remaining_position_limit": 0.0, "current_price": 400.0},
+                    "TSLA": {"remaining_position_limit": 0.0, "current_price": 250.0},
+                },
+            },
+        },
+    }
+    decision = PortfolioManagerOutput(decisions=[PortfolioDecision(ticker="AAPL", action="buy", quantity=5, reasoning="consensus")])
+
+    with (
+        patch("alpacalyzer.trading.portfolio_manager.generate_trading_decision", return_value=decision) as decide,
+        patch("alpacalyzer.trading.portfolio_manager.progress"),
+    ):
+        portfolio_management_agent(state)
+
+    assert list(decide.call_args.kwargs["max_shares"]) == ["AAPL", "MSFT"]
+    decisions = state["data"]["analyst_signals"]["portfolio_management_agent"]
+    assert decisions["AAPL"]["action"] == "buy"
+    assert decisions["TSLA"]["action"] == "hold"
+    assert decisions["TSLA"]["quantity"] == 0
+
+
+def test_no_llm_call_when_nothing_is_actionable():
+    state = {
+        "messages": [],
+        "metadata": {"show_reasoning": False},
+        "data": {
+            "portfolio": {"cash": 0.0},
+            "tickers": ["TSLA"],
+            "analyst_signals": {"risk_management_agent": {"TSLA": {"remaining_position_limit": 0.0, "current_price": 250.0}}},
+        },
+    }
+
+    with (
+        patch("alpacalyzer.trading.portfolio_manager.generate_trading_decision") as decide,
+        patch("alpacalyzer.trading.portfolio_manager.progress"),
+    ):
+        portfolio_management_agent(state)
+
+    decide.assert_not_called()
+    assert state["data"]["analyst_signals"]["portfolio_management_agent"]["TSLA"]["action"] == "hold"
+
+
+def test_trading_decision_prompt_uses_compact_json():
+    client = MagicMock()
+
+    with patch("alpacalyzer.llm.get_llm_client", return_value=client):
+        generate_trading_decision(
+            signals_by_ticker={"AAPL": {"sentiment_agent": {"signal": "bullish", "confidence": 70}}},
+            current_prices={"AAPL": 150.0},
+            max_shares={"AAPL": 1200},
+            portfolio={"cash": 1000.0, "positions": {"AAPL": {"long": 5}}},
+        )
+
+    prompt = client.complete_structured.call_args.args[0][1]["content"]
+    assert '{"AAPL":{"sentiment_agent":{"confidence":70,"signal":"bullish"}}}' in prompt
+    assert '{"AAPL":"$150.00"}' in prompt
+    assert '{"AAPL":"1,200 shares"}' in prompt
+    assert 'Current Positions: {"AAPL":{"long":5}}' in prompt
+
+
+def test_trading_decision_system_prompt_is_stable_across_calls():
+    client = MagicMock()
+
+    with patch("alpacalyzer.llm.get_llm_client", return_value=client):
+        for price in (150.0, 151.0):
+            generate_trading_decision(
+                signals_by_ticker={"AAPL": {"sentiment_agent": {"signal": "bullish", "confidence": 70}}},
+                current_prices={"AAPL": price},
+                max_shares={"AAPL": 5},
+                portfolio={"cash": 1000.0},
+            )
+
+    first, second = (call.args[0] for call in client.complete_structured.call_args_list)
+    assert first[0] == second[0]
+    assert first[0]["content"].endswith("  ]\n}")
+    assert "Output strictly in JSON" not in first[1]["content"]
+    assert first[1]["content"] != second[1]["content"]
+
+
+def test_trading_decision_prompt_independent_of_ticker_order():
+    client = MagicMock()
+    client.complete_structured.return_value = None  # failed calls are not cached
+    signals = {
+        "MSFT": {"sentiment_agent": {"signal": "bearish", "confidence": 55}},
+        "AAPL": {"technical_analyst_agent": {"signal": "bullish", "confidence": 70}, "sentiment_agent": {"signal": "neutral", "confidence": 50}},
+    }
+    prices = {"MSFT": 400.0, "AAPL": 150.0}
+
+    with patch("alpacalyzer.llm.get_llm_client", return_value=client):
+        generate_trading_decision(signals, prices, {"MSFT": 2, "AAPL": 6}, {"cash": 1000.0})
+        generate_trading_decision(
+            {ticker: dict(reversed(agents.items())) for ticker, agents in reversed(signals.items())},
+            dict(reversed(prices.items())),
+            {"AAPL": 6, "MSFT": 2},
+            {"cash": 1000.0},
+        )
+
+    first, second = (call.args[0][1]["content"] for call in client.complete_structured.call_args_list)
+    assert first == second
+    assert '{"AAPL":"$150.00","MSFT":"$400.00"}' in first
+
+
+def test_identical_inputs_reuse_decision():
+    client = MagicMock()
+    client.complete_structured.return_value = PortfolioManagerOutput(decisions=[PortfolioDecision(ticker="AAPL", action="buy", quantity=5, confidence=80.0, reasoning="consensus")])
+    args = ({"AAPL": {"sentiment_agent": {"signal": "bullish", "confidence": 70}}}, {"AAPL": 150.0}, {"AAPL": 6})
+
+    with patch("alpacalyzer.llm.get_llm_client", return_value=client):
+        first = generate_trading_decision(*args, portfolio={"cash": 1000.0})
+        first.decisions.clear()
+        second = generate_trading_decision(*args, portfolio={"cash": 1000.0})
+        generate_trading_decision(*args, portfolio={"cash": 250.0})
+
+    assert [d.ticker for d in second.decisions] == ["AAPL"]
+    assert client.complete_structured.call_count == 2
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from alpacalyzer.prompts import load_prompt
@@ -35,3 +37,12 @@ def test_all_prompts_loadable():
     for name in prompt_files:
         prompt = load_prompt(name)
         assert len(prompt) > 0, f"Prompt {name} is empty"
+
+
+def test_load_prompt_reads_each_file_once():
+    """Repeated loads return the cached string without touching the package files."""
+    load_prompt.cache_clear()
+    first = load_prompt("portfolio_manager")
+
+    with patch("alpacalyzer.prompts.files", side_effect=AssertionError("prompt re-read")):
+        assert load_prompt("portfolio_manager") is first
@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 import pandas as pd
 
+from alpacalyzer.analysis.technical_analysis import IndicatorBit
 from alpacalyzer.data.models import TopTicker, TopTickersResponse
 from alpacalyzer.pipeline.registry import ScannerRegistry, _register_scanner_adapters
 from alpacalyzer.scanners.adapters import RedditScannerAdapter, SocialScannerAdapter
@@ -292,6 +293,28 @@ class TestSocialScannerAdapter:
 
             assert result.count == 0
 
+    def test_prefilter_masks_rows(self):
+        def signals(momentum, score=0.5, breakout=False):
+            return {"momentum": momentum, "score": score, "signals": ["TA: Breakout"] if breakout else []}
+
+        df = pd.DataFrame(
+            {
+                "ticker": ["KEEP", "NOSIG", "WEAK", "SENT", "CALMFAIL", "BREAK"],
+                "trading_signals": [signals(1.0, 0.9), None, signals(-4.0, 0.9), signals(-1.0, 0.9), signals(1.0), signals(1.0, breakout=True)],
+                "sentiment_rank": [1, 1, 1, 25, 1, 1],
+            }
+        )
+
+        assert SocialScannerAdapter._prefilter(df, vix=20.0)["ticker"].tolist() == ["KEEP", "BREAK"]
+        assert SocialScannerAdapter._prefilter(df, vix=12.0)["ticker"].tolist() == ["KEEP", "CALMFAIL", "BREAK"]
+
+    def test_prefilter_reads_breakout_from_mask(self):
+        masked = {"momentum": 1.0, "score": 0.5, "signals": [], "signals_mask": int(IndicatorBit.BREAKOUT)}
+        unmasked_text = {"momentum": 1.0, "score": 0.5, "signals": ["TA: Breakout"], "signals_mask": 0}
+        df = pd.DataFrame({"ticker": ["MASK", "TEXT"], "trading_signals": [masked, unmasked_text], "sentiment_rank": [1, 1]})
+
+        assert SocialScannerAdapter._prefilter(df, vix=20.0)["ticker"].tolist() == ["MASK"]
+
 
 class TestScannerRegistryAutoRegistration:
     def setup_method(self):
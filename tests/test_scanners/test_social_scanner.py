@@ -0,0 +1,70 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pandas as pd
+
+from alpacalyzer.scanners.social_scanner import SocialScanner
+
+
+class TestSocialScannerRankStocks:
+    def _scanner(self, tickers: list[str]) -> SocialScanner:
+        scanner = SocialScanner()
+        ranks = pd.DataFrame({"ticker": tickers, "rank": range(1, len(tickers) + 1), "score": [0.5] * len(tickers)})
+        scanner.stocktwits_scanner = MagicMock(get_stock_ranks=MagicMock(return_value=ranks))
+        scanner.finviz_scanner = MagicMock(get_stock_ranks=MagicMock(return_value=pd.DataFrame()))
+        return scanner
+
+    def test_technical_analysis_runs_concurrently(self):
+        tickers = ["AAPL", "MSFT", "NVDA", "TSLA"]
+        scanner = self._scanner(tickers)
+        barrier = threading.Barrier(len(tickers), timeout=5)
+
+        def analyze_stock(ticker):
+            barrier.wait()  # only passes if every ticker is in flight at once
+            return {"symbol": ticker, "score": 0.9 if ticker == "NVDA" else 0.1}
+
+        scanner.technical_analyzer = MagicMock(analyze_stock=analyze_stock)
+
+        df = scanner.rank_stocks(tickers, limit=20)
+
+        assert set(df["ticker"]) == set(tickers)
+        assert df.loc[df["ticker"] == "NVDA", "ta_rank"].item() == 1
+
+    def test_failed_analysis_is_dropped(self):
+        tickers = ["AAPL", "MSFT"]
+        scanner = self._scanner(tickers)
+
+        def analyze_stock(ticker):
+            time.sleep(0.01 if ticker == "AAPL" else 0)
+            return {"symbol": ticker, "score": 0.5} if ticker == "AAPL" else None
+
+        scanner.technical_analyzer = MagicMock(analyze_stock=analyze_stock)
+
+        df = scanner.rank_stocks(tickers, limit=20)
+
+        assert df.loc[df["ticker"] == "AAPL", "ta_rank"].item() == 1
+        assert pd.isna(df.loc[df["ticker"] == "MSFT", "ta_rank"].item())
+
+    def test_rank_sources_fetched_concurrently(self):
+        tickers = ["AAPL", "MSFT"]
+        scanner = self._scanner(tickers)
+        barrier = threading.Barrier(2, timeout=5)
+        st_ranks = scanner.stocktwits_scanner.get_stock_ranks.return_value
+
+        def get_st_ranks(df):
+            barrier.wait()  # only passes if Finviz is being ranked at the same time
+            return st_ranks
+
+        def get_finviz_ranks(df):
+            barrier.wait()
+            raise RuntimeError("finviz down")
+
+        scanner.stocktwits_scanner.get_stock_ranks = MagicMock(side_effect=get_st_ranks)
+        scanner.finviz_scanner.get_stock_ranks = MagicMock(side_effect=get_finviz_ranks)
+        scanner.technical_analyzer = MagicMock(analyze_stock=lambda ticker: {"symbol": ticker, "score": 0.5})
+
+        df = scanner.rank_stocks(tickers, limit=20)
+
+        assert set(df["ticker"]) == set(tickers)
+        assert "finviz_rank" not in df.columns
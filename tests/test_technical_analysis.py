@@ -1,10 +1,15 @@
+import functools
+import operator
 from datetime import datetime
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
 # Import after patching and reloading; disable E402 for this import line
-from alpacalyzer.analysis.technical_analysis import TechnicalAnalyzer
+from alpaca.trading.enums import OrderSide
+
+from alpacalyzer.analysis.technical_analysis import _SIGNAL_BITS, _WEAK_SIGNALS, IndicatorBit, TechnicalAnalyzer, signal_bits, signals_to_mask
 
 
 @pytest.fixture
@@ -112,6 +117,35 @@ def test_calculate_technical_analysis_score_short_side(analyzer, daily_df, intra
     assert result_short["score"] > result_long["score"]
     assert any("Price below both MAs" in s for s in result_short["signals"])
     assert any("Overbought RSI" in s for s in result_short["signals"])
+    assert result_short["signals_mask"] == signals_to_mask(result_short["signals"])
+    assert result_short["signals_mask"] & IndicatorBit.PRICE_BELOW_MAS
+    assert result_short["signals_mask"] & IndicatorBit.OVERBOUGHT_RSI
+
+
+def test_weak_technicals_mask_matches_string_scan(analyzer):
+    signals = ["TA: Price above both MAs (110 > 97 & 95)", "TA: Overbought RSI (75.0) > 70", "TA: Price above VWAP (110 > 108.00)"]
+    mask = signals_to_mask(signals)
+
+    assert mask == IndicatorBit.PRICE_ABOVE_MAS | IndicatorBit.OVERBOUGHT_RSI | IndicatorBit.PRICE_ABOVE_VWAP
+    assert analyzer.weak_technicals(signals, OrderSide.BUY) == "Unfavorable technicals: TA: Overbought RSI (75.0) > 70"
+    assert analyzer.weak_technicals(signals, OrderSide.BUY, mask) == analyzer.weak_technicals(signals, OrderSide.BUY)
+    assert analyzer.weak_technicals(signals, OrderSide.SELL, mask) == analyzer.weak_technicals(signals, OrderSide.SELL)
+    assert analyzer.weak_technicals(signals[:1], OrderSide.BUY, signals_to_mask(signals[:1])) is None
+
+
+@pytest.mark.parametrize("side", [OrderSide.BUY, OrderSide.SELL])
+def test_weak_technicals_keys_match_signal_bits(analyzer, side):
+    signals = [f"TA: {key} (1.0)" for key, _ in _SIGNAL_BITS]
+    expected = [signal for signal in signals if signal_bits(signal) & _WEAK_SIGNALS[side]]
+
+    assert analyzer.weak_technicals(signals, side) == f"Unfavorable technicals: {', '.join(expected)}"
+
+
+def test_signals_to_mask_finds_every_key_in_one_scan():
+    signals = [f"TA: {key} (1.0)" for key, _ in _SIGNAL_BITS] + ["ATR 2.5%"]
+
+    assert signals_to_mask(signals) == functools.reduce(operator.or_, (bit for _, bit in _SIGNAL_BITS))
+    assert [signal_bits(signal) for signal in signals] == [bit for _, bit in _SIGNAL_BITS] + [IndicatorBit.NONE]
 
 
 def test_calculate_short_candidate_score(analyzer, daily_df, intraday_df):
@@ -178,3 +212,50 @@ def test_trade_count_confirmation_signal(analyzer):
 
     assert result is not None
     assert any("trade count" in s.lower() for s in result["signals"]), f"Expected trade count signal, got: {result['signals']}"
+
+
+def test_analyze_stock_shared_across_instances():
+    TechnicalAnalyzer._analyze_stock_cached.cache_clear()
+    try:
+        with patch.object(TechnicalAnalyzer, "_analyze_stock", return_value={"symbol": "AAPL"}) as mock_analyze:
+            first = TechnicalAnalyzer().analyze_stock("AAPL")
+            second = TechnicalAnalyzer().analyze_stock("AAPL")
+            TechnicalAnalyzer().analyze_stock("MSFT")
+
+        assert first is second
+        assert [c.args[-1] for c in mock_analyze.call_args_list] == ["AAPL", "MSFT"]
+    finally:
+        TechnicalAnalyzer._analyze_stock_cached.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("vix", "rel_vol", "atr_pct", "expected"),
+    [
+        (40.0, 3.0, 0.05, 0.65),
+        (40.0, 1.0, 0.05, 0.75),
+        (32.0, 2.0, 0.09, 0.55),
+        (30.0, 2.0, 0.20, 0.6),
+        (25.0, 1.5, 0.11, 0.45),
+        (20.0, 1.0, 0.05, 0.5),
+        (15.0, 5.0, 0.01, 0.35),
+    ],
+)
+def test_calculate_ta_threshold_scalar_and_array(analyzer, vix, rel_vol, atr_pct, expected):
+    assert analyzer.calculate_ta_threshold(vix, rel_vol, atr_pct) == expected
+    assert analyzer.calculate_ta_threshold(vix, [rel_vol, 0.0], [atr_pct, 1.0])[0] == expected
+
+
+def test_calculate_ta_threshold_broadcasts_vix(analyzer):
+    thresholds = analyzer.calculate_ta_threshold([40.0, 32.0, 25.0, 15.0], 5.0, 0.01)
+    assert thresholds.tolist() == [0.65, 0.55, 0.45, 0.35]
+
+
+def test_prefetch_bars_batches_both_timeframes(analyzer):
+    with (
+        patch("alpacalyzer.analysis.technical_analysis.get_market_status", return_value="open") as market_status,
+        patch("alpacalyzer.analysis.technical_analysis.prefetch_stock_bars") as prefetch,
+    ):
+        analyzer.prefetch_bars(["AAPL", "MSFT"])
+
+    market_status.assert_called_once()
+    assert [c.args for c in prefetch.call_args_list] == [(["AAPL", "MSFT"], "minute", "open"), (["AAPL", "MSFT"], "day", "open")]
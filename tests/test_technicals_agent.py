@@ -26,9 +26,11 @@ def mock_prices_df():
     return pd.DataFrame(data)
 
 
+@patch("alpacalyzer.agents.technicals_agent.get_market_status", return_value="open")
+@patch("alpacalyzer.agents.technicals_agent.prefetch_stock_bars")
 @patch("alpacalyzer.agents.technicals_agent.get_stock_bars")
 @patch("alpacalyzer.agents.technicals_agent.progress.update_status")
-def test_technical_analyst_agent(mock_update_status, mock_get_stock_bars, mock_state, mock_prices_df):
+def test_technical_analyst_agent(mock_update_status, mock_get_stock_bars, mock_prefetch_stock_bars, mock_get_market_status, mock_state, mock_prices_df):
     mock_get_stock_bars.return_value = mock_prices_df
 
     result = technical_analyst_agent(mock_state)
@@ -37,6 +39,9 @@ def test_technical_analyst_agent(mock_update_status, mock_get_stock_bars, mock_s
     assert "data" in result
     assert "technical_analyst_agent" in result["data"]["analyst_signals"]
     assert len(result["data"]["analyst_signals"]["technical_analyst_agent"]) == 2  # Two tickers
+    mock_get_market_status.assert_called_once()
+    assert all(c.kwargs["market_status"] == "open" for c in mock_get_stock_bars.call_args_list)
+    mock_prefetch_stock_bars.assert_called_once_with(["AAPL", "MSFT"], "day", "open")
 
 
 def test_calculate_trend_signals(mock_prices_df):
@@ -99,3 +104,16 @@ def test_normalize_pandas():
     result = normalize_pandas(df)
     assert isinstance(result, list)
     assert result == [{"a": 1, "b": 3}, {"a": 2, "b": 4}]
+
+
+@patch("alpacalyzer.agents.technicals_agent.get_market_status", side_effect=RuntimeError("clock down"))
+@patch("alpacalyzer.agents.technicals_agent.prefetch_stock_bars")
+@patch("alpacalyzer.agents.technicals_agent.get_stock_bars", return_value=None)
+@patch("alpacalyzer.agents.technicals_agent.progress.update_status")
+@patch("alpacalyzer.agents.technicals_agent.logger")
+def test_market_status_failure_is_logged(mock_logger, mock_update_status, mock_get_stock_bars, mock_prefetch_stock_bars, mock_get_market_status, mock_state):
+    technical_analyst_agent(mock_state)
+
+    mock_prefetch_stock_bars.assert_not_called()
+    assert all(c.kwargs["market_status"] is None for c in mock_get_stock_bars.call_args_list)
+    assert mock_logger.warning.call_args.kwargs["exc_info"] is True